@@ -0,0 +1,76 @@
+"""
+Compare loading months of collection stats from pickled snapshots (the
+previous approach) against the columnar history store.
+
+Usage:
+    python -m benchmarks.bench_history [days] [snapshots_per_day]
+"""
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+from tensortradepy.history import HistoryReader, HistoryRecorder, stats_row
+
+from .fake_servers import FakeTensorServer
+
+
+DAY = 86_400
+
+
+def snapshots(days, per_day, start):
+    fake = FakeTensorServer()
+    step = DAY / per_day
+    for index in range(days * per_day):
+        data = fake.collection("theheist")
+        data["statsV2"]["numListed"] = random.randint(100, 500)
+        yield start + index * step, data
+
+
+def main(days=90, per_day=1_440):
+    start = time.time() - days * DAY
+    with tempfile.TemporaryDirectory() as root:
+        recorder = HistoryRecorder(os.path.join(root, "history"))
+        pickled = []
+        rows = []
+        for timestamp, data in snapshots(days, per_day, start):
+            pickled.append((timestamp, data))
+            rows.append(stats_row(data, timestamp))
+        recorder.append("theheist", rows)
+        pickle_path = os.path.join(root, "history.pickle")
+        with open(pickle_path, "wb") as f:
+            pickle.dump(pickled, f)
+
+        print("%d snapshots over %d days" % (len(rows), days))
+        begin = time.perf_counter()
+        with open(pickle_path, "rb") as f:
+            loaded = pickle.load(f)
+        floors = [
+            int(data["statsV2"]["buyNowPrice"]) for _, data in loaded
+        ]
+        print("pickle    %8.1f ms  %8.1f MB" % (
+            (time.perf_counter() - begin) * 1e3,
+            os.path.getsize(pickle_path) / 1e6
+        ))
+        reader = HistoryReader(os.path.join(root, "history"))
+        begin = time.perf_counter()
+        history = reader.load("theheist", start)
+        print("columnar  %8.1f ms  %8.1f MB" % (
+            (time.perf_counter() - begin) * 1e3,
+            directory_size(os.path.join(root, "history")) / 1e6
+        ))
+        assert history["buyNowPrice"].tolist() == floors
+
+
+def directory_size(path):
+    return sum(
+        os.path.getsize(os.path.join(directory, name))
+        for directory, _, names in os.walk(path)
+        for name in names
+    )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
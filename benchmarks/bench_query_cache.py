@@ -0,0 +1,57 @@
+"""
+Compare the per-call cost of building a GraphQL request body from scratch
+(`build_tensor_query` + `json.dumps`) against the compiled query registry
+(`compile_tensor_query` + `CompiledQuery.encode`).
+
+Usage:
+    python -m benchmarks.bench_query_cache [iterations]
+"""
+import json
+import sys
+import timeit
+
+from tensortradepy.helpers import (
+    build_tensor_query,
+    compile_tensor_query,
+)
+
+
+PARAMETERS = [
+    ("mint", "String"),
+    ("owner", "String"),
+    ("price", "Decimal"),
+]
+
+VARIABLES = {
+    "mint": "6fMaCqEYzwSX5nkUTJ7TwpbkAaUFkSs5Dz5rDSsXyDpw",
+    "owner": "5Cd8ZRmqhiXzoB3sX1UUpwKqWcBa7GxCqD6bsXm6JLU4",
+    "price": "1250000000",
+}
+
+
+def build_body():
+    query = build_tensor_query("TswapListNftTx", "tswapListNftTx", PARAMETERS)
+    return json.dumps({
+        "query": query,
+        "variables": VARIABLES
+    }).encode("utf-8")
+
+
+def compiled_body():
+    query = compile_tensor_query(
+        "TswapListNftTx",
+        "tswapListNftTx",
+        PARAMETERS
+    )
+    return query.encode(VARIABLES)
+
+
+def main(iterations=100_000):
+    assert json.loads(build_body()) == json.loads(compiled_body())
+    for label, func in [("build", build_body), ("compiled", compiled_body)]:
+        best = min(timeit.repeat(func, number=iterations, repeat=5))
+        print("%-10s %8.3f us/call" % (label, best / iterations * 1e6))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
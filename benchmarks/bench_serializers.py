@@ -0,0 +1,63 @@
+"""
+Compare the JSON serializers on the GraphQL traffic: encoding a request
+body and decoding a transaction response (the transaction being a JSON list
+of byte values), then extracting its transaction.
+
+Usage:
+    python -m benchmarks.bench_serializers [iterations]
+"""
+import sys
+import timeit
+
+from tensortradepy.helpers import collection_infos_query
+from tensortradepy.serializers import serializers
+from tensortradepy.solana import transaction_bytes
+
+from .bench_transactions import api_transaction
+
+
+RESPONSE = {
+    "data": {
+        "tcompListTx": {
+            "txs": [{
+                "lastValidBlockHeight": 250_000_000,
+                "tx": {"type": "Buffer", "data": list(api_transaction())},
+                "txV0": None,
+            }],
+        },
+    },
+}
+
+
+def extract_transaction(serializer, body):
+    item = serializer.loads(body)["data"]["tcompListTx"]["txs"][0]
+    return transaction_bytes(item["tx"]["data"]), item["lastValidBlockHeight"]
+
+
+def main(iterations=20_000):
+    body = serializers["json"]().dumps(RESPONSE)
+    print("response size: %d bytes" % len(body))
+    for name, serializer_class in serializers.items():
+        try:
+            serializer = serializer_class()
+        except ImportError:
+            print("%-8s not installed" % name)
+            continue
+        timings = []
+        for func in [
+            lambda: collection_infos_query.encode(
+                {"slug": "theheist"},
+                serializer
+            ),
+            lambda: extract_transaction(serializer, body),
+        ]:
+            best = min(timeit.repeat(func, number=iterations, repeat=5))
+            timings.append(best / iterations * 1e6)
+        print("%-8s encode %6.2f us  decode+extract %7.2f us" % (
+            name,
+            *timings
+        ))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,65 @@
+"""
+Compare the signing throughput of threads signing in-process (the default)
+against the `ProcessPoolSigner`, one transaction at a time and in batches.
+
+Usage:
+    python -m benchmarks.bench_signing [transactions] [threads]
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tensortradepy.signer import LocalSigner, ProcessPoolSigner
+
+from .bench_transactions import BLOCKHASH, KEYPAIR, api_transaction
+
+
+def threaded(signer, transactions, threads):
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(executor.map(
+            lambda transaction: signer.sign(KEYPAIR, transaction, BLOCKHASH),
+            transactions
+        ))
+
+
+def measure(label, func, count):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print("%-22s %10.0f tx/s" % (label, count / elapsed))
+
+
+def main(count=20_000, threads=8):
+    transactions = [api_transaction() for _ in range(count)]
+    local = LocalSigner()
+    print("%d transactions, %d threads, %d CPUs" % (
+        count,
+        threads,
+        os.cpu_count()
+    ))
+    measure(
+        "local threads",
+        lambda: threaded(local, transactions, threads),
+        count
+    )
+    with ProcessPoolSigner([KEYPAIR]) as signer:
+        # Start the workers before measuring.
+        signer.sign_many(KEYPAIR, transactions[:100], BLOCKHASH)
+        measure(
+            "process pool threads",
+            lambda: threaded(signer, transactions, threads),
+            count
+        )
+        measure(
+            "process pool batches",
+            lambda: signer.sign_many(KEYPAIR, transactions, BLOCKHASH),
+            count
+        )
+        assert signer.sign_many(KEYPAIR, transactions[:10], BLOCKHASH) == (
+            local.sign_many(KEYPAIR, transactions[:10], BLOCKHASH)
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,112 @@
+"""
+Compare the cost of decoding and signing a transaction returned by the
+Tensor Trade API through the legacy `solana.transaction.Transaction` (the
+previous path) against the direct `solders` path, from the JSON buffer (list
+of bytes) and from a base64 string.
+
+Usage:
+    python -m benchmarks.bench_transactions [iterations]
+"""
+import base64
+import sys
+import timeit
+import tracemalloc
+
+from solana.transaction import Transaction as LegacyTransaction
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.system_program import TransferParams, transfer
+from solders.transaction import Transaction
+
+from tensortradepy.solana import deserialize_transaction, sign_transaction
+
+
+KEYPAIR = Keypair()
+BLOCKHASH = Hash.new_unique()
+
+
+def api_transaction(instructions=6):
+    """
+    Build an unsigned transaction of the size of a Tensor Trade one.
+    """
+    payer = KEYPAIR.pubkey()
+    message = Message.new_with_blockhash(
+        [
+            transfer(TransferParams(
+                from_pubkey=payer,
+                to_pubkey=Pubkey.new_unique(),
+                lamports=1
+            ))
+            for _ in range(instructions)
+        ],
+        payer,
+        Hash.default()
+    )
+    return bytes(Transaction.new_unsigned(message))
+
+
+RAW = api_transaction()
+JSON_BUFFER = list(RAW)
+BASE64 = base64.b64encode(RAW).decode("ascii")
+
+
+def legacy():
+    transaction = LegacyTransaction.deserialize(bytes(JSON_BUFFER))
+    transaction.recent_blockhash = BLOCKHASH
+    transaction.sign(KEYPAIR)
+    return transaction.serialize()
+
+
+def solders_buffer():
+    return sign_transaction(
+        KEYPAIR,
+        deserialize_transaction(JSON_BUFFER),
+        BLOCKHASH
+    )
+
+
+def solders_base64():
+    return sign_transaction(
+        KEYPAIR,
+        deserialize_transaction(BASE64),
+        BLOCKHASH
+    )
+
+
+def peak_allocation(func, iterations=1_000):
+    """
+    Return the largest memory allocated while running one call.
+    """
+    func()
+    tracemalloc.start()
+    peak = 0
+    for _ in range(iterations):
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func()
+        _, call_peak = tracemalloc.get_traced_memory()
+        peak = max(peak, call_peak - start)
+    tracemalloc.stop()
+    return peak
+
+
+def main(iterations=20_000):
+    assert legacy() == solders_buffer() == solders_base64()
+    print("transaction size: %d bytes" % len(RAW))
+    for label, func in [
+        ("legacy", legacy),
+        ("solders", solders_buffer),
+        ("solders b64", solders_base64),
+    ]:
+        best = min(timeit.repeat(func, number=iterations, repeat=5))
+        print("%-12s %8.2f us/tx  %6d bytes allocated/tx" % (
+            label,
+            best / iterations * 1e6,
+            peak_allocation(func)
+        ))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
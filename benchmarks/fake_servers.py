@@ -0,0 +1,349 @@
+"""
+Local stand-ins for the Tensor Trade GraphQL API and a Solana RPC node.
+
+Both servers run in a background thread and can simulate latency, random
+server errors and throttling, so the client can be measured offline.
+"""
+import base64
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from solders.hash import Hash
+from solders.message import Message
+from solders.pubkey import Pubkey
+from solders.system_program import TransferParams, transfer
+from solders.transaction import Transaction
+
+
+class FakeServer:
+    """
+    Base class of the fake servers.
+
+    Arguments:
+        latency (float): Seconds added to every response.
+        error_rate (float): Share of the requests answered with a 500 error.
+        throttle (float): Maximum number of requests per second. The next
+            requests are answered with a 429 error. None to disable.
+    """
+
+    def __init__(self, latency=0.0, error_rate=0.0, throttle=None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle = throttle
+        self.requests = 0
+        self.connections = 0
+        self.errors = 0
+        self.throttled = 0
+        self.lock = threading.Lock()
+        self.window_start = time.monotonic()
+        self.window_count = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self.handler())
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address
+        return "http://%s:%d/" % (host, port)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def start(self):
+        # A short poll interval makes `stop` quick.
+        self.thread = threading.Thread(
+            target=self.server.serve_forever,
+            args=(0.05,),
+            daemon=True
+        )
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def is_throttled(self):
+        if self.throttle is None:
+            return False
+        with self.lock:
+            now = time.monotonic()
+            if now - self.window_start >= 1.0:
+                self.window_start = now
+                self.window_count = 0
+            self.window_count += 1
+            return self.window_count > self.throttle
+
+    def handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Send headers and body in one segment, otherwise delayed ACKs
+            # add ~40ms to every keep-alive request.
+            disable_nagle_algorithm = True
+            wbufsize = -1
+
+            def log_message(self, *args):
+                pass
+
+            def setup(self):
+                super().setup()
+                with server.lock:
+                    server.connections += 1
+
+            def do_HEAD(self):
+                if server.latency:
+                    time.sleep(server.latency)
+                self.reply(200, b"")
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length))
+                with server.lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                if server.is_throttled():
+                    with server.lock:
+                        server.throttled += 1
+                    return self.reply(429, b"", {"Retry-After": "1"})
+                if random.random() < server.error_rate:
+                    with server.lock:
+                        server.errors += 1
+                    return self.reply(500, b"")
+                body = json.dumps(server.respond(payload)).encode("utf-8")
+                self.reply(200, body)
+
+            def reply(self, status, body, headers=None):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def respond(self, payload):
+        raise NotImplementedError
+
+
+class FakeTensorServer(FakeServer):
+    """
+    Fake Tensor Trade GraphQL API. Collection queries return generated
+    stats and transaction queries return an unsigned transfer transaction
+    paid by the wallet given in the variables, or by `wallet` for the
+    queries without wallet (bid edits and cancellations).
+
+    The slugs added to `unknown_slugs` are answered like the API answers
+    unknown collections: a null result and an entry in `errors`.
+    """
+
+    # The buyer pays the buy transactions, the owner the other ones.
+    wallet_variables = ("buyer", "owner")
+
+    def __init__(
+        self,
+        latency=0.0,
+        error_rate=0.0,
+        throttle=None,
+        wallet=None,
+        listings=250
+    ):
+        super().__init__(latency, error_rate, throttle)
+        self.wallet = wallet
+        self.listing_count = listings
+        self.transactions = {}
+        self.listings = {}
+        self.unknown_slugs = set()
+
+    def respond(self, payload):
+        query = payload["query"]
+        variables = payload.get("variables") or {}
+        if "instrumentTV2" in query:
+            data = self.collections(query, variables)
+            errors = [
+                {"message": "Collection not found", "path": [alias]}
+                for (alias, value) in data.items() if value is None
+            ]
+            if errors:
+                return {"data": data, "errors": errors}
+            return {"data": data}
+        if "activeListingsV2" in query:
+            listings = self.listings_page(variables)
+            return {"data": {"activeListingsV2": listings}}
+        if "tcompBids" in query:
+            return {"data": {"tcompBids": self.bids(variables["slug"])}}
+        name = re.search(r"\{\s*(\w+)\(", query).group(1)
+        response = self.transaction_response(variables)
+        if name == "tswapInitPoolTx":
+            response["pool"] = str(Pubkey.new_unique())
+        return {"data": {name: response}}
+
+    def collections(self, query, variables):
+        if "slug0" not in variables:
+            return {"instrumentTV2": self.collection(variables["slug"])}
+        return {
+            "c%s" % key[len("slug"):]: self.collection(slug)
+            for (key, slug) in variables.items()
+        }
+
+    def collection(self, slug):
+        if slug in self.unknown_slugs:
+            return None
+        price = random.randint(1, 100) * 10_000_000
+        return {
+            "id": "id-%s" % slug,
+            "slug": slug,
+            "firstListDate": 1_690_000_000_000,
+            "name": slug.title(),
+            "statsV2": {
+                "currency": None,
+                "buyNowPrice": str(price),
+                "buyNowPriceNetFees": str(price),
+                "sellNowPrice": str(price - 5_000_000),
+                "sellNowPriceNetFees": str(price - 5_000_000),
+                "numListed": random.randint(1, 1000),
+                "numMints": 10_000,
+            },
+        }
+
+    def collection_listings(self, slug):
+        listings = self.listings.get(slug)
+        if listings is None:
+            listings = sorted(
+                (
+                    {
+                        "mint": {"onchainId": str(Pubkey.new_unique())},
+                        "tx": {
+                            "sellerId": str(Pubkey.new_unique()),
+                            "grossAmount": str(
+                                random.randint(1, 1000) * 10_000_000
+                            ),
+                            "grossAmountUnit": "SOL_LAMPORT",
+                        },
+                    }
+                    for _ in range(self.listing_count)
+                ),
+                key=lambda listing: int(listing["tx"]["grossAmount"])
+            )
+            self.listings[slug] = listings
+        return listings
+
+    def listings_page(self, variables):
+        listings = self.collection_listings(variables["slug"])
+        start = int((variables.get("cursor") or {}).get("str") or 0)
+        end = start + (variables.get("limit") or 100)
+        return {
+            "page": {
+                "endCursor": {"str": str(end)},
+                "hasMore": end < len(listings),
+            },
+            "txs": listings[start:end],
+        }
+
+    def bids(self, slug):
+        return [
+            {
+                "address": str(Pubkey.new_unique()),
+                "amount": str(price * 10_000_000),
+                "filledQuantity": 0,
+                "ownerAddress": self.wallet or str(Pubkey.new_unique()),
+                "quantity": 1,
+                "target": "WHITELIST",
+                "targetId": "id-%s" % slug,
+            }
+            for price in range(1, 6)
+        ]
+
+    def transaction_response(self, variables):
+        wallet = next(
+            (
+                variables[name] for name in self.wallet_variables
+                if name in variables
+            ),
+            self.wallet
+        )
+        return {
+            "txs": [{
+                "lastValidBlockHeight": 1_000_000,
+                "tx": {"type": "Buffer", "data": self.transaction(wallet)},
+                "txV0": None,
+            }]
+        }
+
+    def transaction(self, wallet):
+        data = self.transactions.get(wallet)
+        if data is None:
+            payer = Pubkey.from_string(wallet)
+            instruction = transfer(TransferParams(
+                from_pubkey=payer,
+                to_pubkey=payer,
+                lamports=1
+            ))
+            message = Message.new_with_blockhash(
+                [instruction],
+                payer,
+                Hash.default()
+            )
+            data = list(bytes(Transaction.new_unsigned(message)))
+            self.transactions[wallet] = data
+        return data
+
+
+class FakeSolanaRPC(FakeServer):
+    """
+    Fake Solana JSON-RPC node. Transactions are accepted without being
+    executed and reported as confirmed.
+    """
+
+    block_height = 1_000
+
+    def respond(self, payload):
+        method = payload["method"]
+        params = payload.get("params") or []
+        result = getattr(self, method)(*params)
+        return {"jsonrpc": "2.0", "result": result, "id": payload.get("id")}
+
+    def context(self, value):
+        return {"context": {"slot": self.block_height}, "value": value}
+
+    def getLatestBlockhash(self, *args):
+        return self.context({
+            "blockhash": str(Hash.new_unique()),
+            "lastValidBlockHeight": self.block_height + 150,
+        })
+
+    def getBlockHeight(self, *args):
+        return self.block_height
+
+    def getSlot(self, *args):
+        return self.block_height
+
+    def getHealth(self, *args):
+        return "ok"
+
+    def sendTransaction(self, transaction, *args):
+        raw = base64.b64decode(transaction)
+        return str(Transaction.from_bytes(raw).signatures[0])
+
+    def getSignatureStatuses(self, signatures, *args):
+        return self.context([
+            {
+                "slot": self.block_height,
+                "confirmations": None,
+                "err": None,
+                "status": {"Ok": None},
+                "confirmationStatus": "confirmed",
+            }
+            for _ in signatures
+        ])
@@ -0,0 +1,207 @@
+"""
+Offline benchmark of the client against the fake Tensor API and Solana RPC.
+
+Usage:
+    python -m benchmarks.run [--latency 0.02] [--error-rate 0] [--throttle N]
+                             [--iterations 200] [--bulk-size 200]
+                             [--output benchmarks/results.json]
+
+Each scenario reports its throughput (requests/sec), p50/p99 latency and
+peak traced memory. Results are written as JSON, so runs of different
+releases can be compared.
+"""
+import argparse
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from importlib import metadata
+
+from solders.keypair import Keypair
+
+from tensortradepy import TensorClient
+from tensortradepy.ratelimit import RequestScheduler
+
+from .fake_servers import FakeSolanaRPC, FakeTensorServer
+
+
+def percentile(values, rank):
+    if not values:
+        return None
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(rank / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def measure(name, operation, iterations):
+    """
+    Call `operation(i)` for each iteration and time every call.
+    """
+    latencies = []
+    errors = 0
+    start = time.perf_counter()
+    for index in range(iterations):
+        call_start = time.perf_counter()
+        try:
+            operation(index)
+        except Exception:
+            errors += 1
+        latencies.append(time.perf_counter() - call_start)
+    elapsed = time.perf_counter() - start
+    peak = peak_memory(lambda: operation(0))
+    return summarize(name, iterations, errors, elapsed, latencies, peak)
+
+
+def measure_bulk(name, operation, size):
+    """
+    Time a single bulk operation processing `size` items.
+    """
+    start = time.perf_counter()
+    result = operation()
+    elapsed = time.perf_counter() - start
+    errors = len(getattr(result, "errors", {}))
+    peak = peak_memory(operation)
+    return summarize(name, size, errors, elapsed, [], peak)
+
+
+def peak_memory(operation):
+    """
+    Run the operation once more with tracemalloc, which slows it down too
+    much to be enabled while timing.
+    """
+    tracemalloc.start()
+    try:
+        operation()
+    except Exception:
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def summarize(name, count, errors, elapsed, latencies, peak):
+    return {
+        "name": name,
+        "operations": count,
+        "errors": errors,
+        "elapsed": elapsed,
+        "ops_per_sec": count / elapsed if elapsed else None,
+        "p50": percentile(latencies, 50),
+        "p99": percentile(latencies, 99),
+        "mean": statistics.mean(latencies) if latencies else None,
+        "peak_memory": peak,
+    }
+
+
+def run(args):
+    keypair = Keypair()
+    wallet = str(keypair.pubkey())
+    slugs = ["collection%d" % index for index in range(args.bulk_size)]
+    mints = [str(Keypair().pubkey()) for _ in range(args.bulk_size)]
+    server_options = {
+        "latency": args.latency,
+        "error_rate": args.error_rate,
+        "throttle": args.throttle,
+    }
+    with FakeTensorServer(**server_options) as api, \
+            FakeSolanaRPC(**server_options) as rpc:
+        client = TensorClient(
+            "benchmark",
+            str(keypair),
+            rpc.url,
+            scheduler=RequestScheduler(backoff_base=0.05),
+            api_url=api.url
+        )
+        scenarios = [
+            measure(
+                "get_collection_infos",
+                lambda i: client.get_collection_infos(slugs[i % len(slugs)]),
+                args.iterations
+            ),
+            measure(
+                "list_nft",
+                lambda i: client.list_nft(mints[i % len(mints)], 1.5),
+                args.iterations
+            ),
+            measure(
+                "buy_cnft",
+                lambda i: client.buy_cnft(wallet, mints[i % len(mints)], 1.5),
+                args.iterations
+            ),
+            measure_bulk(
+                "get_collections_infos",
+                lambda: client.get_collections_infos(slugs),
+                len(slugs)
+            ),
+            measure_bulk(
+                "bulk_list",
+                lambda: client.bulk_list({mint: 1.5 for mint in mints}),
+                len(mints)
+            ),
+            measure_bulk(
+                "bulk_delist",
+                lambda: client.bulk_delist(mints),
+                len(mints)
+            ),
+        ]
+        client.close()
+        servers = {
+            "api": {
+                "requests": api.requests,
+                "errors": api.errors,
+                "throttled": api.throttled,
+            },
+            "rpc": {
+                "requests": rpc.requests,
+                "errors": rpc.errors,
+                "throttled": rpc.throttled,
+            },
+        }
+    return {
+        "version": package_version(),
+        "python": platform.python_version(),
+        "timestamp": time.time(),
+        "config": vars(args),
+        "servers": servers,
+        "scenarios": scenarios,
+    }
+
+
+def package_version():
+    try:
+        return metadata.version("tensortradepy")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle", type=float, default=None)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--bulk-size", type=int, default=200)
+    parser.add_argument("--output", default="benchmarks/results.json")
+    args = parser.parse_args()
+    results = run(args)
+    with open(args.output, "w") as output:
+        json.dump(results, output, indent=2)
+    for scenario in results["scenarios"]:
+        print("%-24s %10.1f ops/s  p50=%s  p99=%s  errors=%d" % (
+            scenario["name"],
+            scenario["ops_per_sec"] or 0,
+            format_latency(scenario["p50"]),
+            format_latency(scenario["p99"]),
+            scenario["errors"],
+        ))
+
+
+def format_latency(value):
+    if value is None:
+        return "-"
+    return "%.1fms" % (value * 1000)
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,2 @@
 from .tensor import TensorClient
+from .async_tensor import AsyncTensorClient
@@ -0,0 +1,896 @@
+import asyncio
+import time
+
+from solana.rpc.commitment import Finalized
+
+from .instrumentation import build_context
+
+from .ratelimit import (
+    PRIORITY_DEFAULT,
+    PRIORITY_STATS
+)
+
+from .solana import (
+    create_async_client,
+    network_url,
+    from_solami,
+    get_keypair_from_base58_secret_key,
+    async_run_solana_transaction,
+    async_send_raw_transaction
+)
+
+from .bulk import (
+    async_run_bulk,
+    to_price_items
+)
+
+from .cache import MISSING
+
+from .coalesce import AsyncSingleFlight
+
+from .confirmations import AsyncConfirmationTracker
+
+from .helpers import (
+    active_listings_query,
+    collection_bids_query,
+    collection_infos_query,
+    collection_volatile_stats_query,
+    compile_tensor_query,
+    encode_query_body
+)
+
+from .exceptions import (
+    NotListedException,
+    RateLimitException,
+    TransactionFailedException,
+    WrongAPIKeyException,
+)
+
+from .models import (
+    CollectionStats,
+    CollectionStatsBatch,
+    PoolInfo
+)
+
+from .rpc import AsyncRpcPool
+
+from .transport import (
+    TransportConfig,
+    async_prewarm_session
+)
+
+from .orderbook import (
+    OrderBook,
+    listings_variables,
+    parse_bid,
+    parse_listings_page
+)
+
+from .stream import CollectionWatcher
+
+from .tensor import (
+    TENSOR_API_URL,
+    TensorClient,
+    floor_from_infos,
+    merge_collection_metadata
+)
+
+
+class AsyncTensorClient(TensorClient):
+    """
+    Asynchronous version of the `TensorClient`. It exposes the same methods
+    but every one of them is a coroutine and must be awaited.
+
+    GraphQL queries go through a pooled `httpx.AsyncClient` and transactions
+    are submitted through the Solana `AsyncClient`, so a single event loop can
+    keep many requests in flight.
+
+    The listing, bidding, buying and pool methods are inherited from the
+    `TensorClient`: they build their query and return `execute_query(...)`,
+    which is a coroutine here. Only the methods that post-process the
+    response are redefined.
+    """
+
+    def __init__(
+        self,
+        api_key,
+        private_key=None,
+        network="devnet",
+        max_batch_size=50,
+        max_connections=100,
+        timeout=30.0,
+        track_confirmations=False,
+        cache=None,
+        cache_ttls=None,
+        scheduler=None,
+        api_url=TENSOR_API_URL,
+        instrumentation=None,
+        signer=None,
+        single_flight=None,
+        transport=None,
+        serializer=None,
+    ):
+        """
+        The constructor sets up the client. It allows you to set your Tensor
+        Trade API key, your wallet private key to perform operations and the
+        Solana network where transactions are set.
+
+        Args:
+            api_key (str): The Tensor Trade API authentication key.
+            private_key (str): Your wallet private key.
+            network (str|list): The Solana network to use ("devnet",
+                "mainnet-beta"...) or an RPC URL. Give a list of them, or an
+                `AsyncRpcPool`, to spread the RPC calls over several
+                endpoints.
+            max_batch_size (int): The maximum number of collections fetched
+                in a single request by the batched methods.
+            max_connections (int): The maximum number of simultaneous
+                connections opened to the Tensor Trade API. Ignored if a
+                `transport` is given.
+            timeout (float): The timeout (in seconds) of the API requests.
+                Ignored if a `transport` is given.
+            track_confirmations (bool): Track the confirmation of every
+                submitted transaction in a task of the event loop. The
+                responses of the transaction methods then include a
+                `confirmation` asyncio future.
+            cache (Cache): The cache backend (`MemoryCache` or `SqliteCache`)
+                used for the collection metadata and whitelists. If not
+                specified, nothing is cached.
+            cache_ttls (dict): TTL (in seconds) by kind of cached data, it
+                overrides the defaults.
+            scheduler (RequestScheduler): The rate limiter and retry policy
+                of the API requests. It can be shared between clients. If not
+                specified, requests are only retried.
+            api_url (str): The URL of the Tensor Trade GraphQL API.
+            instrumentation (Instrumentation): Receives the duration of each
+                stage of the requests and transactions. Nothing is recorded
+                by default.
+            signer (LocalSigner): The backend deserializing and signing the
+                transactions of `execute_query`. A `ProcessPoolSigner` signs
+                without blocking the event loop.
+            single_flight (AsyncSingleFlight): Coalesces the identical read
+                queries sent concurrently. If not specified, only the
+                in-flight queries are shared.
+            transport (TransportConfig): The settings of the `httpx`
+                connection pool (see `tensortradepy.transport`). Its
+                connections are pre-warmed when the client is entered.
+            serializer (str|JsonSerializer): The JSON serializer of the
+                requests and responses. If not specified, the fastest
+                installed one is used.
+        """
+        if transport is None:
+            transport = TransportConfig(
+                pool_maxsize=max_connections,
+                pool_block=True,
+                timeout=timeout
+            )
+        super().__init__(
+            api_key,
+            private_key,
+            network,
+            max_batch_size,
+            blockhash_ttl=None,
+            track_confirmations=track_confirmations,
+            cache=cache,
+            cache_ttls=cache_ttls,
+            scheduler=scheduler,
+            api_url=api_url,
+            instrumentation=instrumentation,
+            signer=signer,
+            single_flight=single_flight,
+            transport=transport,
+            serializer=serializer
+        )
+
+    async def __aenter__(self):
+        if self.transport.prewarm:
+            await self.prewarm()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def create_single_flight(self):
+        return AsyncSingleFlight()
+
+    def init_client(self, api_key: str):
+        """
+        Initialize the Tensor Trade client and the `httpx` connection pool.
+
+        Arguments:
+            api_key (str): The Tensor Trade API authentication key.
+        """
+        self.api_key = api_key
+        self.session = self.transport.create_async_session(api_key)
+
+    def prewarm_on_start(self):
+        # No event loop yet: the client is pre-warmed by `__aenter__`.
+        pass
+
+    async def prewarm(self, connections=None):
+        """
+        Open connections to the API and to the Solana RPC ahead of the first
+        trade.
+
+        Arguments:
+            connections (int): The number of API connections to open.
+                Defaults to the `prewarm` setting of the transport.
+
+        Returns:
+            (int): The number of API connections opened.
+        """
+        if connections is None:
+            connections = self.transport.prewarm_connections()
+        opened = await async_prewarm_session(
+            self.session,
+            self.api_url,
+            connections,
+            self.transport.timeout
+        )
+        try:
+            await self.get_latest_blockhash()
+        except Exception:
+            pass
+        return opened
+
+    def init_solana_client(self, private_key, network):
+        """
+        Initialize the asynchronous Solana client.
+
+        Arguments:
+            private_key (str): The private key of the wallet.
+            network (str|list): The Solana network, RPC URL, list of them or
+                `AsyncRpcPool` to use.
+
+        Returns:
+            The solana client object.
+        """
+        self.set_keypair(None)
+        if private_key is not None:
+            self.set_keypair(get_keypair_from_base58_secret_key(private_key))
+        self.solana_client = self.create_solana_client(network)
+        self.blockhash_cache = None
+        self.confirmation_tracker = None
+        if self.track_confirmations:
+            self.confirmation_tracker = AsyncConfirmationTracker(
+                self.solana_client
+            )
+        return self.solana_client
+
+    def create_solana_client(self, network):
+        """
+        Create the asynchronous Solana client, or the pool of clients if
+        several networks are given.
+        """
+        if isinstance(network, AsyncRpcPool):
+            return network
+        if isinstance(network, (list, tuple)):
+            return AsyncRpcPool([network_url(item) for item in network])
+        return create_async_client(network_url(network))
+
+    async def close(self):
+        """
+        Close the API connection pool and the Solana client, and stop the
+        confirmation tracker task.
+        """
+        self.stop_background_tasks()
+        await self.session.aclose()
+        await self.solana_client.close()
+
+    async def send_query(
+        self,
+        query,
+        variables,
+        priority=PRIORITY_DEFAULT,
+        context=None,
+        coalesce=False
+    ):
+        """
+        Send a query to the Tensor Trade API. The request waits for the rate
+        limiter and is retried if the server throttles it or fails.
+
+        Arguments:
+            query (str): The GraphQL query.
+            variables (dict): The GraphQL variables.
+            priority (int): The priority lane of the request.
+            context (dict): The context given to the instrumentation. If not
+                specified, it is built from the variables.
+            coalesce (bool): Share the response with the identical queries
+                sent concurrently (see `single_flight`). Only for read
+                queries.
+        """
+        if context is None:
+            context = build_context(variables=variables)
+        with self.instrumentation.span("query_build", context):
+            body = encode_query_body(query, variables, self.serializer)
+        if coalesce and self.single_flight is not None:
+            return await self.single_flight.do(
+                self.coalescing_key(body),
+                lambda: self.post_query(body, priority, context)
+            )
+        return await self.post_query(body, priority, context)
+
+    async def post_query(self, body, priority, context):
+        """
+        Post an encoded query, retrying it while the server throttles it or
+        fails, and decode the response.
+        """
+        instrumentation = self.instrumentation
+        attempt = 0
+        with instrumentation.span("http_send", context):
+            while True:
+                await self.scheduler.acquire_async(priority)
+                resp = await self.session.post(
+                    self.api_url,
+                    content=body
+                )
+                if not self.scheduler.should_retry(resp.status_code):
+                    break
+                if attempt >= self.scheduler.max_retries:
+                    raise RateLimitException(
+                        "The request failed with status %d after %d retries"
+                        % (resp.status_code, attempt)
+                    )
+                await asyncio.sleep(self.scheduler.backoff(
+                    attempt,
+                    resp.headers.get("Retry-After")
+                ))
+                attempt += 1
+        try:
+            with instrumentation.span("json_decode", context):
+                return self.serializer.loads(resp.content).get("data", {})
+        except self.serializer.decode_error:
+            if resp.status_code == 403:
+                raise WrongAPIKeyException("Invalid API Key")
+            else:
+                raise
+
+    async def execute_query(
+        self,
+        query,
+        variables,
+        name,
+        priority=PRIORITY_DEFAULT
+    ):
+        """
+        Execute a GraphQL query and send the transaction to the Solana network.
+
+        Arguments:
+            query (str): The GraphQL query.
+            variables (dict): The GraphQL variables.
+            name (str): The name of the transaction.
+            priority (int): The priority lane of the API request.
+
+        Returns:
+            (dict): The GraphQL response with the transaction `signature`. If
+                confirmations are tracked, a `confirmation` future is added
+                too.
+        """
+        context = build_context(name, variables)
+        data = await self.send_query(query, variables, priority, context)
+        with self.instrumentation.span("tx_extract", context):
+            transaction = self.extract_transaction(data, name)
+        response, last_valid_block_height = await async_run_solana_transaction(
+            self.solana_client,
+            self.keypair,
+            transaction,
+            self.instrumentation,
+            context,
+            self.signer
+        )
+        return self.transaction_response(
+            data,
+            response,
+            last_valid_block_height
+        )
+
+    async def get_latest_blockhash(self):
+        """
+        Return the latest blockhash.
+
+        Returns:
+            (tuple): The blockhash, its last valid block height and when it
+                was fetched (monotonic time).
+        """
+        block = (await self.solana_client.get_latest_blockhash(
+            Finalized
+        )).value
+        return block.blockhash, block.last_valid_block_height, time.monotonic()
+
+    async def prepare_query(
+        self,
+        query,
+        variables,
+        name,
+        priority=PRIORITY_DEFAULT
+    ):
+        """
+        Execute a GraphQL query and prepare its transaction without sending
+        it. Use `submit` to send it.
+
+        Arguments:
+            query (str): The GraphQL query.
+            variables (dict): The GraphQL variables.
+            name (str): The name of the transaction.
+            priority (int): The priority lane of the API request.
+
+        Returns:
+            (PreparedTransaction): The transaction, ready to be submitted.
+        """
+        context = build_context(name, variables)
+        data = await self.send_query(query, variables, priority, context)
+        latest_blockhash = None
+        if data[name]["txs"][0].get("lastValidBlockHeight") is None:
+            latest_blockhash = await self.get_latest_blockhash()
+        return self.prepare_transaction(data, name, context, latest_blockhash)
+
+    async def submit(self, prepared, refresh_margin=10):
+        """
+        Send a prepared transaction to the Solana network. The transaction is
+        signed again with a new blockhash only if its blockhash is about to
+        expire.
+
+        Arguments:
+            prepared (PreparedTransaction): The transaction returned by
+                `prepare_query` or one of the `prepare_*` methods.
+            refresh_margin (int): The number of blocks before the expiration
+                of the blockhash under which it is refreshed.
+
+        Returns:
+            (dict): The GraphQL response with the transaction `signature`.
+
+        Raises:
+            TransactionExpiredException: The last valid block height of the
+                transaction is passed.
+        """
+        block_height = self.estimate_block_height()
+        self.check_prepared_transaction(prepared, block_height)
+        if prepared.blocks_left(block_height) < refresh_margin:
+            latest_blockhash = await self.get_latest_blockhash()
+            try:
+                self.refresh_prepared_transaction(prepared, *latest_blockhash)
+            except Exception as e:
+                raise TransactionFailedException(e)
+        response = await async_send_raw_transaction(
+            self.solana_client,
+            prepared.raw,
+            self.instrumentation,
+            prepared.context
+        )
+        return self.submitted_response(prepared, response)
+
+    async def get_collection_infos(self, slug: str):
+        """
+        Retrieve the main information about a collection including buyNowPrice,
+        sellNowPrice and the number of listed elements.
+
+        Args:
+            slug (str): the collection slug (ID)
+
+        Returns:
+            (dict): ex: { "buyNowPrice": 10, "sellNowPrice": 10, "numListed": 100 }
+        """
+        variables = {"slug": slug}
+        metadata = self.get_cached_collection_metadata(slug)
+        if metadata is not None:
+            data = await self.send_query(
+                collection_volatile_stats_query,
+                variables,
+                PRIORITY_STATS,
+                coalesce=True
+            )
+            return merge_collection_metadata(metadata, data)
+        query = collection_infos_query
+        data = await self.send_query(
+            query,
+            variables,
+            PRIORITY_STATS,
+            coalesce=True
+        )
+        infos = data.get("instrumentTV2", {})
+        self.cache_collection_metadata(slug, infos)
+        return infos
+
+    async def get_collection_floor(self, slug: str):
+        """
+        Retrieve the lowest price of the item listed for the given collection.
+
+        Args:
+            slug (str): the collection slug (ID)
+
+        Returns:
+            (float): The floor price (buyNow).
+        """
+        data = await self.get_collection_infos(slug)
+        if data is None:
+            raise Exception("The collection %s is not listed." % slug)
+        return from_solami(data["statsV2"]["buyNowPrice"])
+
+    async def get_collections_infos(self, slugs, batch_size=None):
+        """
+        Retrieve the main information of several collections. Slugs are
+        packed into aliased queries and the batches are sent concurrently.
+
+        Args:
+            slugs (list): the collection slugs (IDs)
+            batch_size (int): the maximum number of slugs per request. If not
+                specified, the client `max_batch_size` is used.
+
+        Returns:
+            (dict): collection information keyed by slug. The value is None
+                for unknown collections.
+        """
+        batches = self.build_collections_batches(slugs, batch_size)
+        results = await asyncio.gather(*[
+            self.send_query(query, variables, PRIORITY_STATS, coalesce=True)
+            for (query, variables, _) in batches
+        ])
+        infos = {}
+        for (_, _, chunk), data in zip(batches, results):
+            infos.update(self.parse_collections_batch(data, chunk))
+        return infos
+
+    async def get_collection_floors(self, slugs, batch_size=None):
+        """
+        Retrieve the floor price of several collections in batched requests.
+
+        Args:
+            slugs (list): the collection slugs (IDs)
+            batch_size (int): the maximum number of slugs per request. If not
+                specified, the client `max_batch_size` is used.
+
+        Returns:
+            (dict): floor prices (buyNow) keyed by slug. The value is None
+                for unknown or unlisted collections.
+        """
+        infos = await self.get_collections_infos(slugs, batch_size)
+        return {
+            slug: floor_from_infos(data)
+            for (slug, data) in infos.items()
+        }
+
+    async def get_collection_stats(self, slug):
+        """
+        Retrieve the information of a collection as a `CollectionStats`
+        (prices kept in lamports).
+
+        Args:
+            slug (str): the collection slug (ID)
+
+        Returns:
+            (CollectionStats): The collection stats, None if the collection
+                is unknown.
+        """
+        return CollectionStats.from_infos(
+            await self.get_collection_infos(slug)
+        )
+
+    async def get_collections_stats(self, slugs, batch_size=None):
+        """
+        Retrieve the information of several collections in batched
+        requests, as NumPy columns. Requires NumPy.
+
+        Args:
+            slugs (list): the collection slugs (IDs)
+            batch_size (int): the maximum number of slugs per request. If not
+                specified, the client `max_batch_size` is used.
+
+        Returns:
+            (CollectionStatsBatch): The stats of the collections.
+        """
+        return CollectionStatsBatch.from_infos(
+            await self.get_collections_infos(slugs, batch_size)
+        )
+
+    async def watch_collections(
+        self,
+        slugs,
+        interval=1.0,
+        max_interval=None,
+        emit_initial=True
+    ):
+        """
+        Watch collections and yield their changes (floor, sellNowPrice,
+        numListed and numMints). All the collections are fetched in batched
+        requests at each poll. The polling interval grows while nothing
+        changes and goes back to `interval` on the next change.
+
+        Args:
+            slugs (list): the collection slugs (IDs)
+            interval (float): the shortest delay between two polls.
+            max_interval (float): the longest delay between two polls.
+                Defaults to ten times `interval`.
+            emit_initial (bool): yield the current values of each
+                collection on the first poll.
+
+        Returns:
+            (async generator): CollectionEvent objects.
+        """
+        watcher = CollectionWatcher(
+            slugs,
+            interval,
+            max_interval,
+            emit_initial=emit_initial
+        )
+        while True:
+            infos = await self.get_collections_infos(watcher.slugs)
+            for event in watcher.update(infos):
+                yield event
+            await asyncio.sleep(watcher.interval)
+
+    async def get_collection_whitelist(self, slug: str):
+        """
+        """
+        return_format = {
+            "address": None
+        }
+        query = compile_tensor_query(
+            "TswapWhitelist",
+            "tswapWhitelist",
+            [
+                ("slug", "String"),
+            ],
+            return_format
+        )
+        variables = {
+            "slug": slug
+        }
+        if self.cache is None:
+            return await self.send_query(query, variables, coalesce=True)
+        key = "whitelist:%s" % slug
+        data = self.cache.get(key)
+        if data is MISSING:
+            data = await self.send_query(query, variables, coalesce=True)
+            self.cache.set(key, data, self.cache_ttls["whitelist"])
+        return data
+
+    async def iter_collection_listings(
+        self,
+        slug,
+        limit=100,
+        sort_by="PriceAsc",
+        max_pages=None
+    ):
+        """
+        Retrieve the active listings of a collection page by page, following
+        the pagination cursor.
+
+        Args:
+            slug (str): the collection slug (ID)
+            limit (int): the number of listings by page.
+            sort_by (str): the listing order (PriceAsc, PriceDesc...).
+            max_pages (int): the maximum number of pages to fetch. All the
+                pages are fetched if not specified.
+
+        Returns:
+            (async generator): a list of `Listing` objects (price in SOL)
+                for each page, yielded as soon as the page is received.
+        """
+        cursor = None
+        pages = 0
+        while True:
+            data = await self.send_query(
+                active_listings_query,
+                listings_variables(slug, limit, sort_by, cursor),
+                PRIORITY_STATS,
+                coalesce=True
+            )
+            listings, cursor = parse_listings_page(data)
+            yield listings
+            pages += 1
+            if cursor is None or (max_pages is not None and pages >= max_pages):
+                return
+
+    async def get_collection_listings(self, slug, limit=100, max_pages=None):
+        """
+        Retrieve the active listings of a collection, from the cheapest.
+
+        Args:
+            slug (str): the collection slug (ID)
+            limit (int): the number of listings by page.
+            max_pages (int): the maximum number of pages to fetch.
+
+        Returns:
+            (list): `Listing` objects (price in SOL).
+        """
+        return [
+            listing
+            async for page in self.iter_collection_listings(
+                slug,
+                limit,
+                max_pages=max_pages
+            )
+            for listing in page
+        ]
+
+    async def get_collection_bids(self, slug):
+        """
+        Retrieve the collection bids of a collection.
+
+        Args:
+            slug (str): the collection slug (ID)
+
+        Returns:
+            (list): `Bid` objects (price in SOL, remaining quantity).
+        """
+        data = await self.send_query(
+            collection_bids_query,
+            {"slug": slug},
+            PRIORITY_STATS,
+            coalesce=True
+        )
+        bids = [parse_bid(item) for item in data.get("tcompBids") or []]
+        return [bid for bid in bids if bid.quantity > 0]
+
+    async def load_order_book(self, slug, book=None, limit=100, max_pages=None):
+        """
+        Load the listings and bids of a collection into a local order book.
+        The listing pages are added to the book as they arrive, then the
+        listings which are not active anymore are removed.
+
+        Args:
+            slug (str): the collection slug (ID)
+            book (OrderBook): the book to update. A new one if not
+                specified.
+            limit (int): the number of listings by page.
+            max_pages (int): the maximum number of listing pages to fetch.
+                Only the cheapest listings are kept then.
+
+        Returns:
+            (OrderBook): the order book.
+        """
+        if book is None:
+            book = OrderBook(slug)
+        seen = set()
+        async for page in self.iter_collection_listings(
+            slug,
+            limit,
+            max_pages=max_pages
+        ):
+            for listing in page:
+                book.add_listing(listing)
+                seen.add(listing.mint)
+        book.retain_listings(seen)
+        book.replace_bids(await self.get_collection_bids(slug))
+        return book
+
+    async def bulk_list(
+        self,
+        listings,
+        compressed=False,
+        wallet_address=None,
+        max_workers=8
+    ):
+        """
+        List many NFTs for sale. The listings are awaited concurrently and
+        a failure doesn't stop the other listings.
+
+        Arguments:
+            listings (dict): The price of each mint ({mint: price}). A list of
+                (mint, price) pairs is accepted too.
+            compressed (bool): True if the mints are cNFTs.
+            wallet_address (str): The wallet address of the owner. If not
+                specified, the private key of the Solana client will be used.
+            max_workers (int): The maximum number of listings in flight.
+
+        Returns:
+            (BulkResult): The responses and errors keyed by mint.
+        """
+        operation = self.list_cnft if compressed else self.list_nft
+        jobs = [
+            (mint, (mint, price, wallet_address))
+            for (mint, price) in to_price_items(listings)
+        ]
+        return await async_run_bulk(operation, jobs, max_workers)
+
+    async def bulk_edit_listings(
+        self,
+        listings,
+        compressed=False,
+        wallet_address=None,
+        max_workers=8
+    ):
+        """
+        Edit the price of many listings. The edits are awaited concurrently
+        and a failure doesn't stop the other edits.
+
+        Arguments:
+            listings (dict): The new price of each mint ({mint: price}). A
+                list of (mint, price) pairs is accepted too.
+            compressed (bool): True if the mints are cNFTs.
+            wallet_address (str): The wallet address of the owner. If not
+                specified, the private key of the Solana client will be used.
+            max_workers (int): The maximum number of edits in flight.
+
+        Returns:
+            (BulkResult): The responses and errors keyed by mint.
+        """
+        if compressed:
+            operation = self.edit_cnft_listing
+        else:
+            operation = self.edit_nft_listing
+        jobs = [
+            (mint, (mint, price, wallet_address))
+            for (mint, price) in to_price_items(listings)
+        ]
+        return await async_run_bulk(operation, jobs, max_workers)
+
+    async def bulk_delist(
+        self,
+        mints,
+        compressed=False,
+        wallet_address=None,
+        max_workers=8
+    ):
+        """
+        Delist many NFTs. The delistings are awaited concurrently and a
+        failure doesn't stop the other delistings.
+
+        Arguments:
+            mints (list): The mints to delist.
+            compressed (bool): True if the mints are cNFTs.
+            wallet_address (str): The wallet address of the owner. If not
+                specified, the private key of the Solana client will be used.
+            max_workers (int): The maximum number of delistings in flight.
+
+        Returns:
+            (BulkResult): The responses and errors keyed by mint.
+        """
+        operation = self.delist_cnft if compressed else self.delist_nft
+        jobs = [(mint, (mint, wallet_address)) for mint in mints]
+        return await async_run_bulk(operation, jobs, max_workers)
+
+    async def buy_nft(
+        self,
+        seller,
+        mint,
+        price,
+        wallet_address=None
+    ):
+        """
+        Buy a NFT from the marketplace.
+
+        Arguments:
+            seller (str): The address of the seller.
+            mint (str): The mint of the NFT.
+            price (float|Lamports): The price (in SOL) of the NFT.
+            wallet_address (str): The wallet address of the buyer. If not
+                specified, the private key of the Solana client will be used.
+        """
+        try:
+            return await super().buy_nft(
+                seller,
+                mint,
+                price,
+                wallet_address=wallet_address
+            )
+        except TransactionFailedException as e:
+            if "ComputeBudget" in str(e):
+                raise NotListedException
+            raise
+
+    async def create_pool(self,
+        slug,
+        starting_price,
+        pool_type="TRADE",
+        curve_type="LINEAR",
+        delta=1.0,
+        compound_fees=False,
+        fee_bps=None,
+        wallet_address=None,
+        return_info=False
+    ):
+        query, variables = self.build_create_pool_query(
+            slug,
+            starting_price,
+            pool_type,
+            curve_type,
+            delta,
+            compound_fees,
+            fee_bps,
+            wallet_address
+        )
+        data = await self.execute_query(query, variables, "tswapInitPoolTx")
+        if return_info:
+            return PoolInfo.from_response(data, variables)
+        return data["tswapInitPoolTx"]["pool"]
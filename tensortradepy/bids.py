@@ -0,0 +1,346 @@
+import threading
+
+from .bulk import (
+    async_run_bulk,
+    run_bulk
+)
+from .solana import to_solami
+
+
+PLACE = "place"
+EDIT = "edit"
+CANCEL = "cancel"
+
+
+class LiveBid:
+    """
+    A collection bid of the wallet. Bids placed by the ladder have no
+    address until the live bids are loaded again (see `BidLadder.refresh`).
+    """
+
+    __slots__ = ("address", "slug", "price", "quantity")
+
+    def __init__(self, address, slug, price, quantity):
+        self.address = address
+        self.slug = slug
+        self.price = price
+        self.quantity = quantity
+
+    @property
+    def pending(self):
+        return self.address is None
+
+    def __repr__(self):
+        return "LiveBid(%s, %s, price=%s, quantity=%s)" % (
+            self.address,
+            self.slug,
+            self.price,
+            self.quantity
+        )
+
+
+class BidOperation:
+    """
+    A bid to place, edit or cancel.
+    """
+
+    __slots__ = ("kind", "slug", "bid", "price", "quantity")
+
+    def __init__(self, kind, slug, bid=None, price=None, quantity=None):
+        self.kind = kind
+        self.slug = slug
+        self.bid = bid
+        self.price = price
+        self.quantity = quantity
+
+    def __repr__(self):
+        if self.kind == CANCEL:
+            return "BidOperation(cancel, %s)" % self.bid.address
+        return "BidOperation(%s, %s, price=%s, quantity=%s)" % (
+            self.kind,
+            self.bid.address if self.bid is not None else self.slug,
+            self.price,
+            self.quantity
+        )
+
+
+class BidDiff:
+    """
+    The operations turning the live bids into the target levels.
+
+    Attributes:
+        places (list): The new bids.
+        edits (list): The bids to move to another price or quantity.
+        cancels (list): The bids to cancel.
+        unresolved (list): The pending bids (without address yet) that
+            should change. They are left untouched until the live bids are
+            loaded again.
+    """
+
+    def __init__(self):
+        self.places = []
+        self.edits = []
+        self.cancels = []
+        self.unresolved = []
+
+    @property
+    def operations(self):
+        return self.edits + self.places + self.cancels
+
+    def __len__(self):
+        return len(self.places) + len(self.edits) + len(self.cancels)
+
+    def __repr__(self):
+        return "<BidDiff places=%d edits=%d cancels=%d unresolved=%d>" % (
+            len(self.places),
+            len(self.edits),
+            len(self.cancels),
+            len(self.unresolved)
+        )
+
+
+def diff_levels(slug, bids, levels, tolerance=0.0, diff=None):
+    """
+    Compute the minimal operations turning the bids of a collection into the
+    target levels. Bids already matching a level are kept, the other ones are
+    edited (one transaction instead of a cancel and a new bid) and only the
+    remaining levels or bids are placed or cancelled.
+
+    Arguments:
+        slug (str): The collection slug.
+        bids (list): The live bids of the collection.
+        levels (list): The target (price, quantity) levels. Prices are in
+            SOL or `Lamports`.
+        tolerance (float|Lamports): The price difference (in SOL) under
+            which a bid is considered at the right price.
+        diff (BidDiff): The diff to complete. A new one if not specified.
+
+    Returns:
+        (BidDiff): The operations.
+    """
+    if diff is None:
+        diff = BidDiff()
+    # Prices are compared in lamports, so SOL and `Lamports` prices mix.
+    tolerance = to_solami(tolerance)
+    levels = sorted(
+        (
+            (to_solami(price), price, quantity)
+            for (price, quantity) in levels if quantity > 0
+        ),
+        key=lambda level: (level[0], level[2])
+    )
+    remaining = []
+    for amount, bid in sorted(
+        ((to_solami(bid.price), bid) for bid in bids),
+        key=lambda item: item[0]
+    ):
+        for index, (level_amount, _, quantity) in enumerate(levels):
+            if (
+                quantity == bid.quantity
+                and abs(level_amount - amount) <= tolerance
+            ):
+                del levels[index]
+                break
+        else:
+            remaining.append(bid)
+    # Pending bids take their level too, so it isn't placed twice.
+    for bid, (_, price, quantity) in zip(remaining, levels):
+        if bid.pending:
+            diff.unresolved.append(bid)
+        else:
+            diff.edits.append(BidOperation(EDIT, slug, bid, price, quantity))
+    for _, price, quantity in levels[len(remaining):]:
+        diff.places.append(BidOperation(PLACE, slug, None, price, quantity))
+    for bid in remaining[len(levels):]:
+        if bid.pending:
+            diff.unresolved.append(bid)
+        else:
+            diff.cancels.append(BidOperation(CANCEL, slug, bid))
+    return diff
+
+
+class BidLadder:
+    """
+    Keep collection bids at target (price, quantity) levels.
+
+    The ladder tracks the live bids of each collection. `rebalance` computes
+    the minimal diff between them and the target levels and runs the edits,
+    new bids and cancellations concurrently, so only the changed bids cost a
+    transaction.
+
+        ladder = BidLadder(client)
+        ladder.refresh(["theheist"])
+        ladder.rebalance({"theheist": [(1.25, 1), (1.1, 2)]})
+    """
+
+    def __init__(self, client, max_workers=8, tolerance=0.0):
+        """
+        Arguments:
+            client (TensorClient): The client placing the bids.
+            max_workers (int): The maximum number of operations in flight.
+            tolerance (float|Lamports): The price difference (in SOL) under
+                which a bid is not moved.
+        """
+        self.client = client
+        self.max_workers = max_workers
+        self.tolerance = tolerance
+        self.bids = {}
+        self.lock = threading.Lock()
+
+    def load(self, slug, bids):
+        """
+        Replace the live bids of a collection.
+
+        Arguments:
+            slug (str): The collection slug.
+            bids (list): (address, price, quantity) tuples.
+        """
+        with self.lock:
+            self.bids[slug] = [
+                LiveBid(address, slug, price, quantity)
+                for (address, price, quantity) in bids
+            ]
+
+    def refresh(self, slugs):
+        """
+        Load the live bids of the wallet from the API, collections fetched
+        concurrently.
+
+        Arguments:
+            slugs (list): The collection slugs.
+
+        Returns:
+            (BulkResult): The bids and errors keyed by slug.
+        """
+        jobs = [(slug, (slug,)) for slug in dict.fromkeys(slugs)]
+        result = run_bulk(
+            self.client.get_collection_bids,
+            jobs,
+            self.max_workers
+        )
+        self.load_results(result)
+        return result
+
+    def load_results(self, result):
+        for slug, bids in result.results.items():
+            self.load(slug, [
+                (bid.address, bid.price, bid.quantity)
+                for bid in bids if bid.owner == self.client.wallet_address
+            ])
+
+    def levels(self, slug):
+        """
+        Return the (price, quantity) levels of the live bids of a collection.
+        """
+        with self.lock:
+            return sorted(
+                (
+                    (bid.price, bid.quantity)
+                    for bid in self.bids.get(slug, [])
+                ),
+                key=lambda level: (to_solami(level[0]), level[1])
+            )
+
+    def diff(self, targets):
+        """
+        Compute the operations reaching the target levels. Collections
+        missing from `targets` are left untouched, an empty list of levels
+        cancels every bid of the collection.
+
+        Arguments:
+            targets (dict): The (price, quantity) levels by slug.
+
+        Returns:
+            (BidDiff): The operations.
+        """
+        diff = BidDiff()
+        with self.lock:
+            for slug, levels in targets.items():
+                diff_levels(
+                    slug,
+                    self.bids.get(slug, []),
+                    levels,
+                    self.tolerance,
+                    diff
+                )
+        return diff
+
+    def rebalance(self, targets):
+        """
+        Bring the bids to the target levels.
+
+        Arguments:
+            targets (dict): The (price, quantity) levels by slug.
+
+        Returns:
+            (BulkResult): The responses and errors keyed by operation.
+        """
+        diff = self.diff(targets)
+        jobs = [(operation, (operation,)) for operation in diff.operations]
+        return run_bulk(self.apply, jobs, self.max_workers)
+
+    def apply(self, operation):
+        """
+        Send the transaction of an operation and update the live bids.
+        """
+        response = self.send(operation)
+        self.record(operation)
+        return response
+
+    def send(self, operation):
+        if operation.kind == PLACE:
+            return self.client.set_cnft_collection_bid(
+                operation.slug,
+                operation.price,
+                operation.quantity
+            )
+        if operation.kind == EDIT:
+            return self.client.edit_cnft_collection_bid(
+                operation.bid.address,
+                operation.price,
+                operation.quantity
+            )
+        return self.client.cancel_cnft_collection_bid(operation.bid.address)
+
+    def record(self, operation):
+        with self.lock:
+            bids = self.bids.setdefault(operation.slug, [])
+            if operation.kind == PLACE:
+                bids.append(LiveBid(
+                    None,
+                    operation.slug,
+                    operation.price,
+                    operation.quantity
+                ))
+            elif operation.kind == EDIT:
+                operation.bid.price = operation.price
+                operation.bid.quantity = operation.quantity
+            elif operation.bid in bids:
+                bids.remove(operation.bid)
+
+
+class AsyncBidLadder(BidLadder):
+    """
+    Asynchronous version of the `BidLadder`, built on an
+    `AsyncTensorClient`.
+    """
+
+    async def refresh(self, slugs):
+        jobs = [(slug, (slug,)) for slug in dict.fromkeys(slugs)]
+        result = await async_run_bulk(
+            self.client.get_collection_bids,
+            jobs,
+            self.max_workers
+        )
+        self.load_results(result)
+        return result
+
+    async def rebalance(self, targets):
+        diff = self.diff(targets)
+        jobs = [(operation, (operation,)) for operation in diff.operations]
+        return await async_run_bulk(self.apply, jobs, self.max_workers)
+
+    async def apply(self, operation):
+        response = await self.send(operation)
+        self.record(operation)
+        return response
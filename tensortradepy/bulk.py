@@ -0,0 +1,114 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+class BulkResult:
+    """
+    Outcome of a bulk operation. Failures don't stop the other operations,
+    they are collected in `errors`.
+
+    Attributes:
+        results (dict): The response of each successful operation, keyed by
+            mint.
+        errors (dict): The exception raised by each failed operation, keyed
+            by mint.
+    """
+
+    def __init__(self):
+        self.results = {}
+        self.errors = {}
+
+    def __repr__(self):
+        return "<BulkResult succeeded=%d failed=%d>" % (
+            len(self.results),
+            len(self.errors)
+        )
+
+    @property
+    def ok(self):
+        """
+        True if every operation succeeded.
+        """
+        return not self.errors
+
+
+def check_unique_keys(jobs):
+    """
+    Raise a ValueError if several jobs have the same key: their results
+    would overwrite each other.
+    """
+    seen = set()
+    duplicates = []
+    for key, _ in jobs:
+        if key in seen:
+            duplicates.append(key)
+        seen.add(key)
+    if duplicates:
+        raise ValueError(
+            "Each item can only be given once, got duplicates: %s"
+            % ", ".join(map(str, dict.fromkeys(duplicates)))
+        )
+
+
+def run_bulk(operation, jobs, max_workers):
+    """
+    Run the same operation on many items with a bounded pool of threads.
+    Each worker fetches, signs and submits its own transaction, so these
+    stages overlap between items.
+
+    Arguments:
+        operation (callable): The function to call for each job.
+        jobs (list): (key, args) tuples. `args` are given to `operation`.
+        max_workers (int): The maximum number of operations in flight.
+
+    Returns:
+        (BulkResult): The results and errors keyed by job key.
+
+    Raises:
+        ValueError: Several jobs have the same key.
+    """
+    check_unique_keys(jobs)
+    result = BulkResult()
+    if not jobs:
+        return result
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(operation, *args): key
+            for (key, args) in jobs
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                result.results[key] = future.result()
+            except Exception as e:
+                result.errors[key] = e
+    return result
+
+
+async def async_run_bulk(operation, jobs, max_workers):
+    """
+    Coroutine version of `run_bulk`: at most `max_workers` operations are
+    awaited at the same time.
+    """
+    check_unique_keys(jobs)
+    result = BulkResult()
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def run(key, args):
+        async with semaphore:
+            try:
+                result.results[key] = await operation(*args)
+            except Exception as e:
+                result.errors[key] = e
+
+    await asyncio.gather(*[run(key, args) for (key, args) in jobs])
+    return result
+
+
+def to_price_items(listings):
+    """
+    Accept either a {mint: price} dict or a list of (mint, price) pairs.
+    """
+    if isinstance(listings, dict):
+        return list(listings.items())
+    return list(listings)
@@ -0,0 +1,195 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+# Returned by the cache backends when a key is absent or expired.
+MISSING = object()
+
+# Default TTL (in seconds) of each kind of cached data.
+default_ttls = {
+    "collection_metadata": 24 * 3600,
+    "whitelist": 24 * 3600,
+}
+
+
+class Cache:
+    """
+    Base class of the cache backends. Entries expire after their own TTL and
+    the least recently used entries are evicted once `max_size` is reached.
+    Backends implement `load`, `store`, `delete` and `clear`.
+    """
+
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Return the cached value of the key, or `MISSING`.
+        """
+        with self.lock:
+            value = self.load(key, time.time())
+            if value is MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def set(self, key, value, ttl):
+        """
+        Store a value for `ttl` seconds.
+        """
+        with self.lock:
+            self.store(key, value, time.time() + ttl)
+
+    def fetch(self, key, ttl, loader):
+        """
+        Read-through access: return the cached value or call `loader`, cache
+        its result for `ttl` seconds and return it.
+        """
+        value = self.get(key)
+        if value is MISSING:
+            value = loader()
+            self.set(key, value, ttl)
+        return value
+
+    def stats(self):
+        """
+        Return the hit/miss counters of the cache.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self),
+        }
+
+
+class MemoryCache(Cache):
+    """
+    In-memory LRU cache.
+    """
+
+    def __init__(self, max_size=1024):
+        super().__init__(max_size)
+        self.entries = OrderedDict()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def load(self, key, now):
+        entry = self.entries.get(key)
+        if entry is None:
+            return MISSING
+        expires_at, value = entry
+        if expires_at <= now:
+            del self.entries[key]
+            return MISSING
+        self.entries.move_to_end(key)
+        return value
+
+    def store(self, key, value, expires_at):
+        self.entries[key] = (expires_at, value)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class SqliteCache(Cache):
+    """
+    On-disk LRU cache stored in a SQLite database. Values must be JSON
+    serializable. The cache survives restarts and can be shared by several
+    processes.
+    """
+
+    def __init__(self, path, max_size=100_000):
+        """
+        Arguments:
+            path (str): The path of the database file.
+            max_size (int): The maximum number of entries.
+        """
+        super().__init__(max_size)
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            """CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS cache_accessed_at "
+            "ON cache (accessed_at)"
+        )
+        self.connection.commit()
+
+    def __len__(self):
+        with self.lock:
+            return self.connection.execute(
+                "SELECT COUNT(*) FROM cache"
+            ).fetchone()[0]
+
+    def load(self, key, now):
+        row = self.connection.execute(
+            "SELECT value, expires_at FROM cache WHERE key = ?",
+            (key,)
+        ).fetchone()
+        if row is None:
+            return MISSING
+        value, expires_at = row
+        if expires_at <= now:
+            self.connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self.connection.commit()
+            return MISSING
+        self.connection.execute(
+            "UPDATE cache SET accessed_at = ? WHERE key = ?",
+            (now, key)
+        )
+        self.connection.commit()
+        return json.loads(value)
+
+    def store(self, key, value, expires_at):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value), expires_at, time.time())
+        )
+        overflow = self.connection.execute(
+            "SELECT COUNT(*) FROM cache"
+        ).fetchone()[0] - self.max_size
+        if overflow > 0:
+            self.connection.execute(
+                "DELETE FROM cache WHERE key IN ("
+                "SELECT key FROM cache ORDER BY accessed_at LIMIT ?)",
+                (overflow,)
+            )
+            self.evictions += overflow
+        self.connection.commit()
+
+    def delete(self, key):
+        with self.lock:
+            self.connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self.connection.commit()
+
+    def clear(self):
+        with self.lock:
+            self.connection.execute("DELETE FROM cache")
+            self.connection.commit()
+
+    def close(self):
+        self.connection.close()
@@ -0,0 +1,148 @@
+import asyncio
+import threading
+import time
+
+
+class Flight:
+    """
+    A request in progress, whose result is shared by every caller asking
+    for the same key meanwhile.
+    """
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+    def wait(self):
+        self.event.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent read requests: while a request is in
+    flight, the callers asking for the same key wait for it and receive its
+    result (or its error) instead of sending their own.
+
+    With a `ttl`, results are also kept for a short window, so the requests
+    following closely reuse them. The callers share the same decoded object:
+    it must not be modified.
+
+    Only read queries go through it, transaction queries are never
+    coalesced.
+    """
+
+    def __init__(self, ttl=0.0, max_size=1024):
+        """
+        Arguments:
+            ttl (float): Seconds during which a result is reused after its
+                request completed. 0 to only share in-flight requests.
+            max_size (int): The maximum number of results kept.
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.flights = {}
+        self.results = {}
+        self.coalesced = 0
+        self.lock = threading.Lock()
+
+    def cached(self, key, now):
+        entry = self.results.get(key)
+        if entry is None:
+            return None
+        if entry[0] < now:
+            del self.results[key]
+            return None
+        return entry
+
+    def store(self, key, result, now):
+        if self.ttl <= 0:
+            return
+        if len(self.results) >= self.max_size:
+            self.results = {
+                key: entry for key, entry in self.results.items()
+                if entry[0] >= now
+            }
+            if len(self.results) >= self.max_size:
+                self.results.clear()
+        self.results[key] = (now + self.ttl, result)
+
+    def do(self, key, loader):
+        """
+        Return the result of `loader`, or of the identical request already
+        in flight.
+
+        Arguments:
+            key (hashable): The request key (the API URL, API key and
+                encoded request body).
+            loader (function): Sends the request and returns its result.
+        """
+        with self.lock:
+            entry = self.cached(key, time.monotonic())
+            if entry is not None:
+                self.coalesced += 1
+                return entry[1]
+            flight = self.flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.flights[key] = Flight()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return flight.wait()
+        try:
+            flight.result = loader()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.flights[key]
+                if flight.error is None:
+                    self.store(key, flight.result, time.monotonic())
+            flight.event.set()
+        return flight.result
+
+    def clear(self):
+        with self.lock:
+            self.results.clear()
+
+
+class AsyncSingleFlight(SingleFlight):
+    """
+    Asynchronous version of the `SingleFlight`, for the requests of an
+    event loop.
+    """
+
+    async def do(self, key, loader):
+        """
+        Arguments:
+            key (hashable): The request key (the API URL, API key and
+                encoded request body).
+            loader (function): Returns the coroutine sending the request.
+        """
+        entry = self.cached(key, time.monotonic())
+        if entry is not None:
+            self.coalesced += 1
+            return entry[1]
+        flight = self.flights.get(key)
+        if flight is not None:
+            self.coalesced += 1
+            # Shielded: a cancelled waiter doesn't cancel the request.
+            return await asyncio.shield(flight)
+        flight = self.flights[key] = asyncio.ensure_future(loader())
+        flight.add_done_callback(
+            lambda task: task.cancelled() or task.exception()
+        )
+        try:
+            result = await asyncio.shield(flight)
+        finally:
+            if self.flights.get(key) is flight:
+                del self.flights[key]
+        self.store(key, result, time.monotonic())
+        return result
@@ -0,0 +1,306 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+
+from solders.signature import Signature
+from solders.transaction_status import TransactionConfirmationStatus
+
+from .exceptions import TransactionFailedException
+
+
+CONFIRMED = "confirmed"
+FINALIZED = "finalized"
+EXPIRED = "expired"
+
+# Maximum number of signatures accepted by getSignatureStatuses.
+MAX_SIGNATURES_PER_REQUEST = 256
+
+commitment_levels = {
+    CONFIRMED: int(TransactionConfirmationStatus.Confirmed),
+    FINALIZED: int(TransactionConfirmationStatus.Finalized),
+}
+
+
+class PendingSignature:
+    __slots__ = ("signature", "last_valid_block_height", "future")
+
+    def __init__(self, signature, last_valid_block_height, future):
+        self.signature = signature
+        self.last_valid_block_height = last_valid_block_height
+        self.future = future
+
+
+class ConfirmationTracker:
+    """
+    Track the confirmation of submitted transactions without blocking the
+    caller. Signatures are polled in batches by a background thread with
+    `getSignatureStatuses`. Each tracked signature gets a future resolved
+    with `"confirmed"`, `"finalized"` or `"expired"` (when the block height
+    goes beyond its last valid block height). Failed transactions resolve
+    their future with a `TransactionFailedException`.
+    """
+
+    def __init__(self, client, commitment=CONFIRMED, poll_interval=1.0):
+        """
+        Arguments:
+            client (Client): The Solana client used to poll the statuses.
+            commitment (str): The level resolving the futures: "confirmed"
+                or "finalized".
+            poll_interval (float): Seconds between two polling rounds.
+        """
+        if commitment not in commitment_levels:
+            raise ValueError("commitment should be confirmed or finalized")
+        self.client = client
+        self.commitment = commitment
+        self.poll_interval = poll_interval
+        self.pending = {}
+        self.condition = threading.Condition()
+        self.stopped = False
+        self.thread = None
+
+    def __len__(self):
+        return len(self.pending)
+
+    def track(self, signature, last_valid_block_height=None, callback=None):
+        """
+        Start tracking a transaction signature.
+
+        Arguments:
+            signature (str|Signature): The transaction signature.
+            last_valid_block_height (int): The block height after which the
+                transaction can't land anymore. If not specified, the
+                transaction never expires.
+            callback (callable): Function called with the future once the
+                outcome is known.
+
+        Returns:
+            (Future): Future resolved with the outcome of the transaction.
+        """
+        if isinstance(signature, str):
+            signature = Signature.from_string(signature)
+        future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        with self.condition:
+            existing = self.pending.get(signature)
+            if existing is not None:
+                existing.future.add_done_callback(
+                    lambda done: copy_future_outcome(done, future)
+                )
+                return future
+            self.pending[signature] = PendingSignature(
+                signature,
+                last_valid_block_height,
+                future
+            )
+            if self.thread is None:
+                self.start()
+            self.condition.notify()
+        return future
+
+    def start(self):
+        """
+        Start the background polling thread.
+        """
+        self.stopped = False
+        self.thread = threading.Thread(
+            target=self.run,
+            name="confirmation-tracker",
+            daemon=True
+        )
+        self.thread.start()
+
+    def stop(self):
+        """
+        Stop the background polling thread. Pending futures stay unresolved.
+        """
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.stopped:
+                    self.condition.wait()
+                if self.stopped:
+                    return
+            try:
+                self.poll()
+            except Exception:
+                pass
+            with self.condition:
+                if self.stopped:
+                    return
+                self.condition.wait(self.poll_interval)
+
+    def poll(self):
+        """
+        Run one polling round over all the pending signatures.
+        """
+        with self.condition:
+            pending = list(self.pending.values())
+        if not pending:
+            return
+        unresolved = []
+        for start in range(0, len(pending), MAX_SIGNATURES_PER_REQUEST):
+            chunk = pending[start:start + MAX_SIGNATURES_PER_REQUEST]
+            statuses = self.client.get_signature_statuses(
+                [item.signature for item in chunk]
+            ).value
+            unresolved.extend(self.apply_statuses(chunk, statuses))
+        expirable = [
+            item for item in unresolved
+            if item.last_valid_block_height is not None
+        ]
+        if expirable:
+            self.expire(expirable, self.client.get_block_height().value)
+
+    def apply_statuses(self, chunk, statuses):
+        """
+        Resolve the signatures whose status reached the commitment level.
+
+        Returns:
+            (list): The signatures without status yet.
+        """
+        target = commitment_levels[self.commitment]
+        unresolved = []
+        for item, status in zip(chunk, statuses):
+            if status is None:
+                unresolved.append(item)
+            elif status.err is not None:
+                self.resolve(
+                    item,
+                    exception=TransactionFailedException(status.err)
+                )
+            else:
+                # A missing confirmation status means the block is rooted.
+                level = commitment_levels[FINALIZED]
+                if status.confirmation_status is not None:
+                    level = int(status.confirmation_status)
+                if level >= target:
+                    self.resolve(
+                        item,
+                        FINALIZED
+                        if level == commitment_levels[FINALIZED]
+                        else CONFIRMED
+                    )
+        return unresolved
+
+    def expire(self, items, block_height):
+        for item in items:
+            if block_height > item.last_valid_block_height:
+                self.resolve(item, EXPIRED)
+
+    def resolve(self, item, outcome=None, exception=None):
+        with self.condition:
+            self.pending.pop(item.signature, None)
+        if item.future.done():
+            return
+        if exception is not None:
+            item.future.set_exception(exception)
+        else:
+            item.future.set_result(outcome)
+
+
+class AsyncConfirmationTracker(ConfirmationTracker):
+    """
+    Asynchronous version of the `ConfirmationTracker`, polling the statuses
+    with the Solana `AsyncClient` in a task of the event loop. The tracked
+    signatures get asyncio futures.
+    """
+
+    def __init__(self, client, commitment=CONFIRMED, poll_interval=1.0):
+        super().__init__(client, commitment, poll_interval)
+        self.task = None
+        self.wakeup = None
+
+    def track(self, signature, last_valid_block_height=None, callback=None):
+        """
+        Start tracking a transaction signature. It must be called from the
+        event loop.
+
+        Returns:
+            (asyncio.Future): Future resolved with the outcome of the
+                transaction.
+        """
+        if isinstance(signature, str):
+            signature = Signature.from_string(signature)
+        future = asyncio.get_running_loop().create_future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        existing = self.pending.get(signature)
+        if existing is not None:
+            existing.future.add_done_callback(
+                lambda done: copy_future_outcome(done, future)
+            )
+            return future
+        self.pending[signature] = PendingSignature(
+            signature,
+            last_valid_block_height,
+            future
+        )
+        if self.task is None or self.task.done():
+            self.start()
+        self.wakeup.set()
+        return future
+
+    def start(self):
+        """
+        Start the polling task.
+        """
+        self.stopped = False
+        self.wakeup = asyncio.Event()
+        self.task = asyncio.get_running_loop().create_task(self.run())
+
+    def stop(self):
+        """
+        Cancel the polling task. Pending futures stay unresolved.
+        """
+        self.stopped = True
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    async def run(self):
+        while not self.stopped:
+            if not self.pending:
+                self.wakeup.clear()
+                await self.wakeup.wait()
+                continue
+            try:
+                await self.poll()
+            except Exception:
+                pass
+            await asyncio.sleep(self.poll_interval)
+
+    async def poll(self):
+        pending = list(self.pending.values())
+        if not pending:
+            return
+        unresolved = []
+        for start in range(0, len(pending), MAX_SIGNATURES_PER_REQUEST):
+            chunk = pending[start:start + MAX_SIGNATURES_PER_REQUEST]
+            statuses = (await self.client.get_signature_statuses(
+                [item.signature for item in chunk]
+            )).value
+            unresolved.extend(self.apply_statuses(chunk, statuses))
+        expirable = [
+            item for item in unresolved
+            if item.last_valid_block_height is not None
+        ]
+        if expirable:
+            block_height = (await self.client.get_block_height()).value
+            self.expire(expirable, block_height)
+
+
+def copy_future_outcome(source, target):
+    if target.done():
+        return
+    if source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
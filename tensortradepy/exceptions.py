@@ -21,3 +21,27 @@ class TransactionFailedException(Exception):
     Raised when the Solana transaction fails to execute.
     """
     pass
+
+
+class RateLimitException(Exception):
+    """
+    Raised when the Tensor server keeps throttling (429 errors) or failing
+    (5xx errors) the request after all the retries.
+    """
+    pass
+
+
+class TransactionExpiredException(Exception):
+    """
+    Raised when a prepared transaction is submitted after the expiration of
+    its blockhash (its last valid block height is passed).
+    """
+    pass
+
+
+class HistoryCorruptedException(Exception):
+    """
+    Raised when a column file of the history store holds fewer rows than
+    the partition recorded as written.
+    """
+    pass
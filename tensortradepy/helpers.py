@@ -1,3 +1,9 @@
+import json
+from functools import lru_cache
+
+from .serializers import default_json
+
+
 default_return = {
     "txs": {
         "lastValidBlockHeight": None,
@@ -6,6 +12,23 @@ default_return = {
     }
 }
 
+collection_metadata_fields = ("id", "slug", "firstListDate", "name")
+
+collection_stats_fields = """id
+      slug
+      firstListDate
+      name
+      statsV2 {
+        currency
+        buyNowPrice
+        buyNowPriceNetFees
+        sellNowPrice
+        sellNowPriceNetFees
+        numListed
+        numMints
+      }"""
+
+
 def build_tensor_query(
     name,
     sub_name,
@@ -42,3 +65,197 @@ def build_tensor_query(
   }
 }
 """ % (name, params, sub_name, sub_params, result_variables)
+
+
+def build_collections_query(slug_count, fields=collection_stats_fields):
+    """
+    Build a query fetching several collections at once. Each collection is
+    aliased `c0`, `c1`... and its slug is given by the `slug0`, `slug1`...
+    variables.
+    """
+    params = ", ".join(
+        "$slug%d: String!" % index for index in range(slug_count)
+    )
+    aliases = "\n".join(
+        """  c%d: instrumentTV2(slug: $slug%d) {
+      %s
+  }""" % (index, index, fields)
+        for index in range(slug_count)
+    )
+    return """query CollectionsStatsBatch(%s) {
+%s
+}
+""" % (params, aliases)
+
+
+class CompiledQuery:
+    """
+    A GraphQL query built once, with the start of its request body already
+    serialized. Only the variables are encoded when the query is sent.
+    """
+    __slots__ = ("name", "query", "body_prefix")
+
+    def __init__(self, name, query):
+        self.name = name
+        self.query = query
+        self.body_prefix = (
+            '{"query": %s, "variables": ' % json.dumps(query)
+        ).encode("utf-8")
+
+    def __str__(self):
+        return self.query
+
+    def encode(self, variables, serializer=default_json):
+        """
+        Build the request body for the given variables.
+        """
+        return self.body_prefix + serializer.dumps(variables) + b"}"
+
+
+query_registry = {}
+
+
+def freeze_return_format(return_format):
+    if return_format is default_return:
+        return frozen_default_return
+    return tuple(
+        (variable, None if value is None else freeze_return_format(value))
+        for (variable, value) in return_format.items()
+    )
+
+
+frozen_default_return = tuple(
+    (variable, None if value is None else freeze_return_format(value))
+    for (variable, value) in default_return.items()
+)
+
+
+def compile_tensor_query(
+    name,
+    sub_name,
+    parameters,
+    return_format=default_return
+):
+    """
+    Same as `build_tensor_query` but the query is compiled only once. The
+    result is stored in the registry, keyed by the query definition, and
+    reused by the next calls.
+
+    Returns:
+        (CompiledQuery): The compiled query.
+    """
+    key = (
+        name,
+        sub_name,
+        tuple(parameters),
+        freeze_return_format(return_format)
+    )
+    compiled = query_registry.get(key)
+    if compiled is None:
+        compiled = CompiledQuery(
+            name,
+            build_tensor_query(name, sub_name, parameters, return_format)
+        )
+        query_registry[key] = compiled
+    return compiled
+
+
+@lru_cache(maxsize=None)
+def compile_collections_query(slug_count):
+    """
+    Compiled version of `build_collections_query`.
+    """
+    return CompiledQuery(
+        "CollectionsStatsBatch",
+        build_collections_query(slug_count)
+    )
+
+
+collection_infos_query = CompiledQuery(
+    "CollectionsStats",
+    """query CollectionsStats($slug: String!) {
+  instrumentTV2(slug: $slug) {
+      %s
+  }
+}
+""" % collection_stats_fields
+)
+
+
+collection_volatile_stats_query = CompiledQuery(
+    "CollectionsVolatileStats",
+    """query CollectionsVolatileStats($slug: String!) {
+  instrumentTV2(slug: $slug) {
+      %s
+  }
+}
+""" % collection_stats_fields[collection_stats_fields.index("statsV2"):]
+)
+
+
+active_listings_query = CompiledQuery(
+    "ActiveListingsV2",
+    """query ActiveListingsV2(
+  $slug: String!
+  $sortBy: ActiveListingsSortBy!
+  $filters: ActiveListingsFilters
+  $limit: Int
+  $cursor: ActiveListingsCursorInputV2
+) {
+  activeListingsV2(
+    slug: $slug
+    sortBy: $sortBy
+    filters: $filters
+    limit: $limit
+    cursor: $cursor
+  ) {
+    page {
+      endCursor {
+        str
+      }
+      hasMore
+    }
+    txs {
+      mint {
+        onchainId
+      }
+      tx {
+        sellerId
+        grossAmount
+        grossAmountUnit
+      }
+    }
+  }
+}
+"""
+)
+
+
+collection_bids_query = CompiledQuery(
+    "TcompBids",
+    """query TcompBids($slug: String!) {
+  tcompBids(slug: $slug) {
+    address
+    amount
+    filledQuantity
+    ownerAddress
+    quantity
+    target
+    targetId
+  }
+}
+"""
+)
+
+
+def encode_query_body(query, variables, serializer=default_json):
+    """
+    Serialize the request body of a GraphQL query. Compiled queries only
+    encode their variables.
+    """
+    if isinstance(query, CompiledQuery):
+        return query.encode(variables, serializer)
+    return serializer.dumps({
+        "query": query,
+        "variables": variables
+    })
@@ -0,0 +1,331 @@
+"""
+Local history of the collection stats, for analytics and backtests.
+
+Snapshots of `get_collection_infos` are appended to a columnar store: every
+column is a raw little-endian array in its own file, partitioned by slug and
+by (UTC) day:
+
+    root/theheist/2024-03-01/timestamp.f8
+    root/theheist/2024-03-01/buyNowPrice.i8
+    ...
+
+Recording a snapshot only appends a few bytes to each column file and a time
+range is loaded back as NumPy arrays without any parsing:
+
+    recorder = HistoryRecorder("history")
+    recorder.record_many(client.get_collections_infos(slugs))
+
+    reader = HistoryReader("history")
+    history = reader.load("theheist", start, end)
+    history["timestamp"], history["buyNowPrice"]
+
+Prices are stored in lamports, as returned by the API. Missing values are
+stored as `MISSING`.
+
+Each partition also holds a `rows` file with the number of complete rows.
+It is replaced atomically once every column is written, so the rows of an
+interrupted append are ignored by the readers and overwritten by the next
+append. A recorder expects to be the only writer of its store.
+"""
+import datetime
+import os
+import threading
+import time
+
+import numpy as np
+
+from .exceptions import HistoryCorruptedException
+
+
+# Column name -> dtype. The stats columns are the statsV2 fields.
+columns = {
+    "timestamp": np.dtype("<f8"),
+    "buyNowPrice": np.dtype("<i8"),
+    "sellNowPrice": np.dtype("<i8"),
+    "numListed": np.dtype("<i8"),
+    "numMints": np.dtype("<i8"),
+}
+
+MISSING = -1
+
+ROWS_FILE = "rows"
+
+
+def partition_day(timestamp):
+    """
+    Return the partition (UTC day, "YYYY-MM-DD") of a timestamp.
+    """
+    return datetime.datetime.fromtimestamp(
+        timestamp,
+        datetime.timezone.utc
+    ).strftime("%Y-%m-%d")
+
+
+def partition_days(start, end):
+    """
+    Return the partitions covering the [start, end] time range.
+    """
+    day = datetime.datetime.fromtimestamp(
+        start,
+        datetime.timezone.utc
+    ).date()
+    last = datetime.datetime.fromtimestamp(end, datetime.timezone.utc).date()
+    days = []
+    while day <= last:
+        days.append(day.strftime("%Y-%m-%d"))
+        day += datetime.timedelta(days=1)
+    return days
+
+
+def column_file(name):
+    return "%s.%s" % (name, columns[name].str[1:])
+
+
+def read_row_count(path):
+    """
+    Return the number of complete rows of a partition.
+    """
+    try:
+        with open(os.path.join(path, ROWS_FILE)) as f:
+            return int(f.read())
+    except FileNotFoundError:
+        return 0
+
+
+def write_row_count(path, count, sync=True):
+    filename = os.path.join(path, ROWS_FILE)
+    temporary = filename + ".tmp"
+    with open(temporary, "w") as f:
+        f.write(str(count))
+        if sync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(temporary, filename)
+
+
+def stats_row(data, timestamp):
+    """
+    Convert a `get_collection_infos` response to a row of the store.
+    """
+    stats = (data or {}).get("statsV2") or {}
+    row = [timestamp]
+    for name in list(columns)[1:]:
+        value = stats.get(name)
+        row.append(MISSING if value is None else int(value))
+    return row
+
+
+class HistoryRecorder:
+    """
+    Append collection stats snapshots to the columnar store.
+    """
+
+    def __init__(self, root, sync=True):
+        """
+        Arguments:
+            root (str): The directory of the store. It is created if needed.
+            sync (bool): Flush the column files to the disk before
+                committing the rows, so they survive a system crash too.
+        """
+        self.root = root
+        self.sync = sync
+        self.lock = threading.Lock()
+
+    def partition_path(self, slug, day):
+        if not slug or "/" in slug or os.sep in slug or slug.startswith("."):
+            raise ValueError("Invalid collection slug: %r" % slug)
+        return os.path.join(self.root, slug, day)
+
+    def append(self, slug, rows):
+        """
+        Append rows ([timestamp, buyNowPrice, sellNowPrice, numListed,
+        numMints]) to the partitions of a collection.
+        """
+        partitions = {}
+        for row in rows:
+            partitions.setdefault(partition_day(row[0]), []).append(row)
+        with self.lock:
+            for day, day_rows in partitions.items():
+                path = self.partition_path(slug, day)
+                os.makedirs(path, exist_ok=True)
+                count = read_row_count(path)
+                for index, (name, dtype) in enumerate(columns.items()):
+                    values = np.array(
+                        [row[index] for row in day_rows],
+                        dtype=dtype
+                    )
+                    self.append_column(
+                        os.path.join(path, column_file(name)),
+                        count * dtype.itemsize,
+                        values.tobytes()
+                    )
+                write_row_count(path, count + len(day_rows), self.sync)
+
+    def append_column(self, filename, size, data):
+        with open(filename, "ab") as f:
+            if f.tell() < size:
+                raise HistoryCorruptedException(
+                    "%s is shorter than its written rows" % filename
+                )
+            # Drop the rows of an interrupted append before writing.
+            if f.tell() > size:
+                f.truncate(size)
+            f.write(data)
+            if self.sync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def record(self, slug, data, timestamp=None):
+        """
+        Record a `get_collection_infos` snapshot.
+
+        Arguments:
+            slug (str): The collection slug.
+            data (dict): The collection information.
+            timestamp (float): The time of the snapshot. Defaults to now.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        self.append(slug, [stats_row(data, timestamp)])
+
+    def record_many(self, infos, timestamp=None):
+        """
+        Record the `get_collections_infos` snapshots of several collections.
+        Unknown collections (None) are skipped.
+
+        Arguments:
+            infos (dict): The collection information keyed by slug.
+            timestamp (float): The time of the snapshots. Defaults to now.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        for slug, data in infos.items():
+            if data is not None:
+                self.append(slug, [stats_row(data, timestamp)])
+
+
+class HistoryReader:
+    """
+    Load time ranges of the columnar store as NumPy arrays.
+    """
+
+    def __init__(self, root, mmap=False):
+        """
+        Arguments:
+            root (str): The directory of the store.
+            mmap (bool): Memory-map the column files instead of reading
+                them. Only the rows of the range are then paged in.
+        """
+        self.root = root
+        self.mmap = mmap
+
+    def slugs(self):
+        """
+        Return the recorded collections.
+        """
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(
+            name for name in os.listdir(self.root)
+            if os.path.isdir(os.path.join(self.root, name))
+        )
+
+    def days(self, slug):
+        """
+        Return the recorded days of a collection.
+        """
+        path = os.path.join(self.root, slug)
+        if not os.path.isdir(path):
+            return []
+        return sorted(os.listdir(path))
+
+    def read_column(self, path, name, count):
+        filename = os.path.join(path, column_file(name))
+        dtype = columns[name]
+        size = os.path.getsize(filename) if os.path.exists(filename) else 0
+        if size < count * dtype.itemsize:
+            raise HistoryCorruptedException(
+                "%s holds %d rows, %d were written"
+                % (filename, size // dtype.itemsize, count)
+            )
+        if count == 0:
+            return np.empty(0, dtype=dtype)
+        if self.mmap:
+            return np.memmap(filename, dtype=dtype, mode="r", shape=(count,))
+        return np.fromfile(filename, dtype=dtype, count=count)
+
+    def read_partition(self, slug, day, names):
+        """
+        Read the complete rows of a partition. The rows of an interrupted
+        append are ignored.
+
+        Raises:
+            HistoryCorruptedException: A column lost rows.
+        """
+        path = os.path.join(self.root, slug, day)
+        count = read_row_count(path)
+        return {name: self.read_column(path, name, count) for name in names}
+
+    def load(self, slug, start=None, end=None, names=None):
+        """
+        Load the snapshots of a collection within a time range.
+
+        Arguments:
+            slug (str): The collection slug.
+            start (float): The first timestamp. Defaults to the first
+                recorded day.
+            end (float): The last timestamp. Defaults to now.
+            names (list): The columns to load. Defaults to all of them.
+
+        Returns:
+            (dict): The arrays keyed by column name, sorted by timestamp.
+
+        Raises:
+            HistoryCorruptedException: A column file lost rows.
+        """
+        names = list(names or columns)
+        if "timestamp" not in names:
+            names.insert(0, "timestamp")
+        if end is None:
+            end = time.time()
+        recorded = self.days(slug)
+        if start is None:
+            if not recorded:
+                start = end
+            else:
+                start = datetime.datetime.strptime(
+                    recorded[0],
+                    "%Y-%m-%d"
+                ).replace(tzinfo=datetime.timezone.utc).timestamp()
+        recorded = set(recorded)
+        parts = [
+            self.read_partition(slug, day, names)
+            for day in partition_days(start, end)
+            if day in recorded
+        ]
+        if not parts:
+            return {name: np.empty(0, dtype=columns[name]) for name in names}
+        history = {
+            name: np.concatenate([part[name] for part in parts])
+            for name in names
+        }
+        timestamps = history["timestamp"]
+        selected = (timestamps >= start) & (timestamps <= end)
+        order = np.argsort(timestamps[selected], kind="stable")
+        return {
+            name: values[selected][order] for name, values in history.items()
+        }
+
+    def floors(self, slug, start=None, end=None):
+        """
+        Load the floor prices (in SOL) of a collection. Missing prices are
+        NaN.
+
+        Returns:
+            (tuple): The timestamps and floor prices arrays.
+        """
+        history = self.load(slug, start, end, ["buyNowPrice"])
+        prices = history["buyNowPrice"]
+        floors = prices / 1_000_000_000
+        floors[prices == MISSING] = np.nan
+        return history["timestamp"], floors
@@ -0,0 +1,222 @@
+import bisect
+import logging
+import threading
+import time
+from contextlib import nullcontext
+
+
+# The stages timed by the client, in execution order.
+STAGES = (
+    "query_build",
+    "http_send",
+    "json_decode",
+    "tx_extract",
+    "deserialize",
+    "sign",
+    "rpc_submit",
+)
+
+
+def build_context(name=None, variables=None):
+    """
+    Build the context of a call: the operation name and the mint or slug it
+    targets.
+    """
+    context = {}
+    if name is not None:
+        context["operation"] = name
+    for field in ("mint", "slug"):
+        if variables and variables.get(field) is not None:
+            context[field] = variables[field]
+    return context
+
+
+class Instrumentation:
+    """
+    Default instrumentation: it doesn't record anything.
+
+    Subclasses return a context manager from `span`, which wraps the
+    execution of a stage (see `STAGES`). `context` gives the operation name
+    and the mint or slug of the call.
+    """
+
+    null_span = nullcontext()
+
+    def span(self, stage, context=None):
+        return self.null_span
+
+
+class Span:
+    __slots__ = ("instrumentation", "stage", "context", "start")
+
+    def __init__(self, instrumentation, stage, context):
+        self.instrumentation = instrumentation
+        self.stage = stage
+        self.context = context
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.instrumentation.record(
+            self.stage,
+            time.perf_counter() - self.start,
+            self.context or {},
+            exc
+        )
+
+
+class TimingInstrumentation(Instrumentation):
+    """
+    Base class of the instrumentations measuring the stage durations.
+    Subclasses implement `record`.
+    """
+
+    def span(self, stage, context=None):
+        return Span(self, stage, context)
+
+    def record(self, stage, duration, context, error=None):
+        """
+        Called at the end of each stage.
+
+        Arguments:
+            stage (str): The stage name.
+            duration (float): The duration of the stage in seconds.
+            context (dict): The context of the call.
+            error (Exception): The exception raised by the stage, if any.
+        """
+        raise NotImplementedError
+
+
+class Histogram:
+    """
+    Latency histogram with exponential buckets, from 0.1ms to ~100s.
+    """
+    bounds = [0.0001 * 2 ** index for index in range(21)]
+
+    def __init__(self):
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.errors = 0
+
+    def add(self, duration, error=None):
+        self.counts[bisect.bisect_left(self.bounds, duration)] += 1
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        if error is not None:
+            self.errors += 1
+
+    def percentile(self, rank):
+        """
+        Return the upper bound of the bucket holding the given percentile.
+        """
+        if not self.count:
+            return None
+        threshold = rank / 100 * self.count
+        cumulated = 0
+        for index, count in enumerate(self.counts):
+            cumulated += count
+            if cumulated >= threshold and count:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], self.max)
+                return self.max
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class HistogramCollector(TimingInstrumentation):
+    """
+    Keep a latency histogram in memory for each stage. Histograms can be
+    split by a context field, like the operation name or the mint.
+    """
+
+    def __init__(self, group_by=None):
+        """
+        Arguments:
+            group_by (str): The context field used to split the histograms
+                ("operation", "mint" or "slug"). If not specified, there is
+                one histogram per stage.
+        """
+        self.group_by = group_by
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    def record(self, stage, duration, context, error=None):
+        key = stage
+        if self.group_by is not None:
+            key = (stage, context.get(self.group_by))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.add(duration, error)
+
+    def summary(self):
+        """
+        Return the count, mean, p50, p99 and max duration (in seconds) of
+        each histogram.
+        """
+        with self.lock:
+            return {
+                key: histogram.summary()
+                for (key, histogram) in self.histograms.items()
+            }
+
+    def reset(self):
+        with self.lock:
+            self.histograms.clear()
+
+
+class LoggingInstrumentation(TimingInstrumentation):
+    """
+    Log the duration of each stage.
+    """
+
+    def __init__(self, logger=None, level=logging.DEBUG):
+        self.logger = logger or logging.getLogger("tensortradepy")
+        self.level = level
+
+    def record(self, stage, duration, context, error=None):
+        self.logger.log(
+            self.level,
+            "%s took %.3fms %s%s",
+            stage,
+            duration * 1000,
+            " ".join("%s=%s" % item for item in context.items()),
+            " (failed: %r)" % error if error is not None else ""
+        )
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """
+    Export each stage as an OpenTelemetry span. The context of the call is
+    given as span attributes.
+    """
+
+    def __init__(self, tracer):
+        """
+        Arguments:
+            tracer: An OpenTelemetry tracer, for instance
+                `opentelemetry.trace.get_tracer("tensortradepy")`.
+        """
+        self.tracer = tracer
+
+    def span(self, stage, context=None):
+        return self.tracer.start_as_current_span(
+            "tensortradepy.%s" % stage,
+            attributes=context or {}
+        )
@@ -0,0 +1,291 @@
+"""
+Compact result types. Lamport amounts are kept as ints, as returned by the
+API, and converted to SOL only when the SOL properties are read.
+"""
+from .solana import from_solami
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def lamports(value):
+    return None if value is None else int(value)
+
+
+def sol(value):
+    return None if value is None else from_solami(value)
+
+
+class CollectionStats:
+    """
+    The information of a collection (`get_collection_infos`). Prices are in
+    lamports, their `*_sol` properties give them in SOL.
+    """
+
+    __slots__ = (
+        "id",
+        "slug",
+        "name",
+        "first_list_date",
+        "currency",
+        "buy_now_price",
+        "buy_now_price_net_fees",
+        "sell_now_price",
+        "sell_now_price_net_fees",
+        "num_listed",
+        "num_mints",
+    )
+
+    def __init__(
+        self,
+        id,
+        slug,
+        name,
+        first_list_date,
+        currency,
+        buy_now_price,
+        buy_now_price_net_fees,
+        sell_now_price,
+        sell_now_price_net_fees,
+        num_listed,
+        num_mints
+    ):
+        self.id = id
+        self.slug = slug
+        self.name = name
+        self.first_list_date = first_list_date
+        self.currency = currency
+        self.buy_now_price = buy_now_price
+        self.buy_now_price_net_fees = buy_now_price_net_fees
+        self.sell_now_price = sell_now_price
+        self.sell_now_price_net_fees = sell_now_price_net_fees
+        self.num_listed = num_listed
+        self.num_mints = num_mints
+
+    @classmethod
+    def from_infos(cls, data):
+        """
+        Convert a `get_collection_infos` response. None for unknown
+        collections.
+        """
+        if not data:
+            return None
+        stats = data.get("statsV2") or {}
+        return cls(
+            data.get("id"),
+            data.get("slug"),
+            data.get("name"),
+            data.get("firstListDate"),
+            stats.get("currency"),
+            lamports(stats.get("buyNowPrice")),
+            lamports(stats.get("buyNowPriceNetFees")),
+            lamports(stats.get("sellNowPrice")),
+            lamports(stats.get("sellNowPriceNetFees")),
+            stats.get("numListed"),
+            stats.get("numMints")
+        )
+
+    @property
+    def floor(self):
+        """
+        The floor price (buyNow) in SOL, None if nothing is listed.
+        """
+        return sol(self.buy_now_price)
+
+    @property
+    def sell_now_price_sol(self):
+        return sol(self.sell_now_price)
+
+    @property
+    def buy_now_price_net_fees_sol(self):
+        return sol(self.buy_now_price_net_fees)
+
+    @property
+    def sell_now_price_net_fees_sol(self):
+        return sol(self.sell_now_price_net_fees)
+
+    def __repr__(self):
+        return "CollectionStats(%s, floor=%s, listed=%s)" % (
+            self.slug,
+            self.floor,
+            self.num_listed
+        )
+
+
+class PoolInfo:
+    """
+    A pool created by `create_pool`. Prices are in lamports, the `delta` of
+    EXPONENTIAL pools is in basis points.
+    """
+
+    __slots__ = (
+        "address",
+        "slug",
+        "owner",
+        "pool_type",
+        "curve_type",
+        "starting_price",
+        "delta",
+        "compound_fees",
+        "fee_bps",
+        "signature",
+    )
+
+    def __init__(
+        self,
+        address,
+        slug,
+        owner,
+        pool_type,
+        curve_type,
+        starting_price,
+        delta,
+        compound_fees,
+        fee_bps,
+        signature=None
+    ):
+        self.address = address
+        self.slug = slug
+        self.owner = owner
+        self.pool_type = pool_type
+        self.curve_type = curve_type
+        self.starting_price = starting_price
+        self.delta = delta
+        self.compound_fees = compound_fees
+        self.fee_bps = fee_bps
+        self.signature = signature
+
+    @classmethod
+    def from_response(cls, data, variables):
+        """
+        Build the pool of a `tswapInitPoolTx` response.
+
+        Arguments:
+            data (dict): The GraphQL response (with its `signature`).
+            variables (dict): The variables of the query.
+        """
+        config = variables["config"]
+        return cls(
+            data["tswapInitPoolTx"]["pool"],
+            variables["slug"],
+            variables["owner"],
+            config["poolType"],
+            config["curveType"],
+            int(config["startingPrice"]),
+            int(config["delta"]),
+            config["mmCompoundFees"],
+            config["mmFeeBps"],
+            data.get("signature")
+        )
+
+    @property
+    def starting_price_sol(self):
+        return sol(self.starting_price)
+
+    def __repr__(self):
+        return "PoolInfo(%s, %s, %s, starting_price=%s)" % (
+            self.address,
+            self.slug,
+            self.pool_type,
+            self.starting_price_sol
+        )
+
+
+class CollectionStatsBatch:
+    """
+    The information of many collections stored column by column, in NumPy
+    arrays indexed like `slugs`. Lamport columns are int64, missing values
+    are -1 (NaN in the SOL columns). Requires NumPy.
+
+        batch = client.get_collections_stats(slugs)
+        cheap = batch.slugs_where(batch.floors < 1.5)
+    """
+
+    # Attribute name -> statsV2 field.
+    columns = {
+        "buy_now_price": "buyNowPrice",
+        "sell_now_price": "sellNowPrice",
+        "num_listed": "numListed",
+        "num_mints": "numMints",
+    }
+
+    def __init__(self, slugs, arrays):
+        """
+        Arguments:
+            slugs (list): The collection slugs.
+            arrays (dict): The column arrays by attribute name.
+        """
+        self.slugs = list(slugs)
+        self.index = {slug: position for position, slug in enumerate(slugs)}
+        for name in self.columns:
+            setattr(self, name, arrays[name])
+
+    @classmethod
+    def from_infos(cls, infos):
+        """
+        Convert a `get_collections_infos` result (dict keyed by slug).
+        """
+        if np is None:
+            raise ImportError(
+                "CollectionStatsBatch requires NumPy "
+                "(pip install tensortradepy[numpy])"
+            )
+        slugs = list(infos)
+        arrays = {
+            name: np.full(len(slugs), -1, dtype=np.int64)
+            for name in cls.columns
+        }
+        for position, slug in enumerate(slugs):
+            stats = (infos[slug] or {}).get("statsV2")
+            if not stats:
+                continue
+            for name, field in cls.columns.items():
+                value = stats.get(field)
+                if value is not None:
+                    arrays[name][position] = int(value)
+        return cls(slugs, arrays)
+
+    def __len__(self):
+        return len(self.slugs)
+
+    def __contains__(self, slug):
+        return slug in self.index
+
+    def to_sol(self, values):
+        prices = values / 1_000_000_000
+        prices[values < 0] = np.nan
+        return prices
+
+    @property
+    def floors(self):
+        """
+        The floor prices in SOL, NaN for unknown or unlisted collections.
+        """
+        return self.to_sol(self.buy_now_price)
+
+    @property
+    def sell_now_prices(self):
+        return self.to_sol(self.sell_now_price)
+
+    def slugs_where(self, mask):
+        """
+        Return the slugs selected by a boolean mask over the collections.
+        """
+        return [self.slugs[position] for position in np.flatnonzero(mask)]
+
+    def get(self, slug):
+        """
+        Return the (buy_now_price, sell_now_price, num_listed, num_mints)
+        row of a collection, in lamports, None if it is not in the batch.
+        """
+        position = self.index.get(slug)
+        if position is None:
+            return None
+        return tuple(
+            int(getattr(self, name)[position]) for name in self.columns
+        )
+
+    def __repr__(self):
+        return "<CollectionStatsBatch %d collections>" % len(self)
@@ -0,0 +1,268 @@
+import bisect
+import threading
+
+from .solana import from_solami
+
+
+class Listing:
+    __slots__ = ("mint", "seller", "price")
+
+    def __init__(self, mint, seller, price):
+        self.mint = mint
+        self.seller = seller
+        self.price = price
+
+    def __repr__(self):
+        return "Listing(%s, seller=%s, price=%s)" % (
+            self.mint,
+            self.seller,
+            self.price
+        )
+
+
+class Bid:
+    __slots__ = ("address", "owner", "price", "quantity")
+
+    def __init__(self, address, owner, price, quantity):
+        self.address = address
+        self.owner = owner
+        self.price = price
+        self.quantity = quantity
+
+    def __repr__(self):
+        return "Bid(%s, owner=%s, price=%s, quantity=%s)" % (
+            self.address,
+            self.owner,
+            self.price,
+            self.quantity
+        )
+
+
+def parse_listing(item):
+    """
+    Convert an `activeListingsV2` item to a `Listing` (price in SOL).
+    """
+    return Listing(
+        item["mint"]["onchainId"],
+        item["tx"]["sellerId"],
+        from_solami(item["tx"]["grossAmount"])
+    )
+
+
+def parse_bid(item):
+    """
+    Convert a `tcompBids` item to a `Bid` (price in SOL). The quantity is
+    the remaining one.
+    """
+    return Bid(
+        item["address"],
+        item["ownerAddress"],
+        from_solami(item["amount"]),
+        item["quantity"] - (item.get("filledQuantity") or 0)
+    )
+
+
+def parse_listings_page(data):
+    """
+    Parse an `activeListingsV2` page.
+
+    Returns:
+        (tuple): The listings and the cursor of the next page, None if it is
+            the last page.
+    """
+    result = data.get("activeListingsV2") or {}
+    listings = [parse_listing(item) for item in result.get("txs") or []]
+    page = result.get("page") or {}
+    cursor = None
+    if page.get("hasMore"):
+        cursor = (page.get("endCursor") or {}).get("str")
+    return listings, cursor
+
+
+def listings_variables(slug, limit, sort_by, cursor=None):
+    return {
+        "slug": slug,
+        "sortBy": sort_by,
+        "filters": None,
+        "limit": limit,
+        "cursor": {"str": cursor} if cursor is not None else None,
+    }
+
+
+class PriceIndex:
+    """
+    Entries sorted by (price, key), with the entry of each key. Price
+    ranges and entries are located by bisection.
+    """
+
+    def __init__(self):
+        self.keys = []
+        self.entries = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def add(self, key, entry):
+        self.remove(key)
+        bisect.insort(self.keys, (entry.price, key))
+        self.entries[key] = entry
+
+    def remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return None
+        index = bisect.bisect_left(self.keys, (entry.price, key))
+        del self.keys[index]
+        return entry
+
+    def ascending(self, count=None, max_price=None):
+        end = len(self.keys)
+        if max_price is not None:
+            end = bisect.bisect_right(self.keys, (max_price, chr(0x10FFFF)))
+        if count is not None:
+            end = min(end, count)
+        return [self.entries[key] for (_, key) in self.keys[:end]]
+
+    def descending(self, count=None, min_price=None):
+        start = 0
+        if min_price is not None:
+            start = bisect.bisect_left(self.keys, (min_price, ""))
+        if count is not None:
+            start = max(start, len(self.keys) - count)
+        return [self.entries[key] for (_, key) in reversed(self.keys[start:])]
+
+
+class OrderBook:
+    """
+    Local copy of the listings and collection bids of a collection, indexed
+    by price and by mint (or bid address).
+
+    The book is updated incrementally, listing by listing, and queries like
+    the cheapest listings under a price or the best bid are answered from
+    the sorted index without calling the API.
+    """
+
+    def __init__(self, slug):
+        self.slug = slug
+        self.listings = PriceIndex()
+        self.bids = PriceIndex()
+        self.lock = threading.RLock()
+
+    def __repr__(self):
+        return "<OrderBook %s listings=%d bids=%d>" % (
+            self.slug,
+            len(self.listings),
+            len(self.bids)
+        )
+
+    def add_listing(self, listing):
+        """
+        Add a listing, or update the price of a listed mint.
+        """
+        with self.lock:
+            self.listings.add(listing.mint, listing)
+
+    def remove_listing(self, mint):
+        """
+        Remove the listing of a mint (sold or delisted).
+        """
+        with self.lock:
+            return self.listings.remove(mint)
+
+    def add_bid(self, bid):
+        """
+        Add a bid, or update it. Bids without remaining quantity are
+        removed.
+        """
+        with self.lock:
+            if bid.quantity <= 0:
+                self.bids.remove(bid.address)
+            else:
+                self.bids.add(bid.address, bid)
+
+    def remove_bid(self, address):
+        with self.lock:
+            return self.bids.remove(address)
+
+    def replace_listings(self, listings):
+        """
+        Load a full snapshot of the listings: the given listings are added
+        or updated and the other ones are removed.
+
+        Arguments:
+            listings (iterable): The listings. They can be streamed page by
+                page, the book is updated as they arrive.
+        """
+        seen = set()
+        for listing in listings:
+            self.add_listing(listing)
+            seen.add(listing.mint)
+        self.retain_listings(seen)
+
+    def retain_listings(self, mints):
+        """
+        Remove the listings of the mints which are not in `mints`.
+        """
+        with self.lock:
+            for mint in [
+                mint for mint in self.listings.entries if mint not in mints
+            ]:
+                self.listings.remove(mint)
+
+    def replace_bids(self, bids):
+        """
+        Load a full snapshot of the bids.
+        """
+        with self.lock:
+            self.bids = PriceIndex()
+            for bid in bids:
+                self.add_bid(bid)
+
+    def listing(self, mint):
+        """
+        Return the listing of a mint, None if it is not listed.
+        """
+        with self.lock:
+            return self.listings.get(mint)
+
+    def floor(self):
+        """
+        Return the cheapest listing, None if there is no listing.
+        """
+        cheapest = self.cheapest(1)
+        return cheapest[0] if cheapest else None
+
+    def cheapest(self, count=1, max_price=None):
+        """
+        Return the cheapest listings, from the lowest price.
+
+        Arguments:
+            count (int): The maximum number of listings.
+            max_price (float): The highest price (in SOL) accepted.
+        """
+        with self.lock:
+            return self.listings.ascending(count, max_price)
+
+    def best_bid(self):
+        """
+        Return the highest bid, None if there is no bid.
+        """
+        best = self.best_bids(1)
+        return best[0] if best else None
+
+    def best_bids(self, count=1, min_price=None):
+        """
+        Return the highest bids, from the highest price.
+
+        Arguments:
+            count (int): The maximum number of bids.
+            min_price (float): The lowest price (in SOL) accepted.
+        """
+        with self.lock:
+            return self.bids.descending(count, min_price)
@@ -0,0 +1,97 @@
+import time
+
+from .solana import estimate_block_height
+
+
+class PreparedTransaction:
+    """
+    A transaction fetched from the Tensor Trade API, deserialized and signed
+    ahead of time. Submitting it with `TensorClient.submit` only costs the
+    RPC call sending it.
+
+    A prepared transaction expires with its blockhash, once the block height
+    passes `last_valid_block_height`.
+    """
+
+    __slots__ = (
+        "name",
+        "data",
+        "transaction",
+        "raw",
+        "last_valid_block_height",
+        "prepared_at",
+        "context",
+    )
+
+    def __init__(
+        self,
+        name,
+        data,
+        transaction,
+        raw,
+        last_valid_block_height,
+        context=None
+    ):
+        """
+        Arguments:
+            name (str): The name of the transaction.
+            data (dict): The GraphQL response.
+            transaction (Transaction): The deserialized transaction.
+            raw (bytes): The signed transaction, ready to be sent.
+            last_valid_block_height (int): The block height after which the
+                blockhash of the transaction expires.
+            context (dict): The context given to the instrumentation.
+        """
+        self.name = name
+        self.data = data
+        self.transaction = transaction
+        self.raw = raw
+        self.last_valid_block_height = last_valid_block_height
+        self.prepared_at = time.monotonic()
+        self.context = context
+
+    def estimate_block_height(self):
+        """
+        Estimate the current block height, assuming the blockhash of the
+        transaction was the latest one when it was prepared.
+        """
+        return estimate_block_height(
+            self.last_valid_block_height,
+            self.prepared_at
+        )
+
+    def blocks_left(self, block_height=None):
+        """
+        Return the number of blocks before the transaction expires.
+
+        Arguments:
+            block_height (int): The current block height. If not specified,
+                it is estimated from the preparation time.
+        """
+        if block_height is None:
+            block_height = self.estimate_block_height()
+        return self.last_valid_block_height - block_height
+
+    def is_expired(self, block_height=None):
+        return self.blocks_left(block_height) < 0
+
+    def update(self, raw, last_valid_block_height, fetched_at=None):
+        """
+        Replace the signed transaction after a blockhash refresh.
+
+        Arguments:
+            raw (bytes): The transaction signed with the new blockhash.
+            last_valid_block_height (int): The last valid block height of
+                the new blockhash.
+            fetched_at (float): When the new blockhash was fetched
+                (monotonic time). Defaults to now.
+        """
+        self.raw = raw
+        self.last_valid_block_height = last_valid_block_height
+        self.prepared_at = fetched_at or time.monotonic()
+
+    def __repr__(self):
+        return "PreparedTransaction(%s, last_valid_block_height=%s)" % (
+            self.name,
+            self.last_valid_block_height
+        )
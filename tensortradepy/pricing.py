@@ -0,0 +1,204 @@
+"""
+Local simulation of the pool bonding curves, to see the prices a pool will
+quote before calling `create_pool`.
+
+Every function accepts scalars or NumPy arrays for the pool parameters. The
+parameters are broadcast together and the steps of the curve are added as
+the last axis, so thousands of configurations can be evaluated at once:
+
+    prices = buy_quotes(
+        np.linspace(1, 2, 100)[:, None],  # starting prices
+        np.linspace(0.01, 0.1, 50),       # deltas
+        steps=20
+    )                                     # -> shape (100, 50, 20)
+
+Prices are in SOL. For LINEAR curves `delta` is in SOL, for EXPONENTIAL
+curves it is in basis points (100 = 1% per step). `fee_bps` has the same
+unit as the `fee_bps` argument of `create_pool`. `to_lamports` converts
+prices to exact lamport amounts.
+"""
+import numpy as np
+
+from .solana import LAMPORTS_PER_SOL, Lamports
+
+
+CURVE_TYPES = ("LINEAR", "EXPONENTIAL")
+
+
+def fee_rate(fee_bps):
+    """
+    Convert the `create_pool` fee to a rate (`create_pool` sends
+    `fee_bps * 100` basis points).
+    """
+    return np.asarray(fee_bps, dtype=np.float64) * 100 / 10_000
+
+
+def price_steps(starting_price, delta, steps, curve_type="LINEAR", direction=1):
+    """
+    Compute the successive prices of a curve.
+
+    Arguments:
+        starting_price (float|ndarray): The starting price of the pool.
+        delta (float|ndarray): The price change per step.
+        steps (int): The number of prices to compute.
+        curve_type (str): LINEAR or EXPONENTIAL.
+        direction (int): 1 for increasing prices, -1 for decreasing prices.
+
+    Returns:
+        (ndarray): The prices, steps on the last axis.
+    """
+    if curve_type not in CURVE_TYPES:
+        raise ValueError("Wrong curve type should be LINEAR or EXPONENTIAL")
+    start = np.asarray(starting_price, dtype=np.float64)[..., None]
+    delta = np.asarray(delta, dtype=np.float64)[..., None]
+    k = np.arange(steps, dtype=np.float64) * direction
+    if curve_type == "LINEAR":
+        return np.maximum(start + delta * k, 0.0)
+    return start * (1 + delta / 10_000) ** k
+
+
+def buy_quotes(starting_price, delta, steps, curve_type="LINEAR"):
+    """
+    Prices paid by the buyers of the NFTs of the pool, the first NFT being
+    sold at the starting price.
+
+    Returns:
+        (ndarray): The quote ladder, steps on the last axis.
+    """
+    return price_steps(starting_price, delta, steps, curve_type, 1)
+
+
+def sell_quotes(
+    starting_price,
+    delta,
+    steps,
+    curve_type="LINEAR",
+    fee_bps=0
+):
+    """
+    Proceeds received by the sellers of NFTs to the pool, the first NFT
+    being bought at the starting price. The pool fee is deducted.
+
+    Returns:
+        (ndarray): The quote ladder, steps on the last axis.
+    """
+    prices = price_steps(starting_price, delta, steps, curve_type, -1)
+    return net_of_fees(prices, fee_bps)
+
+
+def net_of_fees(prices, fee_bps):
+    """
+    Deduct the pool fee from prices.
+    """
+    fees = fee_rate(fee_bps)
+    if fees.ndim:
+        fees = fees[..., None]
+    return prices * (1 - fees)
+
+
+def fill_cost(starting_price, delta, count, curve_type="LINEAR"):
+    """
+    Cumulative cost of buying 1 to `count` NFTs from the pool.
+
+    Returns:
+        (ndarray): The cost of the first k items at index k - 1, on the last
+            axis.
+    """
+    return np.cumsum(
+        buy_quotes(starting_price, delta, count, curve_type),
+        axis=-1
+    )
+
+
+def fill_proceeds(
+    starting_price,
+    delta,
+    count,
+    curve_type="LINEAR",
+    fee_bps=0
+):
+    """
+    Cumulative proceeds, net of fees, of selling 1 to `count` NFTs to the
+    pool.
+
+    Returns:
+        (ndarray): The proceeds of the first k items at index k - 1, on the
+            last axis.
+    """
+    return np.cumsum(
+        sell_quotes(starting_price, delta, count, curve_type, fee_bps),
+        axis=-1
+    )
+
+
+def sweep(starting_prices, deltas, fee_bps, steps, curve_type="LINEAR"):
+    """
+    Evaluate every combination of starting price, delta and fee.
+
+    Arguments:
+        starting_prices (list): The starting prices to try.
+        deltas (list): The deltas to try.
+        fee_bps (list): The fees to try.
+        steps (int): The depth of the quote ladders.
+        curve_type (str): LINEAR or EXPONENTIAL.
+
+    Returns:
+        (dict): Arrays of shape (prices, deltas, fees, steps): `buy` and
+            `sell` quote ladders, `cost` and `proceeds` cumulative sums.
+    """
+    start = np.asarray(starting_prices, dtype=np.float64)[:, None, None]
+    delta = np.asarray(deltas, dtype=np.float64)[None, :, None]
+    fees = np.asarray(fee_bps, dtype=np.float64)[None, None, :]
+    shape = np.broadcast_shapes(start.shape, delta.shape, fees.shape)
+    buy = np.broadcast_to(
+        buy_quotes(start, delta, steps, curve_type),
+        shape + (steps,)
+    )
+    sell = sell_quotes(start, delta, steps, curve_type, fees)
+    return {
+        "buy": buy,
+        "sell": sell,
+        "cost": np.cumsum(buy, axis=-1),
+        "proceeds": np.cumsum(sell, axis=-1),
+    }
+
+
+def to_lamports(prices):
+    """
+    Convert prices in SOL to lamports, rounded to the nearest lamport.
+
+    The result is the same as `to_solami` for prices below 4 million SOL
+    (with at most 9 decimals), without converting each price to a Decimal.
+
+    Arguments:
+        prices (list|ndarray): The prices in SOL.
+
+    Returns:
+        (ndarray): The prices in lamports (int64).
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    return np.rint(prices * LAMPORTS_PER_SOL).astype(np.int64)
+
+
+def from_lamports(amounts):
+    """
+    Convert amounts in lamports to SOL.
+
+    Returns:
+        (ndarray): The amounts in SOL (float64).
+    """
+    return np.asarray(amounts, dtype=np.int64) / LAMPORTS_PER_SOL
+
+
+def as_lamports(amounts):
+    """
+    Convert an array of lamports to a list of `Lamports`, to pass them to
+    the client methods (a plain integer is read as a price in SOL).
+
+        prices = to_lamports(floors) - 1_000   # undercut by 1000 lamports
+        client.bulk_list(dict(zip(mints, as_lamports(prices))))
+
+    Returns:
+        (list): The `Lamports` amounts.
+    """
+    return [Lamports(amount) for amount in np.asarray(amounts).tolist()]
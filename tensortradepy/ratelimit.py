@@ -0,0 +1,191 @@
+import asyncio
+import email.utils
+import random
+import threading
+import time
+
+
+# Priority lanes: lower values are served first.
+PRIORITY_TRADE = 0
+PRIORITY_DEFAULT = 1
+PRIORITY_STATS = 2
+
+priorities = (PRIORITY_TRADE, PRIORITY_DEFAULT, PRIORITY_STATS)
+
+
+def parse_retry_after(value):
+    """
+    Convert a `Retry-After` header (seconds or HTTP date) to seconds.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
+
+
+class RequestScheduler:
+    """
+    Client-side rate limiter and retry policy for the Tensor Trade API.
+
+    Requests take a token from a token bucket before being sent. Waiting
+    requests are served by priority lane: trades (buys and cancels) go before
+    the other transactions, which go before the stats polling. Throttled
+    (429) and failed (5xx) requests are retried with a jittered exponential
+    backoff, or after the delay given by the `Retry-After` header, during
+    which the whole bucket is paused.
+
+    A scheduler is thread-safe and can be shared by several clients,
+    including asynchronous ones.
+    """
+
+    def __init__(
+        self,
+        rate=None,
+        burst=None,
+        max_retries=5,
+        backoff_base=0.5,
+        backoff_max=30.0
+    ):
+        """
+        Arguments:
+            rate (float): The maximum number of requests per second. None
+                to only apply the retry policy.
+            burst (int): The size of the token bucket. Defaults to `rate`.
+            max_retries (int): The number of retries before giving up.
+            backoff_base (float): The delay (in seconds) before the first
+                retry.
+            backoff_max (float): The maximum delay between two retries.
+        """
+        self.rate = rate
+        self.capacity = max(1.0, burst or rate or 1.0)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.condition = threading.Condition()
+        self.waiting = dict.fromkeys(priorities, 0)
+        self.requests = dict.fromkeys(priorities, 0)
+        self.wait_time = dict.fromkeys(priorities, 0.0)
+        self.max_wait_time = 0.0
+        self.retries = 0
+
+    def reserve(self, priority):
+        """
+        Try to take a token. Must be called with the condition held.
+
+        Returns:
+            (float): 0 if a token was taken, otherwise the delay to wait
+                before trying again.
+        """
+        now = time.monotonic()
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if any(self.waiting[lane] for lane in priorities if lane < priority):
+            return 1.0 / self.rate if self.rate else 0.01
+        if self.rate is None:
+            return 0
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self.updated) * self.rate
+        )
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+    def acquire(self, priority=PRIORITY_DEFAULT):
+        """
+        Block until the request can be sent.
+        """
+        start = time.monotonic()
+        with self.condition:
+            self.waiting[priority] += 1
+            try:
+                delay = self.reserve(priority)
+                while delay:
+                    self.condition.wait(delay)
+                    delay = self.reserve(priority)
+            finally:
+                self.waiting[priority] -= 1
+                self.condition.notify_all()
+            self.record(priority, time.monotonic() - start)
+
+    async def acquire_async(self, priority=PRIORITY_DEFAULT):
+        """
+        Coroutine version of `acquire`.
+        """
+        start = time.monotonic()
+        with self.condition:
+            self.waiting[priority] += 1
+        try:
+            while True:
+                with self.condition:
+                    delay = self.reserve(priority)
+                if not delay:
+                    break
+                await asyncio.sleep(delay)
+        finally:
+            with self.condition:
+                self.waiting[priority] -= 1
+                self.condition.notify_all()
+        with self.condition:
+            self.record(priority, time.monotonic() - start)
+
+    def record(self, priority, wait_time):
+        self.requests[priority] += 1
+        self.wait_time[priority] += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    def should_retry(self, status_code):
+        """
+        Tell if a response with this status code must be retried.
+        """
+        return status_code == 429 or status_code >= 500
+
+    def backoff(self, attempt, retry_after=None):
+        """
+        Compute the delay before the next attempt. A `Retry-After` delay
+        pauses every request sharing the scheduler.
+
+        Arguments:
+            attempt (int): The number of the failed attempt (from 0).
+            retry_after (str): The `Retry-After` header of the response.
+
+        Returns:
+            (float): The delay in seconds.
+        """
+        delay = parse_retry_after(retry_after)
+        with self.condition:
+            self.retries += 1
+            if delay is not None:
+                self.blocked_until = max(
+                    self.blocked_until,
+                    time.monotonic() + delay
+                )
+                return delay
+        delay = min(self.backoff_max, self.backoff_base * 2 ** attempt)
+        return delay * random.uniform(0.5, 1.0)
+
+    def metrics(self):
+        """
+        Return the queue depth and the wait time statistics.
+        """
+        with self.condition:
+            return {
+                "queue_depth": sum(self.waiting.values()),
+                "queue_depth_by_priority": dict(self.waiting),
+                "requests": dict(self.requests),
+                "wait_time": dict(self.wait_time),
+                "max_wait_time": self.max_wait_time,
+                "retries": self.retries,
+            }
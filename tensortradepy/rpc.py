@@ -0,0 +1,387 @@
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from solana.exceptions import SolanaRpcException
+from solana.rpc.api import Client
+from solana.rpc.async_api import AsyncClient
+
+from .solana import (
+    create_async_client,
+    create_client
+)
+
+
+# Errors on which a call is retried on the next endpoint. Other errors (like
+# a failing transaction simulation) are raised directly.
+transport_errors = (SolanaRpcException, requests.RequestException, OSError)
+
+
+class RpcEndpoint:
+    """
+    State of an RPC endpoint: its client, health and measured latency.
+    """
+
+    __slots__ = (
+        "url",
+        "client",
+        "healthy",
+        "latency",
+        "block_height",
+        "failures",
+    )
+
+    # Weight of the last probe in the latency moving average.
+    smoothing = 0.3
+
+    def __init__(self, url, client):
+        self.url = url
+        self.client = client
+        self.healthy = True
+        self.latency = None
+        self.block_height = None
+        self.failures = 0
+
+    def record_probe(self, latency, block_height):
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += self.smoothing * (latency - self.latency)
+        self.block_height = block_height
+        self.failures = 0
+        self.healthy = True
+
+    def record_failure(self, max_failures):
+        self.failures += 1
+        if self.failures >= max_failures:
+            self.healthy = False
+
+    def rank(self):
+        # Unprobed endpoints come after the probed ones.
+        return (self.latency is None, self.latency or 0.0)
+
+    def __repr__(self):
+        return "RpcEndpoint(%s, healthy=%s, latency=%s)" % (
+            self.url,
+            self.healthy,
+            self.latency
+        )
+
+
+class RpcPool:
+    """
+    Pool of Solana RPC endpoints usable in place of a Solana `Client`.
+
+    Every endpoint keeps its own connection pool. A background thread probes
+    them periodically (`getBlockHeight`) to measure their latency and to
+    detect the failing or lagging ones. Calls go to the fastest healthy
+    endpoint and are retried on the next one if the connection fails.
+    Signed transactions can be broadcast to several endpoints at once.
+    """
+
+    client_class = Client
+
+    def __init__(
+        self,
+        urls,
+        probe_interval=10.0,
+        broadcast=1,
+        max_failures=2,
+        max_lag=50,
+        timeout=10
+    ):
+        """
+        Arguments:
+            urls (list): The RPC endpoint URLs.
+            probe_interval (float): Seconds between two health probes.
+            broadcast (int): The number of endpoints to which a signed
+                transaction is sent. The fastest ones are used.
+            max_failures (int): The number of consecutive failures after
+                which an endpoint is considered unhealthy, until its next
+                successful probe.
+            max_lag (int): The number of blocks an endpoint can lag behind
+                the most advanced one while staying healthy.
+            timeout (float): The timeout (in seconds) of the RPC calls.
+        """
+        if not urls:
+            raise ValueError("At least one RPC endpoint is required")
+        self.probe_interval = probe_interval
+        self.broadcast = max(1, broadcast)
+        self.max_failures = max_failures
+        self.max_lag = max_lag
+        self.timeout = timeout
+        self.endpoints = [
+            RpcEndpoint(url, self.create_client(url)) for url in urls
+        ]
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+        # Separate pools, so a hung probe never delays a transaction.
+        self.probe_executor = self.create_executor("rpc-pool-probe")
+        self.send_executor = self.create_executor("rpc-pool-send")
+
+    def create_client(self, url):
+        return create_client(url, self.timeout)
+
+    def create_executor(self, name):
+        return ThreadPoolExecutor(
+            max_workers=len(self.endpoints),
+            thread_name_prefix=name
+        )
+
+    def probe_endpoint(self, endpoint):
+        start = time.perf_counter()
+        try:
+            block_height = endpoint.client.get_block_height().value
+        except Exception:
+            with self.lock:
+                endpoint.record_failure(self.max_failures)
+            return
+        with self.lock:
+            endpoint.record_probe(time.perf_counter() - start, block_height)
+
+    def probe(self):
+        """
+        Probe every endpoint, then flag the ones lagging behind.
+        """
+        list(self.probe_executor.map(self.probe_endpoint, self.endpoints))
+        self.check_lag()
+
+    def check_lag(self):
+        with self.lock:
+            heights = [
+                endpoint.block_height for endpoint in self.endpoints
+                if endpoint.healthy and endpoint.block_height is not None
+            ]
+            if not heights:
+                return
+            highest = max(heights)
+            for endpoint in self.endpoints:
+                if (
+                    endpoint.block_height is not None
+                    and highest - endpoint.block_height > self.max_lag
+                ):
+                    endpoint.healthy = False
+
+    def start(self):
+        """
+        Start the background probing thread.
+        """
+        with self.lock:
+            if self.thread is not None:
+                return
+            self.stop_event.clear()
+            self.thread = threading.Thread(
+                target=self.run,
+                name="rpc-pool-probe",
+                daemon=True
+            )
+            self.thread.start()
+
+    def stop(self):
+        """
+        Stop the background probing thread.
+        """
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def close(self):
+        self.stop()
+        self.probe_executor.shutdown(wait=False)
+        self.send_executor.shutdown(wait=False)
+        for endpoint in self.endpoints:
+            endpoint.client.close()
+
+    def run(self):
+        while not self.stop_event.is_set():
+            self.probe()
+            self.stop_event.wait(self.probe_interval)
+
+    def ranked(self):
+        """
+        Return the endpoints from the fastest to the slowest, healthy ones
+        first.
+        """
+        if self.thread is None:
+            self.start()
+        with self.lock:
+            return sorted(
+                self.endpoints,
+                key=lambda endpoint: (not endpoint.healthy, endpoint.rank())
+            )
+
+    def fastest(self):
+        return self.ranked()[0]
+
+    def record_failure(self, endpoint):
+        with self.lock:
+            endpoint.record_failure(self.max_failures)
+
+    def call(self, method, *args, **kwargs):
+        """
+        Call a `Client` method on the fastest endpoint, and on the next ones
+        while the connection fails.
+        """
+        error = None
+        for endpoint in self.ranked():
+            try:
+                return getattr(endpoint.client, method)(*args, **kwargs)
+            except transport_errors as e:
+                self.record_failure(endpoint)
+                error = e
+        raise error
+
+    def send_to(self, endpoint, txn, opts=None):
+        try:
+            return endpoint.client.send_raw_transaction(txn, opts)
+        except transport_errors:
+            self.record_failure(endpoint)
+            raise
+
+    def send_raw_transaction(self, txn, opts=None):
+        """
+        Send a signed transaction. With `broadcast` > 1, it is sent to the
+        fastest endpoints in parallel and the first response is returned.
+        """
+        if self.broadcast == 1:
+            return self.call("send_raw_transaction", txn, opts)
+        futures = [
+            self.send_executor.submit(self.send_to, endpoint, txn, opts)
+            for endpoint in self.ranked()[:self.broadcast]
+        ]
+        error = None
+        for future in as_completed(futures):
+            try:
+                return future.result()
+            except Exception as e:
+                error = e
+        raise error
+
+    def __getattr__(self, name):
+        if name.startswith("_") or not callable(
+            getattr(self.client_class, name, None)
+        ):
+            raise AttributeError(name)
+        return functools.partial(self.call, name)
+
+
+class AsyncRpcPool(RpcPool):
+    """
+    Asynchronous version of the `RpcPool`, usable in place of a Solana
+    `AsyncClient`. The probes run in a task of the event loop, started on
+    first use.
+    """
+
+    client_class = AsyncClient
+
+    def __init__(
+        self,
+        urls,
+        probe_interval=10.0,
+        broadcast=1,
+        max_failures=2,
+        max_lag=50,
+        timeout=10
+    ):
+        self.task = None
+        super().__init__(
+            urls,
+            probe_interval,
+            broadcast,
+            max_failures,
+            max_lag,
+            timeout
+        )
+
+    def create_client(self, url):
+        return create_async_client(url, self.timeout)
+
+    def create_executor(self, name):
+        return None
+
+    async def probe_endpoint(self, endpoint):
+        start = time.perf_counter()
+        try:
+            block_height = (await endpoint.client.get_block_height()).value
+        except Exception:
+            endpoint.record_failure(self.max_failures)
+            return
+        endpoint.record_probe(time.perf_counter() - start, block_height)
+
+    async def probe(self):
+        await asyncio.gather(*[
+            self.probe_endpoint(endpoint) for endpoint in self.endpoints
+        ])
+        self.check_lag()
+
+    def start(self):
+        if self.task is None:
+            self.task = asyncio.get_running_loop().create_task(self.run())
+
+    def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    async def close(self):
+        self.stop()
+        for endpoint in self.endpoints:
+            await endpoint.client.close()
+
+    async def run(self):
+        while True:
+            await self.probe()
+            await asyncio.sleep(self.probe_interval)
+
+    def ranked(self):
+        if self.task is None:
+            self.start()
+        return sorted(
+            self.endpoints,
+            key=lambda endpoint: (not endpoint.healthy, endpoint.rank())
+        )
+
+    def record_failure(self, endpoint):
+        endpoint.record_failure(self.max_failures)
+
+    async def call(self, method, *args, **kwargs):
+        error = None
+        for endpoint in self.ranked():
+            try:
+                return await getattr(endpoint.client, method)(*args, **kwargs)
+            except transport_errors as e:
+                self.record_failure(endpoint)
+                error = e
+        raise error
+
+    async def send_to(self, endpoint, txn, opts=None):
+        try:
+            return await endpoint.client.send_raw_transaction(txn, opts)
+        except transport_errors:
+            self.record_failure(endpoint)
+            raise
+
+    async def send_raw_transaction(self, txn, opts=None):
+        if self.broadcast == 1:
+            return await self.call("send_raw_transaction", txn, opts)
+        tasks = [
+            asyncio.ensure_future(self.send_to(endpoint, txn, opts))
+            for endpoint in self.ranked()[:self.broadcast]
+        ]
+        for task in tasks:
+            # The slower sends keep running once a response is returned.
+            task.add_done_callback(
+                lambda task: task.cancelled() or task.exception()
+            )
+        error = None
+        for future in asyncio.as_completed(tasks):
+            try:
+                return await future
+            except Exception as e:
+                error = e
+        raise error
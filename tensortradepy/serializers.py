@@ -0,0 +1,88 @@
+"""
+JSON serializers of the GraphQL requests and responses.
+
+The transaction responses carry the transaction as a JSON list of byte
+values, which the standard `json` module decodes slowly. `orjson` or
+`msgspec` are used instead when installed
+(`pip install tensortradepy[orjson]`):
+
+    client = TensorClient(API_KEY, PRIVATE_KEY, serializer="orjson")
+
+Every serializer encodes to compact bytes and decodes bytes.
+"""
+import json
+
+
+class JsonSerializer:
+    """
+    Standard library serializer, always available.
+    """
+
+    name = "json"
+    decode_error = ValueError
+
+    def dumps(self, value):
+        return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonSerializer(JsonSerializer):
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self.dumps = orjson.dumps
+        self.loads = orjson.loads
+
+
+class MsgspecSerializer(JsonSerializer):
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+        self.decode_error = msgspec.DecodeError
+        self.dumps = msgspec.json.Encoder().encode
+        self.loads = msgspec.json.Decoder().decode
+
+
+# Serializers by name, from the fastest.
+serializers = {
+    "orjson": OrjsonSerializer,
+    "msgspec": MsgspecSerializer,
+    "json": JsonSerializer,
+}
+
+default_json = JsonSerializer()
+
+
+def create_serializer(name=None):
+    """
+    Create a serializer.
+
+    Arguments:
+        name (str): "orjson", "msgspec" or "json". If not specified, the
+            fastest installed one is used.
+
+    Returns:
+        (JsonSerializer): The serializer.
+
+    Raises:
+        ImportError: The requested library is not installed.
+    """
+    if name is not None:
+        if name not in serializers:
+            raise ValueError(
+                "Unknown serializer %s, should be one of %s"
+                % (name, ", ".join(serializers))
+            )
+        return serializers[name]()
+    for serializer_class in serializers.values():
+        try:
+            return serializer_class()
+        except ImportError:
+            pass
+    return default_json
@@ -0,0 +1,175 @@
+"""
+Signing backends of the transactions sent by `execute_query`.
+
+By default the transactions are deserialized and signed in the calling
+thread. Under heavy concurrency (bulk operations, wallet pools) this work
+holds the GIL, so threads signing in parallel don't go faster than one.
+`ProcessPoolSigner` moves it to worker processes holding the keypairs:
+
+    signer = ProcessPoolSigner([keypair])
+    client = TensorClient(API_KEY, PRIVATE_KEY, "mainnet-beta", signer=signer)
+    run_bulk(client.list_cnft, jobs, max_workers=32)
+
+Only the wire format of the transactions (at most 1232 bytes) and the 32
+bytes of the blockhash go to the workers, and the signed bytes come back.
+Each call still costs a round trip to a worker, so the pool pays off with
+several cores and many concurrent signatures; `sign_many` batches them.
+
+The workers are spawned: scripts creating a `ProcessPoolSigner` need the
+usual `if __name__ == "__main__":` guard.
+"""
+import asyncio
+import itertools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from solders.hash import Hash
+from solders.keypair import Keypair
+
+from .solana import (
+    deserialize_transaction,
+    sign_transaction,
+    transaction_bytes
+)
+
+
+class LocalSigner:
+    """
+    Deserialize and sign the transactions in the calling thread.
+    """
+
+    def sign(self, keypair, transaction_buffer, blockhash=None):
+        """
+        Deserialize and sign a transaction.
+
+        Arguments:
+            keypair (Keypair): The signer.
+            transaction_buffer (bytes|str|list): The transaction as returned
+                by the API.
+            blockhash (Hash): The blockhash to set before signing. If not
+                specified, the blockhash of the transaction is kept.
+
+        Returns:
+            (bytes): The signed transaction.
+        """
+        return sign_transaction(
+            keypair,
+            deserialize_transaction(transaction_buffer),
+            blockhash
+        )
+
+    def sign_many(self, keypair, transaction_buffers, blockhash=None):
+        """
+        Sign several transactions with the same blockhash.
+
+        Returns:
+            (list): The signed transactions, in order.
+        """
+        return [
+            self.sign(keypair, transaction_buffer, blockhash)
+            for transaction_buffer in transaction_buffers
+        ]
+
+    async def async_sign(self, keypair, transaction_buffer, blockhash=None):
+        return self.sign(keypair, transaction_buffer, blockhash)
+
+    def close(self):
+        pass
+
+
+# Keypairs of the worker process, by address.
+worker_keypairs = {}
+
+
+def init_worker(secret_keys):
+    for secret_key in secret_keys:
+        keypair = Keypair.from_bytes(secret_key)
+        worker_keypairs[str(keypair.pubkey())] = keypair
+
+
+def sign_in_worker(address, raw_transaction, blockhash):
+    return sign_transaction(
+        worker_keypairs[address],
+        deserialize_transaction(raw_transaction),
+        Hash.from_bytes(blockhash) if blockhash is not None else None
+    )
+
+
+class ProcessPoolSigner(LocalSigner):
+    """
+    Deserialize and sign the transactions in a pool of worker processes.
+    The keypairs are sent once, when the workers start, and the signer can
+    only sign for them.
+    """
+
+    def __init__(self, keypairs, processes=None, chunksize=16, context=None):
+        """
+        Arguments:
+            keypairs (list): The keypairs of the wallets to sign for.
+            processes (int): The number of worker processes. Defaults to the
+                number of CPUs.
+            chunksize (int): The number of transactions sent to a worker at
+                once by `sign_many`.
+            context (str): The multiprocessing start method. Defaults to
+                "spawn", so the workers don't inherit the client threads and
+                locks.
+        """
+        self.addresses = {str(keypair.pubkey()) for keypair in keypairs}
+        if not self.addresses:
+            raise ValueError("At least one keypair is required")
+        self.chunksize = chunksize
+        self.executor = ProcessPoolExecutor(
+            max_workers=processes or os.cpu_count(),
+            mp_context=multiprocessing.get_context(context or "spawn"),
+            initializer=init_worker,
+            initargs=([bytes(keypair) for keypair in keypairs],)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def worker_arguments(self, keypair, blockhash):
+        address = str(keypair.pubkey())
+        if address not in self.addresses:
+            raise ValueError("The signer doesn't hold the wallet %s" % address)
+        return address, bytes(blockhash) if blockhash is not None else None
+
+    def submit(self, keypair, transaction_buffer, blockhash=None):
+        """
+        Send a transaction to sign to the workers.
+
+        Returns:
+            (Future): The signed transaction.
+        """
+        address, blockhash = self.worker_arguments(keypair, blockhash)
+        return self.executor.submit(
+            sign_in_worker,
+            address,
+            transaction_bytes(transaction_buffer),
+            blockhash
+        )
+
+    def sign(self, keypair, transaction_buffer, blockhash=None):
+        return self.submit(keypair, transaction_buffer, blockhash).result()
+
+    def sign_many(self, keypair, transaction_buffers, blockhash=None):
+        address, blockhash = self.worker_arguments(keypair, blockhash)
+        return list(self.executor.map(
+            sign_in_worker,
+            itertools.repeat(address),
+            [transaction_bytes(buffer) for buffer in transaction_buffers],
+            itertools.repeat(blockhash),
+            chunksize=self.chunksize
+        ))
+
+    async def async_sign(self, keypair, transaction_buffer, blockhash=None):
+        return await asyncio.wrap_future(
+            self.submit(keypair, transaction_buffer, blockhash)
+        )
+
+    def close(self):
+        self.executor.shutdown()
@@ -1,59 +1,721 @@
-from solana.blockhash import BlockhashCache
+import base64
+import numbers
+import operator
+import threading
+import time
+from decimal import Decimal, ROUND_HALF_EVEN
+from fractions import Fraction
+
+import requests
+from requests.adapters import HTTPAdapter
+from solana.exceptions import SolanaRpcException, handle_exceptions
 from solana.rpc.api import Client
-from solana.transaction import Transaction
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Finalized
+from solana.rpc.providers.http import HTTPProvider
 from solders.keypair import Keypair
 from solders.hash import Hash
 from solders.instruction import Instruction
 from solders.message import to_bytes_versioned, Message, MessageV0
-from solders.transaction import VersionedTransaction
+from solders.transaction import Transaction, VersionedTransaction
 
 from .exceptions import TransactionFailedException
+from .instrumentation import Instrumentation
+
+
+default_instrumentation = Instrumentation()
+
+# A blockhash can be used during 150 blocks, produced every ~400ms.
+BLOCKHASH_VALIDITY = 150
+BLOCK_TIME = 0.4
+
+
+# `PooledHTTPProvider` and `PooledClient` are the only users of solana-py
+# internals: the request building and parsing helpers of its HTTP provider
+# and the `_provider` attribute of `Client` (as of solana 0.30). With a
+# version lacking them, `create_client` falls back to the stock `Client`.
+try:
+    from solana.rpc.providers.core import _parse_raw
+except ImportError:
+    _parse_raw = None
+
+pooled_provider_supported = _parse_raw is not None and all(
+    hasattr(HTTPProvider, name)
+    for name in ("_before_request", "_before_batch_request")
+)
+
+
+class PooledHTTPProvider(HTTPProvider):
+    """
+    HTTP provider keeping its connections open between RPC calls, through a
+    `requests` session. The default provider opens a new connection (and TLS
+    session) for every call.
+    """
+
+    def __init__(self, endpoint, timeout=10, max_connections=10):
+        super().__init__(endpoint, timeout=timeout)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max_connections
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    @handle_exceptions(SolanaRpcException, requests.RequestException)
+    def make_request(self, body, parser):
+        raw = self.make_request_unparsed(body)
+        return _parse_raw(raw, parser=parser)
+
+    def make_request_unparsed(self, body):
+        return self.post(self._before_request(body=body))
+
+    def make_batch_request_unparsed(self, reqs):
+        return self.post(self._before_batch_request(reqs))
+
+    def post(self, request_kwargs):
+        response = self.session.post(
+            request_kwargs["url"],
+            data=request_kwargs["content"],
+            headers=request_kwargs["headers"],
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return response.text
+
+    def is_connected(self):
+        try:
+            response = self.session.get(self.health_uri, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException as err:
+            self.logger.error("Health check failed with error: %s", str(err))
+            return False
+        return response.status_code == requests.codes.ok
 
+    def close(self):
+        self.session.close()
+
+
+class PooledClient(Client):
+    """
+    Solana client sending its RPC calls through a `PooledHTTPProvider`.
+    """
+
+    def __init__(self, endpoint, timeout=10, max_connections=10):
+        super().__init__(endpoint, timeout=timeout)
+        self._provider = PooledHTTPProvider(endpoint, timeout, max_connections)
+
+    def close(self):
+        self._provider.close()
+
+
+class StockClient(Client):
+    """
+    The solana-py `Client`, used when `PooledClient` isn't supported.
+    """
+
+    def close(self):
+        pass
+
+
+def network_url(network):
+    """
+    Return the RPC URL of a Solana network ("devnet", "mainnet-beta"...). URLs
+    are returned unchanged.
+    """
+    if network.startswith("http"):
+        return network
+    return f"https://api.{network}.solana.com"
+
+
+def create_client(url, timeout=10):
+    if pooled_provider_supported:
+        return PooledClient(url, timeout)
+    return StockClient(url, timeout=timeout)
+
+
+def create_async_client(url, timeout=10):
+    return AsyncClient(url, timeout=timeout)
+
+
+def estimate_block_height(last_valid_block_height, fetched_at):
+    """
+    Estimate the current block height from a blockhash fetched at
+    `fetched_at` (monotonic time), without calling the RPC node.
+    """
+    elapsed = time.monotonic() - fetched_at
+    return (
+        last_valid_block_height
+        - BLOCKHASH_VALIDITY
+        + int(elapsed / BLOCK_TIME)
+    )
 
-def create_client(url):
-    return Client(url)
+
+LAMPORTS_PER_SOL = 1_000_000_000
+
+
+def round_lamports(value):
+    return int(value.to_integral_value(ROUND_HALF_EVEN))
+
+
+def exact_factor(factor):
+    """
+    Return a scaling factor as an exact Fraction, None if it is not a plain
+    number. Floats are taken from their shortest representation.
+    """
+    if isinstance(factor, (Fraction, Decimal, numbers.Integral)):
+        return Fraction(factor)
+    if isinstance(factor, numbers.Real):
+        return Fraction(str(float(factor)))
+    return None
+
+
+class Lamports:
+    """
+    An amount in lamports. Every price argument of the clients accepts it
+    instead of a price in SOL, and sends it unchanged:
+
+        client.list_nft(mint, Lamports(1_234_567_891))
+        client.list_nft(mint, Lamports.from_sol("1.234567891"))
+
+    It is not an integer, so it can't be mistaken for a price in SOL.
+    Amounts add up and compare with other `Lamports` only. Scaling by a
+    number (`*`, `/`, `//`) gives `Lamports`, rounded to the nearest
+    lamport (floored for `//`), and the operations whose unit would be
+    ambiguous (`price + 1`, `1 / price`, `price == 5`) raise a TypeError.
+    """
+
+    __slots__ = ("value",)
+
+    # NumPy scalars defer to the reflected operators.
+    __array_ufunc__ = None
+
+    def __init__(self, value):
+        """
+        Arguments:
+            value (int): The amount in lamports.
+        """
+        if isinstance(value, Lamports):
+            value = value.value
+        self.value = operator.index(value)
+
+    @classmethod
+    def from_sol(cls, price):
+        """
+        Arguments:
+            price (float|Decimal|str|int): A price in SOL.
+        """
+        return cls(to_solami(price))
+
+    @property
+    def sol(self):
+        """
+        The amount in SOL, as a float.
+        """
+        return from_solami(self.value)
+
+    def to_decimal(self):
+        """
+        Return the exact amount in SOL.
+        """
+        return Decimal(self.value).scaleb(-9)
+
+    def __int__(self):
+        return self.value
+
+    def __repr__(self):
+        return "Lamports(%d)" % self.value
+
+    def __hash__(self):
+        # Distinct from the hash of the integer, which it never equals.
+        return hash((Lamports, self.value))
+
+    def __bool__(self):
+        return self.value != 0
+
+    def __eq__(self, other):
+        if isinstance(other, Lamports):
+            return self.value == other.value
+        if isinstance(other, numbers.Number):
+            raise TypeError(
+                "Lamports can only be compared with Lamports, got %r"
+                % (other,)
+            )
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isinstance(other, Lamports):
+            return self.value < other.value
+        return NotImplemented
+
+    def __le__(self, other):
+        if isinstance(other, Lamports):
+            return self.value <= other.value
+        return NotImplemented
+
+    def __gt__(self, other):
+        if isinstance(other, Lamports):
+            return self.value > other.value
+        return NotImplemented
+
+    def __ge__(self, other):
+        if isinstance(other, Lamports):
+            return self.value >= other.value
+        return NotImplemented
+
+    def __neg__(self):
+        return Lamports(-self.value)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return Lamports(abs(self.value))
+
+    def __add__(self, other):
+        if isinstance(other, Lamports):
+            return Lamports(self.value + other.value)
+        raise TypeError(
+            "Only Lamports can be added to %r, got %r" % (self, other)
+        )
+
+    def __radd__(self, other):
+        # The start value of sum().
+        if isinstance(other, int) and other == 0:
+            return self
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        if isinstance(other, Lamports):
+            return Lamports(self.value - other.value)
+        raise TypeError(
+            "Only Lamports can be subtracted from %r, got %r" % (self, other)
+        )
+
+    def __rsub__(self, other):
+        raise TypeError(
+            "%r can only be subtracted from Lamports, got %r" % (self, other)
+        )
+
+    def __mul__(self, factor):
+        exact = exact_factor(factor)
+        if exact is None:
+            raise TypeError(
+                "Lamports can only be scaled by a number, got %r" % (factor,)
+            )
+        return Lamports(round(self.value * exact))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        """
+        Divide by a number (rounded to the nearest lamport), or by other
+        `Lamports` to get their ratio (float).
+        """
+        if isinstance(other, Lamports):
+            return self.value / other.value
+        exact = exact_factor(other)
+        if exact is None:
+            raise TypeError(
+                "Lamports can only be divided by a number, got %r" % (other,)
+            )
+        return Lamports(round(self.value / exact))
+
+    def __floordiv__(self, other):
+        if isinstance(other, Lamports):
+            return self.value // other.value
+        exact = exact_factor(other)
+        if exact is None:
+            raise TypeError(
+                "Lamports can only be divided by a number, got %r" % (other,)
+            )
+        return Lamports(self.value // exact)
+
+    def __rtruediv__(self, other):
+        raise TypeError("Can't divide %r by %r" % (other, self))
+
+    __rfloordiv__ = __rtruediv__
 
 
 def to_solami(price):
-    return int(price * 1_000_000_000)
+    """
+    Convert a price in SOL to lamports, rounded to the nearest lamport.
+
+    Floats are converted from their shortest representation, so 1.1 SOL is
+    exactly 1_100_000_000 lamports. `Lamports` are returned unchanged.
+
+    Arguments:
+        price (float|Decimal|str|int|Lamports): The price.
+
+    Returns:
+        (int): The price in lamports.
+    """
+    if isinstance(price, Lamports):
+        return price.value
+    if isinstance(price, bool):
+        raise TypeError("Prices can't be booleans, got %r" % (price,))
+    if isinstance(price, int):
+        return price * LAMPORTS_PER_SOL
+    if not isinstance(price, Decimal):
+        price = Decimal(str(price))
+    return round_lamports(price * LAMPORTS_PER_SOL)
+
+
+def lamport_amount(amount):
+    """
+    Check an amount given in lamports (the pool SOL deposits and
+    withdrawals).
+
+    Arguments:
+        amount (int|Lamports): The amount in lamports.
+
+    Returns:
+        (int): The amount in lamports.
+    """
+    if isinstance(amount, Lamports):
+        return amount.value
+    if isinstance(amount, numbers.Integral) and not isinstance(amount, bool):
+        return int(amount)
+    raise TypeError(
+        "Amounts in lamports should be integers or Lamports, got %r"
+        % (amount,)
+    )
+
+
+def basis_points(delta):
+    """
+    Check the delta of an EXPONENTIAL pool, given in basis points (100 = 1%
+    per step) rather than as a price.
+
+    Arguments:
+        delta (int|float): The delta in basis points.
+
+    Returns:
+        (int): The delta in basis points.
+    """
+    if (
+        isinstance(delta, numbers.Real)
+        and not isinstance(delta, bool)
+        and delta == int(delta)
+    ):
+        return int(delta)
+    raise TypeError(
+        "Exponential deltas should be whole basis points, got %r" % (delta,)
+    )
 
 
 def from_solami(price):
-    return float(price) / 1_000_000_000
+    return float(price) / LAMPORTS_PER_SOL
+
+
+class SharedBlockhashCache:
+    """
+    Thread-safe cache of the latest blockhash, shared by all the transactions
+    sent through a Solana client. A background thread refreshes it before it
+    expires, so signing a transaction doesn't wait for an extra RPC call.
+    """
+
+    def __init__(self, client, ttl=30, background_refresh=True):
+        """
+        Arguments:
+            client (Client): The Solana client used to fetch blockhashes.
+            ttl (float): Seconds during which a blockhash is reused.
+            background_refresh (bool): Refresh the blockhash in a background
+                thread (started on first use) instead of on the hot path.
+        """
+        self.client = client
+        self.ttl = ttl
+        self.background_refresh = background_refresh
+        self.blockhash = None
+        self.last_valid_block_height = None
+        self.fetched_at = 0.0
+        self.lock = threading.Lock()
+        self.refresh_lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def is_fresh(self):
+        return (
+            self.blockhash is not None
+            and time.monotonic() - self.fetched_at < self.ttl
+        )
+
+    def estimate_block_height(self):
+        """
+        Estimate the current block height from the cached blockhash.
+
+        Returns:
+            (int): The estimated block height, None if no blockhash was
+                fetched yet.
+        """
+        with self.lock:
+            if self.last_valid_block_height is None:
+                return None
+            return estimate_block_height(
+                self.last_valid_block_height,
+                self.fetched_at
+            )
+
+    def refresh(self):
+        """
+        Fetch the latest blockhash from the RPC node.
+        """
+        block = self.client.get_latest_blockhash().value
+        with self.lock:
+            self.blockhash = block.blockhash
+            self.last_valid_block_height = block.last_valid_block_height
+            self.fetched_at = time.monotonic()
+
+    def get(self):
+        """
+        Return the cached blockhash. It is fetched synchronously only if the
+        cache is empty or expired.
+
+        Returns:
+            (tuple): The blockhash and its last valid block height.
+        """
+        if self.background_refresh and self.thread is None:
+            self.start()
+        with self.lock:
+            if self.is_fresh():
+                return self.blockhash, self.last_valid_block_height
+        with self.refresh_lock:
+            if not self.is_fresh():
+                self.refresh()
+        with self.lock:
+            return self.blockhash, self.last_valid_block_height
+
+    def start(self):
+        """
+        Start the background refresh thread.
+        """
+        with self.refresh_lock:
+            if self.thread is not None:
+                return
+            self.stop_event.clear()
+            self.thread = threading.Thread(
+                target=self.run,
+                name="blockhash-cache",
+                daemon=True
+            )
+            self.thread.start()
+
+    def stop(self):
+        """
+        Stop the background refresh thread.
+        """
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def run(self):
+        # Refresh once the blockhash reaches half of its TTL, so readers
+        # always find a fresh one.
+        while not self.stop_event.is_set():
+            with self.refresh_lock:
+                delay = self.ttl / 2 - (time.monotonic() - self.fetched_at)
+                if delay <= 0:
+                    try:
+                        self.refresh()
+                    except Exception:
+                        pass
+                    delay = self.ttl / 2
+            self.stop_event.wait(delay)
 
 
 def get_keypair_from_base58_secret_key(private_key_base58):
     return Keypair.from_base58_string(private_key_base58)
 
 
-def run_solana_transaction(client, sender_key_pair, transaction_buffer):
-    transaction = Transaction.deserialize(bytes(transaction_buffer))
-    signature = transaction.sign(sender_key_pair)
+def run_solana_transaction(
+    client,
+    sender_key_pair,
+    transaction_buffer,
+    blockhash_cache=None,
+    instrumentation=default_instrumentation,
+    context=None,
+    signer=None
+):
+    """
+    Sign a transaction of the API with a recent blockhash and send it.
+
+    Returns:
+        (tuple): The response of the RPC node (with the signature) and the
+            last valid block height of the blockhash signed.
+    """
+    transaction = None
+    if signer is None:
+        with instrumentation.span("deserialize", context):
+            transaction = deserialize_transaction(transaction_buffer)
     response = None
     try:
-        response = client.send_transaction(transaction, sender_key_pair)
+        if blockhash_cache is not None:
+            recent_blockhash, last_valid_block_height = blockhash_cache.get()
+        else:
+            block = client.get_latest_blockhash(Finalized).value
+            recent_blockhash = block.blockhash
+            last_valid_block_height = block.last_valid_block_height
+        with instrumentation.span("sign", context):
+            if transaction is None:
+                raw_transaction = signer.sign(
+                    sender_key_pair,
+                    transaction_buffer,
+                    recent_blockhash
+                )
+            else:
+                raw_transaction = sign_transaction(
+                    sender_key_pair,
+                    transaction,
+                    recent_blockhash
+                )
+        with instrumentation.span("rpc_submit", context):
+            response = client.send_raw_transaction(raw_transaction)
+    except Exception as e:
+        raise TransactionFailedException(e)
+    return response, last_valid_block_height
+
+
+def transaction_bytes(transaction_buffer):
+    """
+    Return the wire format of a transaction given as bytes, as a base64
+    string or as the list of bytes of a JSON serialized buffer.
+    """
+    if isinstance(transaction_buffer, bytes):
+        return transaction_buffer
+    if isinstance(transaction_buffer, str):
+        return base64.b64decode(transaction_buffer)
+    return bytes(transaction_buffer)
+
+
+def deserialize_transaction(transaction_buffer):
+    """
+    Decode a legacy transaction directly into a `solders` transaction.
+    """
+    return Transaction.from_bytes(transaction_bytes(transaction_buffer))
+
+
+def sign_transaction(sender_key_pair, transaction, blockhash=None):
+    """
+    Sign a transaction in place and return its wire format.
+
+    Arguments:
+        sender_key_pair (Keypair): The signer.
+        transaction (Transaction): The `solders` transaction to sign.
+        blockhash (Hash): The blockhash to set before signing. If not
+            specified, the blockhash of the transaction is kept.
+    """
+    if blockhash is None:
+        blockhash = transaction.message.recent_blockhash
+    transaction.sign([sender_key_pair], blockhash)
+    return bytes(transaction)
+
+
+def send_raw_transaction(
+    client,
+    raw_transaction,
+    instrumentation=default_instrumentation,
+    context=None
+):
+    try:
+        with instrumentation.span("rpc_submit", context):
+            return client.send_raw_transaction(raw_transaction)
+    except Exception as e:
+        raise TransactionFailedException(e)
+
+
+async def async_send_raw_transaction(
+    client,
+    raw_transaction,
+    instrumentation=default_instrumentation,
+    context=None
+):
+    try:
+        with instrumentation.span("rpc_submit", context):
+            return await client.send_raw_transaction(raw_transaction)
     except Exception as e:
         raise TransactionFailedException(e)
-    return response
 
 
-def run_solana_versioned_transaction(client, sender_key_pair, transaction_buffer):
-    block = client.get_latest_blockhash().value
-    transaction = VersionedTransaction.from_bytes(bytes(transaction_buffer))
+def sign_versioned_transaction(sender_key_pair, transaction, blockhash):
     new_msg = MessageV0(
         transaction.message.header,
         transaction.message.account_keys,
-        block.blockhash,
+        blockhash,
         transaction.message.instructions,
         []
     )
     signature = sender_key_pair.sign_message(to_bytes_versioned(new_msg))
-    signed_tx = VersionedTransaction.populate(new_msg, [signature])
+    return VersionedTransaction.populate(new_msg, [signature])
+
+
+def run_solana_versioned_transaction(
+    client,
+    sender_key_pair,
+    transaction_buffer,
+    blockhash_cache=None,
+    instrumentation=default_instrumentation,
+    context=None
+):
+    if blockhash_cache is not None:
+        blockhash, _ = blockhash_cache.get()
+    else:
+        blockhash = client.get_latest_blockhash().value.blockhash
+    with instrumentation.span("deserialize", context):
+        transaction = VersionedTransaction.from_bytes(
+            transaction_bytes(transaction_buffer)
+        )
+    with instrumentation.span("sign", context):
+        signed_tx = sign_versioned_transaction(
+            sender_key_pair,
+            transaction,
+            blockhash
+        )
+    try:
+        with instrumentation.span("rpc_submit", context):
+            return client.send_transaction(signed_tx)
+    except Exception as e:
+        raise TransactionFailedException(e)
+
+
+async def async_run_solana_transaction(
+    client,
+    sender_key_pair,
+    transaction_buffer,
+    instrumentation=default_instrumentation,
+    context=None,
+    signer=None
+):
+    """
+    Coroutine version of `run_solana_transaction`.
+
+    Returns:
+        (tuple): The response of the RPC node and the last valid block
+            height of the blockhash signed.
+    """
+    transaction = None
+    if signer is None:
+        with instrumentation.span("deserialize", context):
+            transaction = deserialize_transaction(transaction_buffer)
     response = None
     try:
-        response = client.send_transaction(
-            signed_tx
-        )
+        block = (await client.get_latest_blockhash(Finalized)).value
+        recent_blockhash = block.blockhash
+        with instrumentation.span("sign", context):
+            if transaction is None:
+                raw_transaction = await signer.async_sign(
+                    sender_key_pair,
+                    transaction_buffer,
+                    recent_blockhash
+                )
+            else:
+                raw_transaction = sign_transaction(
+                    sender_key_pair,
+                    transaction,
+                    recent_blockhash
+                )
+        with instrumentation.span("rpc_submit", context):
+            response = await client.send_raw_transaction(raw_transaction)
     except Exception as e:
-        print("An error occurred:", e)
-    return response
+        raise TransactionFailedException(e)
+    return response, block.last_valid_block_height
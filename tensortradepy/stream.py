@@ -0,0 +1,125 @@
+import time
+
+
+# Event name -> field of the collection statsV2 object.
+watched_fields = {
+    "floor": "buyNowPrice",
+    "sellNowPrice": "sellNowPrice",
+    "numListed": "numListed",
+    "numMints": "numMints",
+}
+
+
+class CollectionEvent:
+    """
+    A change observed on a watched collection.
+
+    Attributes:
+        slug (str): The collection slug.
+        field (str): The changed field: "floor", "sellNowPrice", "numListed"
+            or "numMints".
+        previous: The previous value (None for the first snapshot).
+        current: The new value. Prices are in lamports, as returned by
+            the API.
+        timestamp (float): The time at which the change was observed.
+    """
+    __slots__ = ("slug", "field", "previous", "current", "timestamp")
+
+    def __init__(self, slug, field, previous, current, timestamp):
+        self.slug = slug
+        self.field = field
+        self.previous = previous
+        self.current = current
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return "<CollectionEvent %s %s: %r -> %r>" % (
+            self.slug,
+            self.field,
+            self.previous,
+            self.current
+        )
+
+
+def snapshot_collection(data):
+    """
+    Keep only the watched fields of a collection response.
+    """
+    if not data or not data.get("statsV2"):
+        return None
+    stats = data["statsV2"]
+    return tuple(stats.get(field) for field in watched_fields.values())
+
+
+class CollectionWatcher:
+    """
+    Keep the last snapshot of each watched collection and turn new responses
+    into change events. The polling interval adapts to the market activity:
+    it goes back to `min_interval` when something changes and slowly grows
+    up to `max_interval` while nothing moves.
+    """
+
+    def __init__(
+        self,
+        slugs,
+        min_interval=1.0,
+        max_interval=None,
+        backoff=1.5,
+        emit_initial=True
+    ):
+        """
+        Arguments:
+            slugs (list): The slugs of the collections to watch.
+            min_interval (float): The shortest delay between two polls.
+            max_interval (float): The longest delay between two polls.
+                Defaults to ten times `min_interval`.
+            backoff (float): Factor applied to the interval after a poll
+                without change.
+            emit_initial (bool): Emit an event for each field of the first
+                snapshot of a collection.
+        """
+        self.slugs = list(dict.fromkeys(slugs))
+        self.min_interval = min_interval
+        if max_interval is None:
+            max_interval = min_interval * 10
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.emit_initial = emit_initial
+        self.interval = min_interval
+        self.snapshots = {}
+
+    def update(self, infos):
+        """
+        Compare the collections information with the last snapshots.
+
+        Arguments:
+            infos (dict): The collections information keyed by slug.
+
+        Returns:
+            (list): The change events.
+        """
+        now = time.time()
+        events = []
+        for slug in self.slugs:
+            current = snapshot_collection(infos.get(slug))
+            if current is None:
+                continue
+            previous = self.snapshots.get(slug)
+            self.snapshots[slug] = current
+            if previous is None:
+                if not self.emit_initial:
+                    continue
+                previous = (None,) * len(current)
+            elif previous == current:
+                continue
+            for name, old, new in zip(watched_fields, previous, current):
+                if old != new:
+                    events.append(CollectionEvent(slug, name, old, new, now))
+        if events:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(
+                self.interval * self.backoff,
+                self.max_interval
+            )
+        return events
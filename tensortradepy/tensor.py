@@ -1,26 +1,116 @@
-import requests
+import copy
+import time
+
+from solana.rpc.commitment import Finalized
+
+from .instrumentation import (
+    Instrumentation,
+    build_context
+)
+
+from .ratelimit import (
+    PRIORITY_DEFAULT,
+    PRIORITY_STATS,
+    PRIORITY_TRADE,
+    RequestScheduler
+)
 
 from .solana import (
     create_client,
+    network_url,
     from_solami,
     to_solami,
+    lamport_amount,
+    basis_points,
     get_keypair_from_base58_secret_key,
+    deserialize_transaction,
     run_solana_transaction,
-    run_solana_versioned_transaction
+    send_raw_transaction,
+    sign_transaction,
+    SharedBlockhashCache
+)
+
+from .bulk import (
+    run_bulk,
+    to_price_items
+)
+
+from .cache import (
+    MISSING,
+    default_ttls
+)
+
+from .coalesce import SingleFlight
+
+from .confirmations import ConfirmationTracker
+
+from .prepared import PreparedTransaction
+
+from .models import (
+    CollectionStats,
+    CollectionStatsBatch,
+    PoolInfo
 )
 
+from .rpc import RpcPool
+
+from .serializers import create_serializer
+
+from .transport import (
+    TransportConfig,
+    post_body,
+    prewarm_session
+)
+
+from .orderbook import (
+    OrderBook,
+    listings_variables,
+    parse_bid,
+    parse_listings_page
+)
+
+from .stream import CollectionWatcher
+
 from .helpers import (
-    build_tensor_query,
+    active_listings_query,
+    collection_bids_query,
+    collection_infos_query,
+    collection_metadata_fields,
+    collection_volatile_stats_query,
+    compile_collections_query,
+    compile_tensor_query,
+    encode_query_body,
     default_return
 )
 
 from .exceptions import (
     NotListedException,
+    RateLimitException,
+    TransactionExpiredException,
     TransactionFailedException,
     WrongAPIKeyException,
 )
 
 
+TENSOR_API_URL = "https://api.tensor.so/graphql/"
+
+
+def merge_collection_metadata(metadata, data):
+    infos = data.get("instrumentTV2")
+    if infos is None:
+        return infos
+    return dict(metadata, **infos)
+
+
+def floor_from_infos(data):
+    if not data or not data.get("statsV2"):
+        return None
+    price = data["statsV2"].get("buyNowPrice")
+    if price is None:
+        return None
+    return from_solami(price)
+
+
 class TensorClient:
 
     def __init__(
@@ -28,6 +118,18 @@ class TensorClient:
         api_key,
         private_key=None,
         network="devnet",
+        max_batch_size=50,
+        blockhash_ttl=30,
+        track_confirmations=False,
+        cache=None,
+        cache_ttls=None,
+        scheduler=None,
+        api_url=TENSOR_API_URL,
+        instrumentation=None,
+        signer=None,
+        single_flight=None,
+        transport=None,
+        serializer=None,
     ):
         """
         The constructor sets up the client. It allows you to set your Tensor
@@ -37,25 +139,131 @@ class TensorClient:
         Args:
             api_key (str): The Tensor Trade API authentication key.
             private_key (str): Your wallet private key.
-            network (str): The Solana network to use.
+            network (str|list): The Solana network to use ("devnet",
+                "mainnet-beta"...) or an RPC URL. Give a list of them, or an
+                `RpcPool`, to spread the RPC calls over several endpoints.
+            max_batch_size (int): The maximum number of collections fetched
+                in a single request by the batched methods.
+            blockhash_ttl (float): Seconds during which a fetched blockhash
+                is reused to sign transactions. None to fetch a new blockhash
+                for every transaction.
+            track_confirmations (bool): Track the confirmation of every
+                submitted transaction in the background. The responses of
+                the transaction methods then include a `confirmation` future.
+            cache (Cache): The cache backend (`MemoryCache` or `SqliteCache`)
+                used for the collection metadata and whitelists. If not
+                specified, nothing is cached.
+            cache_ttls (dict): TTL (in seconds) by kind of cached data, it
+                overrides the defaults: {"collection_metadata": 86400,
+                "whitelist": 86400}.
+            scheduler (RequestScheduler): The rate limiter and retry policy
+                of the API requests. It can be shared between clients. If not
+                specified, requests are only retried.
+            api_url (str): The URL of the Tensor Trade GraphQL API.
+            instrumentation (Instrumentation): Receives the duration of each
+                stage of the requests and transactions (see
+                `tensortradepy.instrumentation`). Nothing is recorded by
+                default.
+            signer (LocalSigner): The backend deserializing and signing the
+                transactions of `execute_query`, like a `ProcessPoolSigner`
+                (see `tensortradepy.signer`). If not specified, they are
+                signed in the calling thread.
+            single_flight (SingleFlight): Coalesces the identical read
+                queries sent concurrently, and optionally keeps their
+                results for a short window (`SingleFlight(ttl=0.2)`). It can
+                be shared between clients. If not specified, only the
+                in-flight queries are shared. Transaction queries are never
+                coalesced.
+            transport (TransportConfig): The connection pool size,
+                timeouts, compression, HTTP/2 and pre-warming of the API
+                session (see `tensortradepy.transport`).
+            serializer (str|JsonSerializer): The JSON serializer of the
+                requests and responses: "orjson", "msgspec" or "json". If
+                not specified, the fastest installed one is used.
         """
+        self.api_url = api_url
+        self.transport = transport or TransportConfig()
+        self.serializer = serializer
+        if serializer is None or isinstance(serializer, str):
+            self.serializer = create_serializer(serializer)
+        self.instrumentation = instrumentation or Instrumentation()
+        self.signer = signer
+        self.single_flight = single_flight
+        if single_flight is None:
+            self.single_flight = self.create_single_flight()
+        self.max_batch_size = max_batch_size
+        self.blockhash_ttl = blockhash_ttl
+        self.track_confirmations = track_confirmations
+        self.cache = cache
+        self.cache_ttls = dict(default_ttls, **(cache_ttls or {}))
+        self.scheduler = scheduler
+        if scheduler is None:
+            self.scheduler = RequestScheduler()
         self.init_client(api_key)
         self.init_solana_client(private_key, network)
+        self.prewarm_on_start()
+
+    def create_single_flight(self):
+        return SingleFlight()
 
     def init_client(self, api_key: str):
         """
-        Initialize the Tensor Trade client and the `requests` session.
+        Initialize the Tensor Trade client and its HTTP session (a
+        `requests` session, or an `httpx` client for HTTP/2).
 
         Arguments:
             api_key (str): The Tensor Trade API authentication key.
         """
-        self.session = requests.session()
         self.api_key = api_key
-        self.session.headers = {
-            'Content-Type': 'application/json',
-            'User-Agent': 'tensortradepy',
-            'X-TENSOR-API-KEY': api_key
-        }
+        self.session = self.transport.create_session(api_key)
+
+    def prewarm_on_start(self):
+        if self.transport.prewarm:
+            self.prewarm()
+
+    def prewarm(self, connections=None):
+        """
+        Open connections to the API and to the Solana RPC ahead of the first
+        trade. The latest blockhash is fetched at the same time.
+
+        Arguments:
+            connections (int): The number of API connections to open.
+                Defaults to the `prewarm` setting of the transport.
+
+        Returns:
+            (int): The number of API connections opened.
+        """
+        if connections is None:
+            connections = self.transport.prewarm_connections()
+        opened = prewarm_session(
+            self.session,
+            self.api_url,
+            connections,
+            self.transport.timeout
+        )
+        try:
+            if self.blockhash_cache is not None:
+                self.blockhash_cache.get()
+            else:
+                self.get_latest_blockhash()
+        except Exception:
+            pass
+        return opened
+
+    def close(self):
+        """
+        Close the API session and the Solana client, and stop the blockhash
+        cache and confirmation tracker threads.
+        """
+        self.stop_background_tasks()
+        self.session.close()
+        self.solana_client.close()
+
+    def stop_background_tasks(self):
+        if self.blockhash_cache is not None:
+            self.blockhash_cache.stop()
+        if self.confirmation_tracker is not None:
+            self.confirmation_tracker.stop()
 
     def init_solana_client(self, private_key, network):
         """
@@ -63,38 +271,142 @@ class TensorClient:
 
         Arguments:
             private_key (str): The private key of the wallet.
-            network (str): The Solana network to use.
+            network (str|list): The Solana network, RPC URL, list of them or
+                `RpcPool` to use.
 
         Returns:
             The solana client object.
         """
-        self.keypair = None
+        self.set_keypair(None)
         if private_key is not None:
-            self.keypair = get_keypair_from_base58_secret_key(private_key)
-        url = f"https://api.{network}.solana.com"
-        if network.startswith("http"):
-            url = network
-        self.solana_client = create_client(url)
+            self.set_keypair(get_keypair_from_base58_secret_key(private_key))
+        self.solana_client = self.create_solana_client(network)
+        self.blockhash_cache = None
+        if self.blockhash_ttl is not None:
+            self.blockhash_cache = SharedBlockhashCache(
+                self.solana_client,
+                self.blockhash_ttl
+            )
+        self.confirmation_tracker = None
+        if self.track_confirmations:
+            self.confirmation_tracker = ConfirmationTracker(self.solana_client)
         return self.solana_client
 
-    def send_query(self, query, variables):
+    def set_keypair(self, keypair):
+        """
+        Set the wallet signing the transactions. Its address is computed once
+        and reused as default `wallet_address`.
+
+        Arguments:
+            keypair (Keypair): The wallet keypair.
+        """
+        self.keypair = keypair
+        self.wallet_address = None
+        if keypair is not None:
+            self.wallet_address = str(keypair.pubkey())
+
+    def with_wallet(self, private_key):
+        """
+        Return a client signing with another wallet. It shares the
+        connection pools, caches, rate limiter and Solana client of this
+        one.
+
+        Arguments:
+            private_key (str|Keypair): The private key of the wallet.
+
+        Returns:
+            (TensorClient): The client of the wallet.
+        """
+        if isinstance(private_key, str):
+            private_key = get_keypair_from_base58_secret_key(private_key)
+        client = copy.copy(self)
+        client.set_keypair(private_key)
+        return client
+
+    def create_solana_client(self, network):
+        """
+        Create the Solana client, or the pool of clients if several networks
+        are given.
+        """
+        if isinstance(network, RpcPool):
+            return network
+        if isinstance(network, (list, tuple)):
+            return RpcPool([network_url(item) for item in network])
+        return create_client(network_url(network))
+
+    def send_query(
+        self,
+        query,
+        variables,
+        priority=PRIORITY_DEFAULT,
+        context=None,
+        coalesce=False
+    ):
         """
-        Send a query to the Tensor Trade API.
+        Send a query to the Tensor Trade API. The request waits for the rate
+        limiter and is retried if the server throttles it or fails.
 
         Arguments:
             query (str): The GraphQL query.
             variables (dict): The GraphQL variables.
+            priority (int): The priority lane of the request.
+            context (dict): The context given to the instrumentation. If not
+                specified, it is built from the variables.
+            coalesce (bool): Share the response with the identical queries
+                sent concurrently (see `single_flight`). Only for read
+                queries.
         """
-        resp = self.session.post(
-            "https://api.tensor.so/graphql/",
-            json={
-                "query": query,
-                "variables": variables
-            }
-        )
+        if context is None:
+            context = build_context(variables=variables)
+        with self.instrumentation.span("query_build", context):
+            body = encode_query_body(query, variables, self.serializer)
+        if coalesce and self.single_flight is not None:
+            return self.single_flight.do(
+                self.coalescing_key(body),
+                lambda: self.post_query(body, priority, context)
+            )
+        return self.post_query(body, priority, context)
+
+    def coalescing_key(self, body):
+        """
+        Key of a read query in the `single_flight`. A `SingleFlight` can be
+        shared between clients, so the endpoint and the API key are part of
+        it.
+        """
+        return (self.api_url, self.api_key, body)
+
+    def post_query(self, body, priority, context):
+        """
+        Post an encoded query, retrying it while the server throttles it or
+        fails, and decode the response.
+        """
+        instrumentation = self.instrumentation
+        attempt = 0
+        with instrumentation.span("http_send", context):
+            while True:
+                self.scheduler.acquire(priority)
+                resp = post_body(
+                    self.session,
+                    self.api_url,
+                    body,
+                    self.transport.timeout
+                )
+                if not self.scheduler.should_retry(resp.status_code):
+                    break
+                if attempt >= self.scheduler.max_retries:
+                    raise RateLimitException(
+                        "The request failed with status %d after %d retries"
+                        % (resp.status_code, attempt)
+                    )
+                time.sleep(self.scheduler.backoff(
+                    attempt,
+                    resp.headers.get("Retry-After")
+                ))
+                attempt += 1
         try:
-            return resp.json().get("data", {})
-        except requests.exceptions.JSONDecodeError:
+            with instrumentation.span("json_decode", context):
+                return self.serializer.loads(resp.content).get("data", {})
+        except self.serializer.decode_error:
             if resp.status_code == 403:
                 raise WrongAPIKeyException("Invalid API Key")
             else:
@@ -120,7 +432,13 @@ class TensorClient:
         """
         return data[name]["txs"][0]["txV0"]["data"]
 
-    def execute_query(self, query, variables, name):
+    def execute_query(
+        self,
+        query,
+        variables,
+        name,
+        priority=PRIORITY_DEFAULT
+    ):
         """
         Execute a GraphQL query and send the transaction to the Solana network.
 
@@ -128,23 +446,229 @@ class TensorClient:
             query (str): The GraphQL query.
             variables (dict): The GraphQL variables.
             name (str): The name of the transaction.
+            priority (int): The priority lane of the API request.
+
+        Returns:
+            (dict): The GraphQL response with the transaction `signature`. If
+                confirmations are tracked, a `confirmation` future is added
+                too.
         """
-        data = self.send_query(query, variables)
-        if False and data[name]["txs"][0].get("txV0", None) is not None:
-            transaction = self.extract_versioned_transaction(data, name)
-            run_solana_versioned_transaction(
-                self.solana_client,
-                self.keypair,
-                transaction
+        context = build_context(name, variables)
+        data = self.send_query(query, variables, priority, context)
+        with self.instrumentation.span("tx_extract", context):
+            transaction = self.extract_transaction(data, name)
+        response, last_valid_block_height = run_solana_transaction(
+            self.solana_client,
+            self.keypair,
+            transaction,
+            self.blockhash_cache,
+            self.instrumentation,
+            context,
+            self.signer
+        )
+        return self.transaction_response(
+            data,
+            response,
+            last_valid_block_height
+        )
+
+    def transaction_response(self, data, response, last_valid_block_height):
+        """
+        Add the signature of a sent transaction to its GraphQL response, and
+        track its confirmation if enabled.
+
+        Arguments:
+            data (dict): The GraphQL response.
+            response: The response of the RPC node.
+            last_valid_block_height (int): The last valid block height of
+                the blockhash signed.
+        """
+        if response is not None:
+            data["signature"] = str(response.value)
+            if self.confirmation_tracker is not None:
+                data["confirmation"] = self.confirmation_tracker.track(
+                    response.value,
+                    last_valid_block_height
+                )
+        return data
+
+    def get_latest_blockhash(self):
+        """
+        Return the latest blockhash, from the blockhash cache if there is one.
+
+        Returns:
+            (tuple): The blockhash, its last valid block height and when it
+                was fetched (monotonic time).
+        """
+        if self.blockhash_cache is not None:
+            blockhash, last_valid_block_height = self.blockhash_cache.get()
+            return (
+                blockhash,
+                last_valid_block_height,
+                self.blockhash_cache.fetched_at
             )
-        else:
+        block = self.solana_client.get_latest_blockhash(Finalized).value
+        return block.blockhash, block.last_valid_block_height, time.monotonic()
+
+    def estimate_block_height(self):
+        """
+        Estimate the current block height from the blockhash cache, without
+        calling the RPC node. None if there is no cached blockhash.
+        """
+        if self.blockhash_cache is None:
+            return None
+        return self.blockhash_cache.estimate_block_height()
+
+    def prepare_transaction(
+        self,
+        data,
+        name,
+        context=None,
+        latest_blockhash=None
+    ):
+        """
+        Deserialize and sign the transaction of a GraphQL response.
+
+        Arguments:
+            data (dict): The GraphQL response.
+            name (str): The name of the transaction.
+            context (dict): The context given to the instrumentation.
+            latest_blockhash (tuple): The result of `get_latest_blockhash`,
+                used if the response doesn't give the last valid block
+                height of the transaction. Fetched if not specified.
+
+        Returns:
+            (PreparedTransaction): The transaction, ready to be submitted.
+        """
+        instrumentation = self.instrumentation
+        with instrumentation.span("tx_extract", context):
             transaction = self.extract_transaction(data, name)
-            run_solana_transaction(
-                self.solana_client,
+            last_valid_block_height = data[name]["txs"][0].get(
+                "lastValidBlockHeight"
+            )
+        with instrumentation.span("deserialize", context):
+            transaction = deserialize_transaction(transaction)
+        prepared = PreparedTransaction(
+            name,
+            data,
+            transaction,
+            None,
+            last_valid_block_height,
+            context
+        )
+        try:
+            if last_valid_block_height is None:
+                self.refresh_prepared_transaction(
+                    prepared,
+                    *(latest_blockhash or self.get_latest_blockhash())
+                )
+            else:
+                # The transaction keeps the blockhash set by the API.
+                with instrumentation.span("sign", context):
+                    prepared.raw = sign_transaction(self.keypair, transaction)
+        except Exception as e:
+            raise TransactionFailedException(e)
+        return prepared
+
+    def refresh_prepared_transaction(
+        self,
+        prepared,
+        blockhash,
+        last_valid_block_height,
+        fetched_at
+    ):
+        """
+        Sign a prepared transaction again with a new blockhash.
+        """
+        with self.instrumentation.span("sign", prepared.context):
+            raw = sign_transaction(
                 self.keypair,
-                transaction
+                prepared.transaction,
+                blockhash
             )
-        return data
+        prepared.update(raw, last_valid_block_height, fetched_at)
+
+    def prepare_query(
+        self,
+        query,
+        variables,
+        name,
+        priority=PRIORITY_DEFAULT
+    ):
+        """
+        Execute a GraphQL query and prepare its transaction without sending
+        it. Use `submit` to send it.
+
+        Arguments:
+            query (str): The GraphQL query.
+            variables (dict): The GraphQL variables.
+            name (str): The name of the transaction.
+            priority (int): The priority lane of the API request.
+
+        Returns:
+            (PreparedTransaction): The transaction, ready to be submitted.
+        """
+        context = build_context(name, variables)
+        data = self.send_query(query, variables, priority, context)
+        return self.prepare_transaction(data, name, context)
+
+    def check_prepared_transaction(self, prepared, block_height):
+        """
+        Raise a `TransactionExpiredException` if the prepared transaction
+        expired.
+        """
+        if prepared.is_expired(block_height):
+            raise TransactionExpiredException(
+                "%s expired at block height %d" % (
+                    prepared.name,
+                    prepared.last_valid_block_height
+                )
+            )
+
+    def submitted_response(self, prepared, response):
+        return self.transaction_response(
+            dict(prepared.data),
+            response,
+            prepared.last_valid_block_height
+        )
+
+    def submit(self, prepared, refresh_margin=10):
+        """
+        Send a prepared transaction to the Solana network. The transaction is
+        signed again with a new blockhash only if its blockhash is about to
+        expire.
+
+        Arguments:
+            prepared (PreparedTransaction): The transaction returned by
+                `prepare_query` or one of the `prepare_*` methods.
+            refresh_margin (int): The number of blocks before the expiration
+                of the blockhash under which it is refreshed.
+
+        Returns:
+            (dict): The GraphQL response with the transaction `signature`, as
+                returned by `execute_query`.
+
+        Raises:
+            TransactionExpiredException: The last valid block height of the
+                transaction is passed.
+        """
+        block_height = self.estimate_block_height()
+        self.check_prepared_transaction(prepared, block_height)
+        if prepared.blocks_left(block_height) < refresh_margin:
+            try:
+                self.refresh_prepared_transaction(
+                    prepared,
+                    *self.get_latest_blockhash()
+                )
+            except Exception as e:
+                raise TransactionFailedException(e)
+        response = send_raw_transaction(
+            self.solana_client,
+            prepared.raw,
+            self.instrumentation,
+            prepared.context
+        )
+        return self.submitted_response(prepared, response)
 
     def get_collection_infos(self, slug: str):
         """
@@ -157,27 +681,57 @@ class TensorClient:
         Returns:
             (dict): ex: { "buyNowPrice": 10, "sellNowPrice": 10, "numListed": 100 }
         """
-        query = """query CollectionsStats($slug: String!) {
-            instrumentTV2(slug: $slug) {
-                id
-                slug
-                firstListDate
-                name
-                statsV2 {
-                    currency
-                    buyNowPrice
-                    buyNowPriceNetFees
-                    sellNowPrice
-                    sellNowPriceNetFees
-                    numListed
-                    numMints
-                }
-            }
-        }
-        """
         variables = {"slug": slug}
-        data = self.send_query(query, variables)
-        return data.get("instrumentTV2", {})
+        metadata = self.get_cached_collection_metadata(slug)
+        if metadata is not None:
+            data = self.send_query(
+                collection_volatile_stats_query,
+                variables,
+                PRIORITY_STATS,
+                coalesce=True
+            )
+            return merge_collection_metadata(metadata, data)
+        query = collection_infos_query
+        data = self.send_query(
+            query,
+            variables,
+            PRIORITY_STATS,
+            coalesce=True
+        )
+        infos = data.get("instrumentTV2", {})
+        self.cache_collection_metadata(slug, infos)
+        return infos
+
+    def get_cached_collection_metadata(self, slug):
+        """
+        Return the cached static fields of a collection (id, slug,
+        firstListDate and name), or None.
+
+        Args:
+            slug (str): the collection slug (ID)
+        """
+        if self.cache is None:
+            return None
+        metadata = self.cache.get("collection_metadata:%s" % slug)
+        if metadata is MISSING:
+            return None
+        return metadata
+
+    def cache_collection_metadata(self, slug, infos):
+        """
+        Store the static fields of a collection response in the cache.
+
+        Args:
+            slug (str): the collection slug (ID)
+            infos (dict): the collection information.
+        """
+        if self.cache is None or not infos:
+            return
+        self.cache.set(
+            "collection_metadata:%s" % slug,
+            {field: infos.get(field) for field in collection_metadata_fields},
+            self.cache_ttls["collection_metadata"]
+        )
 
     def get_collection_floor(self, slug: str):
         """
@@ -194,13 +748,171 @@ class TensorClient:
             raise Exception("The collection %s is not listed." % slug)
         return from_solami(data["statsV2"]["buyNowPrice"])
 
+    def build_collections_batches(self, slugs, batch_size=None):
+        """
+        Split the slugs into chunks and build the aliased query of each chunk.
+
+        Args:
+            slugs (list): the collection slugs (IDs)
+            batch_size (int): the maximum number of slugs per query. If not
+                specified, the client `max_batch_size` is used.
+
+        Returns:
+            (list): tuples of (query, variables, slugs of the chunk).
+        """
+        if batch_size is None:
+            batch_size = self.max_batch_size
+        slugs = list(dict.fromkeys(slugs))
+        batches = []
+        for start in range(0, len(slugs), batch_size):
+            chunk = slugs[start:start + batch_size]
+            query = compile_collections_query(len(chunk))
+            variables = {
+                "slug%d" % index: slug
+                for (index, slug) in enumerate(chunk)
+            }
+            batches.append((query, variables, chunk))
+        return batches
+
+    def parse_collections_batch(self, data, chunk):
+        """
+        Map the aliased results of a batched query back to their slugs.
+
+        Args:
+            data (dict): the GraphQL response data.
+            chunk (list): the slugs of the batch, in query order.
+
+        Returns:
+            (dict): collection information keyed by slug.
+        """
+        return {
+            slug: data.get("c%d" % index)
+            for (index, slug) in enumerate(chunk)
+        }
+
+    def get_collections_infos(self, slugs, batch_size=None):
+        """
+        Retrieve the main information of several collections. Slugs are
+        packed into aliased queries, so only one request is sent per batch.
+
+        Args:
+            slugs (list): the collection slugs (IDs)
+            batch_size (int): the maximum number of slugs per request. If not
+                specified, the client `max_batch_size` is used.
+
+        Returns:
+            (dict): collection information keyed by slug. The value is None
+                for unknown collections.
+        """
+        infos = {}
+        for query, variables, chunk in self.build_collections_batches(
+            slugs,
+            batch_size
+        ):
+            data = self.send_query(
+                query,
+                variables,
+                PRIORITY_STATS,
+                coalesce=True
+            )
+            infos.update(self.parse_collections_batch(data, chunk))
+        return infos
+
+    def get_collection_floors(self, slugs, batch_size=None):
+        """
+        Retrieve the floor price of several collections in batched requests.
+
+        Args:
+            slugs (list): the collection slugs (IDs)
+            batch_size (int): the maximum number of slugs per request. If not
+                specified, the client `max_batch_size` is used.
+
+        Returns:
+            (dict): floor prices (buyNow) keyed by slug. The value is None
+                for unknown or unlisted collections.
+        """
+        infos = self.get_collections_infos(slugs, batch_size)
+        return {
+            slug: floor_from_infos(data)
+            for (slug, data) in infos.items()
+        }
+
+    def get_collection_stats(self, slug):
+        """
+        Retrieve the information of a collection as a `CollectionStats`
+        (prices kept in lamports).
+
+        Args:
+            slug (str): the collection slug (ID)
+
+        Returns:
+            (CollectionStats): The collection stats, None if the collection
+                is unknown.
+        """
+        return CollectionStats.from_infos(
+            self.get_collection_infos(slug)
+        )
+
+    def get_collections_stats(self, slugs, batch_size=None):
+        """
+        Retrieve the information of several collections in batched
+        requests, as NumPy columns. Requires NumPy.
+
+        Args:
+            slugs (list): the collection slugs (IDs)
+            batch_size (int): the maximum number of slugs per request. If not
+                specified, the client `max_batch_size` is used.
+
+        Returns:
+            (CollectionStatsBatch): The stats of the collections.
+        """
+        return CollectionStatsBatch.from_infos(
+            self.get_collections_infos(slugs, batch_size)
+        )
+
+    def watch_collections(
+        self,
+        slugs,
+        interval=1.0,
+        max_interval=None,
+        emit_initial=True
+    ):
+        """
+        Watch collections and yield their changes (floor, sellNowPrice,
+        numListed and numMints). All the collections are fetched in batched
+        requests at each poll. The polling interval grows while nothing
+        changes and goes back to `interval` on the next change.
+
+        Args:
+            slugs (list): the collection slugs (IDs)
+            interval (float): the shortest delay between two polls.
+            max_interval (float): the longest delay between two polls.
+                Defaults to ten times `interval`.
+            emit_initial (bool): yield the current values of each
+                collection on the first poll.
+
+        Returns:
+            (generator): CollectionEvent objects.
+        """
+        watcher = CollectionWatcher(
+            slugs,
+            interval,
+            max_interval,
+            emit_initial=emit_initial
+        )
+        while True:
+            infos = self.get_collections_infos(watcher.slugs)
+            for event in watcher.update(infos):
+                yield event
+            time.sleep(watcher.interval)
+
     def get_collection_whitelist(self, slug: str):
         """
         """
         return_format = {
             "address": None
         }
-        query = build_tensor_query(
+        query = compile_tensor_query(
             "TswapWhitelist",
             "tswapWhitelist",
             [
@@ -211,8 +923,122 @@ class TensorClient:
         variables = {
             "slug": slug
         }
-        data = self.send_query(query, variables)
-        return data
+        if self.cache is None:
+            return self.send_query(query, variables, coalesce=True)
+        return self.cache.fetch(
+            "whitelist:%s" % slug,
+            self.cache_ttls["whitelist"],
+            lambda: self.send_query(query, variables, coalesce=True)
+        )
+
+    def iter_collection_listings(
+        self,
+        slug,
+        limit=100,
+        sort_by="PriceAsc",
+        max_pages=None
+    ):
+        """
+        Retrieve the active listings of a collection page by page, following
+        the pagination cursor.
+
+        Args:
+            slug (str): the collection slug (ID)
+            limit (int): the number of listings by page.
+            sort_by (str): the listing order (PriceAsc, PriceDesc...).
+            max_pages (int): the maximum number of pages to fetch. All the
+                pages are fetched if not specified.
+
+        Returns:
+            (generator): a list of `Listing` objects (price in SOL) for each
+                page, yielded as soon as the page is received.
+        """
+        cursor = None
+        pages = 0
+        while True:
+            data = self.send_query(
+                active_listings_query,
+                listings_variables(slug, limit, sort_by, cursor),
+                PRIORITY_STATS,
+                coalesce=True
+            )
+            listings, cursor = parse_listings_page(data)
+            yield listings
+            pages += 1
+            if cursor is None or (max_pages is not None and pages >= max_pages):
+                return
+
+    def get_collection_listings(self, slug, limit=100, max_pages=None):
+        """
+        Retrieve the active listings of a collection, from the cheapest.
+
+        Args:
+            slug (str): the collection slug (ID)
+            limit (int): the number of listings by page.
+            max_pages (int): the maximum number of pages to fetch.
+
+        Returns:
+            (list): `Listing` objects (price in SOL).
+        """
+        return [
+            listing
+            for page in self.iter_collection_listings(
+                slug,
+                limit,
+                max_pages=max_pages
+            )
+            for listing in page
+        ]
+
+    def get_collection_bids(self, slug):
+        """
+        Retrieve the collection bids of a collection.
+
+        Args:
+            slug (str): the collection slug (ID)
+
+        Returns:
+            (list): `Bid` objects (price in SOL, remaining quantity).
+        """
+        data = self.send_query(
+            collection_bids_query,
+            {"slug": slug},
+            PRIORITY_STATS,
+            coalesce=True
+        )
+        bids = [parse_bid(item) for item in data.get("tcompBids") or []]
+        return [bid for bid in bids if bid.quantity > 0]
+
+    def load_order_book(self, slug, book=None, limit=100, max_pages=None):
+        """
+        Load the listings and bids of a collection into a local order book.
+        The listing pages are added to the book as they arrive, then the
+        listings which are not active anymore are removed.
+
+        Args:
+            slug (str): the collection slug (ID)
+            book (OrderBook): the book to update. A new one if not
+                specified.
+            limit (int): the number of listings by page.
+            max_pages (int): the maximum number of listing pages to fetch.
+                Only the cheapest listings are kept then.
+
+        Returns:
+            (OrderBook): the order book.
+        """
+        if book is None:
+            book = OrderBook(slug)
+        book.replace_listings(
+            listing
+            for page in self.iter_collection_listings(
+                slug,
+                limit,
+                max_pages=max_pages
+            )
+            for listing in page
+        )
+        book.replace_bids(self.get_collection_bids(slug))
+        return book
 
     def list_cnft(self, mint, price, wallet_address=None):
         """
@@ -220,14 +1046,14 @@ class TensorClient:
 
         Arguments:
             mint (str): The mint of the CNFT.
-            price (float): The price of the CNFT.
+            price (float|Lamports): The price (in SOL) of the CNFT.
             wallet_address (str): The wallet address of the owner. If not
                 specified, the private key of the Solana client will be used.
         """
         if wallet_address is None:
-            wallet_address = str(self.keypair.pubkey())
+            wallet_address = self.wallet_address
 
-        query = build_tensor_query(
+        query = compile_tensor_query(
             "TcompListTx",
             "tcompListTx",
             [
@@ -249,14 +1075,14 @@ class TensorClient:
 
         Arguments:
             mint (str): The mint of the CNFT.
-            price (float): The price of the CNFT.
+            price (float|Lamports): The price (in SOL) of the CNFT.
             wallet_address (str): The wallet address of the owner. If not
                 specified, the private key of the Solana client will be used.
         """
         if wallet_address is None:
-            wallet_address = str(self.keypair.pubkey())
+            wallet_address = self.wallet_address
 
-        query = build_tensor_query(
+        query = compile_tensor_query(
             "TcompEditTx",
             "tcompEditTx",
             [
@@ -282,9 +1108,9 @@ class TensorClient:
                 specified, the private key of the Solana client will be used.
         """
         if wallet_address is None:
-            wallet_address = str(self.keypair.pubkey())
+            wallet_address = self.wallet_address
 
-        query = build_tensor_query(
+        query = compile_tensor_query(
             "TcompDelistTx",
             "tcompDelistTx",
             [
@@ -304,14 +1130,14 @@ class TensorClient:
 
         Arguments:
             mint (str): The mint of the NFT.
-            price (float): The price of the NFT.
+            price (float|Lamports): The price (in SOL) of the NFT.
             wallet_address (str): The wallet address of the owner. If not
                 specified, the private key of the Solana client will be used.
         """
         if wallet_address is None:
-            wallet_address = str(self.keypair.pubkey())
+            wallet_address = self.wallet_address
 
-        query = build_tensor_query(
+        query = compile_tensor_query(
             "TswapListNftTx",
             "tswapListNftTx",
             [
@@ -333,14 +1159,14 @@ class TensorClient:
 
         Arguments:
             mint (str): The mint of the NFT.
-            price (float): The price of the NFT.
+            price (float|Lamports): The price (in SOL) of the NFT.
             wallet_address (str): The wallet address of the owner. If not
                 specified, the private key of the Solana client will be used.
         """
         if wallet_address is None:
-            wallet_address = str(self.keypair.pubkey())
+            wallet_address = self.wallet_address
 
-        query = build_tensor_query(
+        query = compile_tensor_query(
             "TswapEditSingleListing",
             "tswapEditSingleListingTx",
             [
@@ -366,9 +1192,9 @@ class TensorClient:
                 specified, the private key of the Solana client will be used.
         """
         if wallet_address is None:
-            wallet_address = str(self.keypair.pubkey())
+            wallet_address = self.wallet_address
 
-        query = build_tensor_query(
+        query = compile_tensor_query(
             "TswapDelistNftTx",
             "tswapDelistNftTx",
             [
@@ -380,7 +1206,102 @@ class TensorClient:
             "mint": mint,
             "owner": wallet_address,
         }
-        return self.execute_query(query, variables, "TswapDelistNftTx")
+        return self.execute_query(query, variables, "tswapDelistNftTx")
+
+    def bulk_list(
+        self,
+        listings,
+        compressed=False,
+        wallet_address=None,
+        max_workers=8
+    ):
+        """
+        List many NFTs for sale. The listings are processed concurrently and
+        a failure doesn't stop the other listings.
+
+        Arguments:
+            listings (dict): The price of each mint ({mint: price}). A list of
+                (mint, price) pairs is accepted too.
+            compressed (bool): True if the mints are cNFTs.
+            wallet_address (str): The wallet address of the owner. If not
+                specified, the private key of the Solana client will be used.
+            max_workers (int): The maximum number of listings in flight.
+
+        Returns:
+            (BulkResult): The responses and errors keyed by mint.
+
+        Raises:
+            ValueError: A mint is given twice.
+        """
+        operation = self.list_cnft if compressed else self.list_nft
+        jobs = [
+            (mint, (mint, price, wallet_address))
+            for (mint, price) in to_price_items(listings)
+        ]
+        return run_bulk(operation, jobs, max_workers)
+
+    def bulk_edit_listings(
+        self,
+        listings,
+        compressed=False,
+        wallet_address=None,
+        max_workers=8
+    ):
+        """
+        Edit the price of many listings. The edits are processed concurrently
+        and a failure doesn't stop the other edits.
+
+        Arguments:
+            listings (dict): The new price of each mint ({mint: price}). A
+                list of (mint, price) pairs is accepted too.
+            compressed (bool): True if the mints are cNFTs.
+            wallet_address (str): The wallet address of the owner. If not
+                specified, the private key of the Solana client will be used.
+            max_workers (int): The maximum number of edits in flight.
+
+        Returns:
+            (BulkResult): The responses and errors keyed by mint.
+
+        Raises:
+            ValueError: A mint is given twice.
+        """
+        if compressed:
+            operation = self.edit_cnft_listing
+        else:
+            operation = self.edit_nft_listing
+        jobs = [
+            (mint, (mint, price, wallet_address))
+            for (mint, price) in to_price_items(listings)
+        ]
+        return run_bulk(operation, jobs, max_workers)
+
+    def bulk_delist(
+        self,
+        mints,
+        compressed=False,
+        wallet_address=None,
+        max_workers=8
+    ):
+        """
+        Delist many NFTs. The delistings are processed concurrently and a
+        failure doesn't stop the other delistings.
+
+        Arguments:
+            mints (list): The mints to delist.
+            compressed (bool): True if the mints are cNFTs.
+            wallet_address (str): The wallet address of the owner. If not
+                specified, the private key of the Solana client will be used.
+            max_workers (int): The maximum number of delistings in flight.
+
+        Returns:
+            (BulkResult): The responses and errors keyed by mint.
+
+        Raises:
+            ValueError: A mint is given twice.
+        """
+        operation = self.delist_cnft if compressed else self.delist_nft
+        jobs = [(mint, (mint, wallet_address)) for mint in mints]
+        return run_bulk(operation, jobs, max_workers)
 
 
     def set_cnft_collection_bid(
@@ -395,15 +1316,15 @@ class TensorClient:
 
         Arguments:
             slug (str): The slug of the CNFT collection.
-            price (float): The price of the cNFT bid.
+            price (float|Lamports): The price (in SOL) of the cNFT bid.
             quantity (float): The quantity of CNFTs to bid for.
             wallet_address (str): The wallet address of the bidder. If not
                 specified, the private key of the Solana client will be used.
         """
         if wallet_address is None:
-            wallet_address = str(self.keypair.pubkey())
+            wallet_address = self.wallet_address
 
-        query = build_tensor_query(
+        query = compile_tensor_query(
             "TcompBidTxForCollection",
             "tcompBidTx",
             [
@@ -439,10 +1360,10 @@ class TensorClient:
 
         Arguments:
             bid_address (str): The address of the bid.
-            price (float): The price of the cNFT bid.
+            price (float|Lamports): The price (in SOL) of the cNFT bid.
             quantity (float): The quantity of CNFTs to bid for.
         """
-        query = build_tensor_query(
+        query = compile_tensor_query(
             "TcompEditBidTx",
             "tcompEditBidTx",
             [
@@ -468,7 +1389,7 @@ class TensorClient:
         Arguments:
             bid_address (str): The address of the bid.
         """
-        query = build_tensor_query(
+        query = compile_tensor_query(
             "TcompCancelCollBidTx",
             "tcompCancelCollBidTx",
             [
@@ -478,7 +1399,12 @@ class TensorClient:
         variables = {
           "bidStateAddress": bid_address,
         }
-        return self.execute_query(query, variables, "tcompCancelCollBidTx")
+        return self.execute_query(
+            query,
+            variables,
+            "tcompCancelCollBidTx",
+            PRIORITY_TRADE
+        )
 
     def set_nft_collection_bid(
         self,
@@ -492,12 +1418,15 @@ class TensorClient:
 
         Arguments:
             slug (str): The slug of the NFT collection.
-            price (float): The price of the NFT bid.
+            price (float|Lamports): The price (in SOL) of the NFT bid.
             quantity (float): The quantity of NFTs to bid for.
+            wallet_address (str): The wallet address of the bidder. If not
+                specified, the private key of the Solana client will be used.
         """
-        self.set_cnft_collection_bid(
+        return self.set_cnft_collection_bid(
             slug,
             price,
+            quantity,
             wallet_address=wallet_address
         )
 
@@ -512,10 +1441,10 @@ class TensorClient:
 
         Arguments:
             bid_address (str): The address of the bid.
-            price (float): The price of the NFT bid.
+            price (float|Lamports): The price (in SOL) of the NFT bid.
             quantity (float): The quantity of NFTs to bid for.
         """
-        self.edit(
+        return self.edit_cnft_collection_bid(
             bid_address,
             price,
             quantity
@@ -531,7 +1460,7 @@ class TensorClient:
         Arguments:
             bid_address (str): The address of the bid.
         """
-        self.cancel_cnft_collection_bid(
+        return self.cancel_cnft_collection_bid(
             bid_address
         )
 
@@ -548,36 +1477,24 @@ class TensorClient:
         Arguments:
             seller (str): The address of the seller.
             mint (str): The mint of the NFT.
-            price (float): The price of the NFT.
+            price (float|Lamports): The price (in SOL) of the NFT.
             wallet_address (str): The wallet address of the buyer. If not
                 specified, the private key of the Solana client will be used.
         """
-        if wallet_address is None:
-            wallet_address = str(self.keypair.pubkey())
-
-        query = build_tensor_query(
-            "TswapBuySingleListingTx",
-            "tswapBuySingleListingTx",
-            [
-                ("buyer", "String"),
-                ("maxPrice", "Decimal"),
-                ("mint", "String"),
-                ("owner", "String")
-            ]
-            )
-        variables = {
-          "owner": seller,
-          "maxPrice": str(to_solami(price)),
-          "mint": mint,
-          "buyer": wallet_address,
-        }
+        query, variables = self.build_buy_nft_query(
+            seller,
+            mint,
+            price,
+            wallet_address
+        )
 
         not_listed = False
         try:
             res = self.execute_query(
                 query,
                 variables,
-                "tswapBuySingleListingTx"
+                "tswapBuySingleListingTx",
+                PRIORITY_TRADE
             )
         except TransactionFailedException as e:
             if "ComputeBudget" in str(e):
@@ -604,14 +1521,50 @@ class TensorClient:
         Arguments:
             seller (str): The address of the seller.
             mint (str): The mint of the cNFT.
-            price (float): The price of the cNFT.
+            price (float|Lamports): The price (in SOL) of the cNFT.
             wallet_address (str): The address of the buyer. If not provided,
                 the wallet address of the current keypair will be used.
         """
+        query, variables = self.build_buy_cnft_query(
+            seller,
+            mint,
+            price,
+            wallet_address
+        )
+        return self.execute_query(
+            query,
+            variables,
+            "tcompBuyTx",
+            PRIORITY_TRADE
+        )
+
+    def build_buy_nft_query(self, seller, mint, price, wallet_address=None):
+        if wallet_address is None:
+            wallet_address = self.wallet_address
+
+        query = compile_tensor_query(
+            "TswapBuySingleListingTx",
+            "tswapBuySingleListingTx",
+            [
+                ("buyer", "String"),
+                ("maxPrice", "Decimal"),
+                ("mint", "String"),
+                ("owner", "String")
+            ]
+        )
+        variables = {
+          "owner": seller,
+          "maxPrice": str(to_solami(price)),
+          "mint": mint,
+          "buyer": wallet_address,
+        }
+        return query, variables
+
+    def build_buy_cnft_query(self, seller, mint, price, wallet_address=None):
         if wallet_address is None:
-            wallet_address = str(self.keypair.pubkey())
+            wallet_address = self.wallet_address
 
-        query = build_tensor_query(
+        query = compile_tensor_query(
             "TcompBuyTx",
             "tcompBuyTx",
             [
@@ -627,9 +1580,78 @@ class TensorClient:
           "mint": mint,
           "buyer": wallet_address,
         }
-        return self.execute_query(query, variables, "tcompBuyTx")
+        return query, variables
 
-    def create_pool(self,
+    def prepare_buy_nft(
+        self,
+        seller,
+        mint,
+        price,
+        wallet_address=None
+    ):
+        """
+        Fetch and sign the transaction buying a NFT, without sending it. Send
+        it later with `submit`, before it expires.
+
+        Arguments:
+            seller (str): The address of the seller.
+            mint (str): The mint of the NFT.
+            price (float|Lamports): The price (in SOL) of the NFT.
+            wallet_address (str): The wallet address of the buyer. If not
+                specified, the private key of the Solana client will be used.
+
+        Returns:
+            (PreparedTransaction): The transaction, ready to be submitted.
+        """
+        query, variables = self.build_buy_nft_query(
+            seller,
+            mint,
+            price,
+            wallet_address
+        )
+        return self.prepare_query(
+            query,
+            variables,
+            "tswapBuySingleListingTx",
+            PRIORITY_TRADE
+        )
+
+    def prepare_buy_cnft(
+        self,
+        seller,
+        mint,
+        price,
+        wallet_address=None
+    ):
+        """
+        Fetch and sign the transaction buying a cNFT, without sending it. Send
+        it later with `submit`, before it expires.
+
+        Arguments:
+            seller (str): The address of the seller.
+            mint (str): The mint of the cNFT.
+            price (float|Lamports): The price (in SOL) of the cNFT.
+            wallet_address (str): The address of the buyer. If not provided,
+                the wallet address of the current keypair will be used.
+
+        Returns:
+            (PreparedTransaction): The transaction, ready to be submitted.
+        """
+        query, variables = self.build_buy_cnft_query(
+            seller,
+            mint,
+            price,
+            wallet_address
+        )
+        return self.prepare_query(
+            query,
+            variables,
+            "tcompBuyTx",
+            PRIORITY_TRADE
+        )
+
+    def build_create_pool_query(
+        self,
         slug,
         starting_price,
         pool_type="TRADE",
@@ -640,16 +1662,27 @@ class TensorClient:
         wallet_address=None
     ):
         if wallet_address is None:
-            wallet_address = str(self.keypair.pubkey())
+            wallet_address = self.wallet_address
 
         if pool_type not in ["TRADE", "LINEAR", "NFT"]:
             raise Exception(
                 "Wrong pool type should be TRADE, LINEAR, or NFT"
             )
 
+        if curve_type not in ["LINEAR", "EXPONENTIAL"]:
+            raise Exception(
+                "Wrong curve type should be LINEAR or EXPONENTIAL"
+            )
+
+        # Linear deltas are prices, exponential deltas are basis points.
+        if curve_type == "EXPONENTIAL":
+            delta = basis_points(delta)
+        else:
+            delta = to_solami(delta)
+
         return_format = default_return.copy()
         return_format["pool"] = None
-        query = build_tensor_query(
+        query = compile_tensor_query(
             "TswapInitPoolTx",
             "tswapInitPoolTx",
             [
@@ -663,7 +1696,7 @@ class TensorClient:
         config = {
             "poolType": pool_type,
             "curveType": curve_type,
-            "delta": str(to_solami(delta)),
+            "delta": str(delta),
             "startingPrice": str(to_solami(starting_price)),
             "mmCompoundFees": compound_fees,
             "mmFeeBps": fee_bps * 100
@@ -674,12 +1707,48 @@ class TensorClient:
           "slug": slug,
           "owner": wallet_address
         }
+        return query, variables
 
+    def create_pool(self,
+        slug,
+        starting_price,
+        pool_type="TRADE",
+        curve_type="LINEAR",
+        delta=1.0,
+        compound_fees=False,
+        fee_bps=None,
+        wallet_address=None,
+        return_info=False
+    ):
+        """
+        Create a pool (AMM).
+
+        Arguments:
+            delta (float|int|Lamports): The price change per step: a price
+                for LINEAR curves, basis points for EXPONENTIAL curves
+                (100 = 1% per step).
+
+        Returns:
+            (str|PoolInfo): The pool address, or a `PoolInfo` if
+                `return_info` is set.
+        """
+        query, variables = self.build_create_pool_query(
+            slug,
+            starting_price,
+            pool_type,
+            curve_type,
+            delta,
+            compound_fees,
+            fee_bps,
+            wallet_address
+        )
         data = self.execute_query(query, variables, "tswapInitPoolTx")
+        if return_info:
+            return PoolInfo.from_response(data, variables)
         return data["tswapInitPoolTx"]["pool"]
 
     def pool_deposit_nft(self, pool, mint):
-        query = build_tensor_query(
+        query = compile_tensor_query(
             "TswapDepositWithdrawNftTx",
             "tswapDepositWithdrawNftTx",
             [
@@ -696,7 +1765,7 @@ class TensorClient:
         return self.execute_query(query, variables, "tcompBuyTx")
 
     def pool_withdraw_nft(self, pool, mint):
-        query = build_tensor_query(
+        query = compile_tensor_query(
             "TswapDepositWithdrawNftTx",
             "tswapDepositWithdrawNftTx",
             [
@@ -717,7 +1786,14 @@ class TensorClient:
         )
 
     def pool_deposit_sols(self, pool, amount):
-        query = build_tensor_query(
+        """
+        Deposit SOL into a pool.
+
+        Arguments:
+            pool (str): The address of the pool.
+            amount (int|Lamports): The amount in lamports.
+        """
+        query = compile_tensor_query(
             "TswapDepositWithdrawSolTx",
             "tswapDepositWithdrawSolTx",
             [
@@ -727,8 +1803,8 @@ class TensorClient:
             ]
         )
         variables = {
-          "action": "WITHDRAW",
-          "lamports": amount,
+          "action": "DEPOSIT",
+          "lamports": str(lamport_amount(amount)),
           "pool": pool,
         }
         return self.execute_query(
@@ -738,7 +1814,14 @@ class TensorClient:
         )
 
     def pool_withdraw_sols(self, pool, amount):
-        query = build_tensor_query(
+        """
+        Withdraw SOL from a pool.
+
+        Arguments:
+            pool (str): The address of the pool.
+            amount (int|Lamports): The amount in lamports.
+        """
+        query = compile_tensor_query(
             "TswapDepositWithdrawSolTx",
             "tswapDepositWithdrawSolTx",
             [
@@ -749,7 +1832,7 @@ class TensorClient:
         )
         variables = {
           "action": "WITHDRAW",
-          "lamports": amount,
+          "lamports": str(lamport_amount(amount)),
           "pool": pool,
         }
         return self.execute_query(
@@ -759,7 +1842,7 @@ class TensorClient:
         )
 
     def close_pool(self, pool):
-        query = build_tensor_query(
+        query = compile_tensor_query(
             "TswapClosePoolTx",
             "tswapClosePoolTx",
             [
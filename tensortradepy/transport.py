@@ -0,0 +1,162 @@
+"""
+HTTP transport of the Tensor Trade API clients: connection pool sizes,
+keep-alive, timeouts, response compression and HTTP/2.
+
+    transport = TransportConfig(pool_maxsize=64, prewarm=4)
+    client = TensorClient(API_KEY, PRIVATE_KEY, transport=transport)
+
+The sessions keep the default `Accept-Encoding` of their library, so the
+responses come back compressed (gzip, and brotli when the `brotli` package
+is installed: `pip install tensortradepy[brotli]`). HTTP/2 requires the `h2`
+package (`pip install tensortradepy[http2]`): all the requests are then
+multiplexed on a few connections.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class TransportConfig:
+    """
+    Settings of the HTTP sessions of a client.
+    """
+
+    def __init__(
+        self,
+        pool_maxsize=100,
+        pool_block=False,
+        timeout=30.0,
+        keepalive_expiry=60.0,
+        compression=True,
+        http2=False,
+        prewarm=0
+    ):
+        """
+        Arguments:
+            pool_maxsize (int): The maximum number of connections kept open
+                to the API. It should be at least the number of threads (or
+                concurrent tasks) sending requests.
+            pool_block (bool): Wait for a free connection when the pool is
+                full, instead of opening a connection that is closed after
+                the request.
+            timeout (float): The timeout (in seconds) of the API requests.
+            keepalive_expiry (float): Seconds after which an idle connection
+                is closed (HTTP/2 and asynchronous sessions only, the
+                `requests` sessions keep them until the server closes them).
+            compression (bool): Accept compressed responses.
+            http2 (bool): Send the requests over HTTP/2, through `httpx`.
+            prewarm (int): The number of connections opened when the client
+                is created (or entered, for the asynchronous client), so the
+                first requests don't pay the TCP and TLS handshakes.
+        """
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.timeout = timeout
+        self.keepalive_expiry = keepalive_expiry
+        self.compression = compression
+        self.http2 = http2
+        self.prewarm = prewarm
+
+    def headers(self, api_key):
+        headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "tensortradepy",
+            "X-TENSOR-API-KEY": api_key,
+        }
+        if not self.compression:
+            headers["Accept-Encoding"] = "identity"
+        return headers
+
+    def limits(self):
+        return httpx.Limits(
+            max_connections=self.pool_maxsize if self.pool_block else None,
+            max_keepalive_connections=self.pool_maxsize,
+            keepalive_expiry=self.keepalive_expiry
+        )
+
+    def create_session(self, api_key):
+        """
+        Create the session of a synchronous client: a `requests` session,
+        or an `httpx` client for HTTP/2.
+        """
+        if self.http2:
+            return httpx.Client(
+                headers=self.headers(api_key),
+                limits=self.limits(),
+                timeout=self.timeout,
+                http2=True
+            )
+        session = requests.Session()
+        session.headers.update(self.headers(api_key))
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def prewarm_connections(self):
+        # HTTP/2 multiplexes the requests on a single connection.
+        return min(self.prewarm, 1) if self.http2 else self.prewarm
+
+    def create_async_session(self, api_key):
+        """
+        Create the `httpx` session of an asynchronous client.
+        """
+        return httpx.AsyncClient(
+            headers=self.headers(api_key),
+            limits=self.limits(),
+            timeout=self.timeout,
+            http2=self.http2
+        )
+
+
+def post_body(session, url, body, timeout):
+    """
+    Post a request body with a `requests` or an `httpx` session.
+    """
+    if isinstance(session, requests.Session):
+        return session.post(url, data=body, timeout=timeout)
+    return session.post(url, content=body)
+
+
+def prewarm_session(session, url, connections, timeout):
+    """
+    Open connections to the API in parallel and leave them in the pool of
+    the session. Failures are ignored: the requests will connect later.
+
+    Returns:
+        (int): The number of successful requests.
+    """
+    if connections <= 0:
+        return 0
+
+    def connect(_):
+        try:
+            session.request("HEAD", url, timeout=timeout)
+        except (requests.RequestException, httpx.HTTPError, OSError):
+            return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        return sum(executor.map(connect, range(connections)))
+
+
+async def async_prewarm_session(session, url, connections, timeout):
+    if connections <= 0:
+        return 0
+
+    async def connect():
+        try:
+            await session.request("HEAD", url, timeout=timeout)
+        except (httpx.HTTPError, OSError):
+            return False
+        return True
+
+    results = await asyncio.gather(*[connect() for _ in range(connections)])
+    return sum(results)
@@ -0,0 +1,166 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class WalletPool:
+    """
+    Run operations for several wallets through a single client: the wallets
+    share its API session, Solana client, caches and rate limiter.
+
+    Each wallet has its own submission queue, processed in order by a
+    dedicated thread, so the transactions of a wallet never conflict with
+    each other while the wallets run in parallel.
+
+        pool = WalletPool(client, [private_key1, private_key2])
+        # Bids and buys can be placed by any wallet.
+        futures = pool.map("buy_nft", [(seller1, mint1, 1.5),
+                                       (seller2, mint2, 1.6)])
+        # Operations on an owned NFT go to the wallet holding it.
+        pool.submit(owner_address, "list_nft", mint3, 2.0).result()
+    """
+
+    def __init__(self, client, private_keys):
+        """
+        Arguments:
+            client (TensorClient): The client whose connections are shared.
+            private_keys (list): The private keys (or keypairs) of the
+                wallets.
+        """
+        if not private_keys:
+            raise ValueError("At least one wallet is required")
+        self.clients = {}
+        for private_key in private_keys:
+            wallet_client = client.with_wallet(private_key)
+            self.clients[wallet_client.wallet_address] = wallet_client
+        self.addresses = list(self.clients)
+        self.pending = dict.fromkeys(self.addresses, 0)
+        self.lock = threading.Lock()
+        self.init_queues()
+
+    def init_queues(self):
+        self.executors = {
+            address: ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="wallet-%s" % address[:8]
+            )
+            for address in self.addresses
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+
+    def client(self, address):
+        """
+        Return the client of a wallet.
+        """
+        return self.clients[address]
+
+    def next_wallet(self):
+        """
+        Return the address of the wallet with the shortest queue.
+        """
+        with self.lock:
+            return min(self.addresses, key=self.pending.__getitem__)
+
+    def submit(self, address, method, *args, **kwargs):
+        """
+        Queue a client method call for a wallet. The calls of a wallet are
+        run one at a time, in submission order.
+
+        Arguments:
+            address (str): The wallet address. If None, the wallet with the
+                shortest queue is used.
+            method (str): The name of the client method (`list_nft`,
+                `buy_nft`...).
+
+        Returns:
+            (Future): The result of the call.
+        """
+        if address is None:
+            address = self.next_wallet()
+        operation = getattr(self.clients[address], method)
+        with self.lock:
+            self.pending[address] += 1
+        future = self.executors[address].submit(operation, *args, **kwargs)
+        future.add_done_callback(lambda _: self.done(address))
+        return future
+
+    def done(self, address):
+        with self.lock:
+            self.pending[address] -= 1
+
+    def map(self, method, jobs):
+        """
+        Spread calls of a client method over the wallets, each call going
+        to the wallet with the shortest queue. Only for the operations any
+        wallet can run (bids, buys): use `submit` with the owner address for
+        the NFTs held by a wallet.
+
+        Arguments:
+            method (str): The name of the client method.
+            jobs (list): The positional arguments of each call.
+
+        Returns:
+            (list): The futures of the calls, in the order of the jobs.
+        """
+        return [self.submit(None, method, *job) for job in jobs]
+
+    def shutdown(self, wait=True):
+        for executor in self.executors.values():
+            executor.shutdown(wait=wait)
+
+
+class AsyncWalletPool(WalletPool):
+    """
+    Asynchronous version of the `WalletPool`, built on an
+    `AsyncTensorClient`. The calls of a wallet are serialized by a lock
+    instead of a thread.
+    """
+
+    def init_queues(self):
+        self.wallet_locks = {
+            address: asyncio.Lock() for address in self.addresses
+        }
+
+    async def submit(self, address, method, *args, **kwargs):
+        """
+        Run a client method call for a wallet, after the calls already
+        queued for it.
+
+        Arguments:
+            address (str): The wallet address. If None, the wallet with the
+                shortest queue is used.
+            method (str): The name of the client method.
+
+        Returns:
+            The result of the call.
+        """
+        if address is None:
+            address = self.next_wallet()
+        operation = getattr(self.clients[address], method)
+        self.pending[address] += 1
+        try:
+            async with self.wallet_locks[address]:
+                return await operation(*args, **kwargs)
+        finally:
+            self.pending[address] -= 1
+
+    async def map(self, method, jobs, return_exceptions=False):
+        """
+        Spread calls of a client method over the wallets and run them
+        concurrently.
+
+        Returns:
+            (list): The results of the calls, in the order of the jobs.
+        """
+        return await asyncio.gather(
+            *[self.submit(None, method, *job) for job in jobs],
+            return_exceptions=return_exceptions
+        )
+
+    def shutdown(self, wait=True):
+        pass
@@ -0,0 +1,48 @@
+import pytest
+from solders.keypair import Keypair
+
+from benchmarks.fake_servers import FakeSolanaRPC, FakeTensorServer
+from tensortradepy.async_tensor import AsyncTensorClient
+from tensortradepy.tensor import TensorClient
+
+
+@pytest.fixture
+def keypair():
+    return Keypair()
+
+
+@pytest.fixture
+def rpc():
+    with FakeSolanaRPC() as server:
+        yield server
+
+
+@pytest.fixture
+def tensor_server(keypair):
+    with FakeTensorServer(wallet=str(keypair.pubkey())) as server:
+        yield server
+
+
+@pytest.fixture
+def make_client(keypair, rpc, tensor_server):
+    clients = []
+
+    def make_client(api_key="key", **kwargs):
+        kwargs.setdefault("api_url", tensor_server.url)
+        client = TensorClient(api_key, str(keypair), rpc.url, **kwargs)
+        clients.append(client)
+        return client
+
+    yield make_client
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def make_async_client(keypair, rpc, tensor_server):
+
+    def make_async_client(api_key="key", **kwargs):
+        kwargs.setdefault("api_url", tensor_server.url)
+        return AsyncTensorClient(api_key, str(keypair), rpc.url, **kwargs)
+
+    return make_async_client
@@ -0,0 +1,45 @@
+import asyncio
+
+
+def test_concurrent_queries_share_the_pool(make_async_client, tensor_server):
+
+    async def main():
+        async with make_async_client(max_connections=4) as client:
+            return await asyncio.gather(*(
+                client.get_collection_floor("slug%d" % index)
+                for index in range(20)
+            ))
+
+    tensor_server.latency = 0.05
+    floors = asyncio.run(main())
+    assert len(floors) == 20
+    assert all(floor > 0 for floor in floors)
+    assert tensor_server.requests == 20
+    assert tensor_server.connections <= 4
+
+
+def test_collection_infos(make_async_client):
+
+    async def main():
+        async with make_async_client() as client:
+            return await client.get_collection_infos("slug")
+
+    infos = asyncio.run(main())
+    assert infos["slug"] == "slug"
+    assert int(infos["statsV2"]["buyNowPrice"]) > 0
+
+
+def test_concurrent_transactions(make_async_client, keypair, rpc):
+
+    async def main():
+        async with make_async_client() as client:
+            return await asyncio.gather(
+                client.list_nft("mint1", 1.5),
+                client.list_nft("mint2", 2.0),
+                client.buy_nft(str(keypair.pubkey()), "mint3", 1.0),
+            )
+
+    responses = asyncio.run(main())
+    assert all(len(response["signature"]) > 80 for response in responses)
+    # Each transaction is signed then sent to the RPC node.
+    assert rpc.requests >= 3
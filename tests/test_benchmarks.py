@@ -0,0 +1,46 @@
+import argparse
+
+from benchmarks.fake_servers import FakeTensorServer
+from benchmarks.run import percentile, run
+
+
+def test_percentile():
+    values = [5, 1, 4, 2, 3]
+    assert percentile(values, 0) == 1
+    assert percentile(values, 50) == 3
+    assert percentile(values, 100) == 5
+    assert percentile([], 50) is None
+
+
+def test_run_reports_every_scenario():
+    results = run(argparse.Namespace(
+        latency=0.0,
+        error_rate=0.0,
+        throttle=None,
+        iterations=3,
+        bulk_size=4
+    ))
+    assert [scenario["name"] for scenario in results["scenarios"]] == [
+        "get_collection_infos",
+        "list_nft",
+        "buy_cnft",
+        "get_collections_infos",
+        "bulk_list",
+        "bulk_delist",
+    ]
+    for scenario in results["scenarios"]:
+        assert scenario["errors"] == 0
+        assert scenario["ops_per_sec"] > 0
+        assert scenario["peak_memory"] > 0
+    assert results["servers"]["api"]["requests"] > 0
+    assert results["servers"]["rpc"]["errors"] == 0
+
+
+def test_fake_server_throttles(make_client):
+    with FakeTensorServer(throttle=2) as server:
+        client = make_client(api_url=server.url)
+        for index in range(3):
+            client.get_collection_infos("slug%d" % index)
+    # The third request within a second is answered with a 429 and retried.
+    assert server.throttled >= 1
+    assert server.requests == 3 + server.throttled
@@ -0,0 +1,121 @@
+from tensortradepy.bids import (
+    CANCEL,
+    EDIT,
+    PLACE,
+    BidLadder,
+    LiveBid,
+    diff_levels
+)
+from tensortradepy.solana import Lamports
+
+
+def live(address, price, quantity):
+    return LiveBid(address, "theheist", price, quantity)
+
+
+def summary(diff):
+    return sorted(
+        (
+            operation.kind,
+            operation.bid.address if operation.bid else None,
+            operation.price,
+            operation.quantity,
+        )
+        for operation in diff.operations
+    )
+
+
+def test_matching_bids_are_kept():
+    bids = [live("a", 1.0, 1), live("b", 1.1, 2)]
+    diff = diff_levels("theheist", bids, [(1.1, 2), (1.0, 1)])
+    assert len(diff) == 0
+
+
+def test_tolerance():
+    bids = [live("a", 1.0, 1)]
+    assert len(diff_levels("theheist", bids, [(1.004, 1)], 0.005)) == 0
+    assert summary(diff_levels("theheist", bids, [(1.004, 1)])) == [
+        (EDIT, "a", 1.004, 1)
+    ]
+
+
+def test_moved_bids_are_edited():
+    bids = [live("a", 1.0, 1), live("b", 1.1, 1)]
+    diff = diff_levels("theheist", bids, [(1.0, 1), (1.2, 1)])
+    assert summary(diff) == [(EDIT, "b", 1.2, 1)]
+
+
+def test_extra_levels_are_placed_and_extra_bids_cancelled():
+    diff = diff_levels(
+        "theheist",
+        [live("a", 1.0, 1)],
+        [(0.9, 1), (0.8, 2), (0.7, 0)]
+    )
+    assert summary(diff) == [
+        (EDIT, "a", 0.8, 2),
+        (PLACE, None, 0.9, 1),
+    ]
+    diff = diff_levels(
+        "theheist",
+        [live("a", 1.0, 1), live("b", 0.9, 1), live("c", 0.8, 1)],
+        [(0.9, 1)]
+    )
+    assert summary(diff) == [
+        (CANCEL, "a", None, None),
+        (CANCEL, "c", None, None),
+    ]
+
+
+def test_empty_levels_cancel_every_bid():
+    diff = diff_levels("theheist", [live("a", 1.0, 1), live("b", 2.0, 1)], [])
+    assert [operation.kind for operation in diff.operations] == [CANCEL] * 2
+
+
+def test_pending_bids_are_left_unresolved():
+    pending = live(None, 1.0, 1)
+    diff = diff_levels("theheist", [pending], [(1.5, 1)])
+    assert len(diff) == 0
+    assert diff.unresolved == [pending]
+    diff = diff_levels("theheist", [pending], [])
+    assert len(diff) == 0
+    assert diff.unresolved == [pending]
+
+
+def test_ladder_rebalances_the_live_bids(make_client):
+    ladder = BidLadder(make_client())
+    result = ladder.refresh(["theheist"])
+    assert not result.errors
+    assert ladder.levels("theheist") == [
+        (0.01, 1), (0.02, 1), (0.03, 1), (0.04, 1), (0.05, 1)
+    ]
+    targets = {"theheist": [(0.01, 1), (0.02, 1), (0.1, 2)]}
+    diff = ladder.diff(targets)
+    assert (len(diff.edits), len(diff.places), len(diff.cancels)) == (1, 0, 2)
+    result = ladder.rebalance(targets)
+    assert not result.errors
+    assert len(result.results) == 3
+    assert ladder.levels("theheist") == [(0.01, 1), (0.02, 1), (0.1, 2)]
+    assert len(ladder.diff(targets)) == 0
+
+
+def test_lamports_levels():
+    bids = [live("a", 1.0, 1), live("b", Lamports(1_100_000_000), 2)]
+    levels = [(Lamports(1_000_000_000), 1), (1.1, 2)]
+    assert len(diff_levels("theheist", bids, levels)) == 0
+    diff = diff_levels(
+        "theheist",
+        bids,
+        [(Lamports(1_000_004_000), 1), (1.2, 2)],
+        Lamports(5_000)
+    )
+    assert summary(diff) == [(EDIT, "b", 1.2, 2)]
+    diff = diff_levels("theheist", bids, [(Lamports(900_000_000), 3)])
+    assert [
+        (operation.kind, operation.price) for operation in diff.operations
+    ] == [(EDIT, Lamports(900_000_000)), (CANCEL, None)]
+
+
+def test_ladder_levels_mix_units():
+    ladder = BidLadder(None)
+    ladder.load("theheist", [("a", 1.1, 1), ("b", Lamports(1_000), 1)])
+    assert ladder.levels("theheist") == [(Lamports(1_000), 1), (1.1, 1)]
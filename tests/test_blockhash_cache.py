@@ -0,0 +1,57 @@
+import threading
+import time
+
+from solana.rpc.api import Client
+
+from tensortradepy.solana import SharedBlockhashCache
+
+
+def test_blockhash_is_reused_until_it_expires(rpc):
+    cache = SharedBlockhashCache(Client(rpc.url), background_refresh=False)
+    first = cache.get()
+    assert cache.get() == first
+    assert rpc.requests == 1
+    assert first[1] == rpc.block_height + 150
+    cache.fetched_at = time.monotonic() - cache.ttl
+    assert cache.get() != first
+    assert rpc.requests == 2
+
+
+def test_concurrent_readers_fetch_once(rpc):
+    cache = SharedBlockhashCache(Client(rpc.url), background_refresh=False)
+    rpc.latency = 0.05
+    blockhashes = []
+    threads = [
+        threading.Thread(target=lambda: blockhashes.append(cache.get()))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert rpc.requests == 1
+    assert len(set(blockhashes)) == 1
+
+
+def test_background_refresh(rpc):
+    cache = SharedBlockhashCache(Client(rpc.url), ttl=0.1)
+    try:
+        first = cache.get()
+        deadline = time.monotonic() + 5
+        while cache.blockhash == first[0] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # The blockhash was refreshed without a reader waiting for it.
+        assert cache.blockhash != first[0]
+        assert rpc.requests >= 2
+    finally:
+        cache.stop()
+    assert cache.thread is None
+
+
+def test_transactions_share_the_blockhash(make_client, rpc):
+    client = make_client()
+    client.blockhash_cache.background_refresh = False
+    for mint in ("mint1", "mint2", "mint3"):
+        client.list_nft(mint, 1.5)
+    # One blockhash fetch, then one sendTransaction per listing.
+    assert rpc.requests == 4
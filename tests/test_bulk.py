@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from tensortradepy.bulk import async_run_bulk, run_bulk
+
+
+def test_failures_are_collected():
+
+    def operation(mint, price):
+        if price < 0:
+            raise ValueError("negative price")
+        return price
+
+    jobs = [
+        ("a", ("a", 1.0)),
+        ("b", ("b", -1.0)),
+        ("c", ("c", 2.0)),
+    ]
+    result = run_bulk(operation, jobs, max_workers=2)
+    assert not result.ok
+    assert result.results == {"a": 1.0, "c": 2.0}
+    assert list(result.errors) == ["b"]
+    assert isinstance(result.errors["b"], ValueError)
+
+
+def test_max_workers_bounds_the_operations_in_flight():
+    lock = threading.Lock()
+    in_flight = [0]
+    peak = [0]
+
+    def operation(mint):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+
+    run_bulk(operation, [(index, (index,)) for index in range(20)], 3)
+    assert peak[0] <= 3
+
+
+def test_async_run_bulk():
+    in_flight = [0]
+    peak = [0]
+
+    async def operation(mint):
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        if mint == 3:
+            raise ValueError(mint)
+        return mint
+
+    jobs = [(index, (index,)) for index in range(10)]
+    result = asyncio.run(async_run_bulk(operation, jobs, 4))
+    assert peak[0] == 4
+    assert sorted(result.results) == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+    assert list(result.errors) == [3]
+
+
+def test_bulk_list_accepts_a_dict_or_pairs(make_client, tensor_server):
+    client = make_client()
+    result = client.bulk_list({"mint1": 1.5, "mint2": 2.0})
+    assert result.ok
+    assert sorted(result.results) == ["mint1", "mint2"]
+    result = client.bulk_edit_listings([("mint1", 1.2), ("mint3", 3.0)])
+    assert sorted(result.results) == ["mint1", "mint3"]
+    result = client.bulk_delist(["mint1", "mint2", "mint3"])
+    assert all(
+        len(response["signature"]) > 80
+        for response in result.results.values()
+    )
+    assert tensor_server.requests == 7
+
+
+def test_duplicated_keys_are_rejected(make_client, tensor_server):
+    calls = []
+    jobs = [("a", (1,)), ("b", (2,)), ("a", (3,))]
+    with pytest.raises(ValueError, match="duplicates: a$"):
+        run_bulk(calls.append, jobs, 2)
+    with pytest.raises(ValueError):
+        asyncio.run(async_run_bulk(calls.append, jobs, 2))
+    assert calls == []
+    client = make_client()
+    with pytest.raises(ValueError):
+        client.bulk_list([("mint1", 1.5), ("mint1", 2.0)])
+    with pytest.raises(ValueError):
+        client.bulk_delist(["mint1", "mint2", "mint1"])
+    # Nothing was sent.
+    assert tensor_server.requests == 0
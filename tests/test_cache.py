@@ -0,0 +1,94 @@
+import pytest
+
+from tensortradepy.cache import MISSING, MemoryCache, SqliteCache
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_cache(request, tmp_path):
+    caches = []
+
+    def make_cache(max_size=1024):
+        if request.param == "memory":
+            cache = MemoryCache(max_size)
+        else:
+            cache = SqliteCache(str(tmp_path / "cache.db"), max_size)
+        caches.append(cache)
+        return cache
+
+    yield make_cache
+    for cache in caches:
+        if isinstance(cache, SqliteCache):
+            cache.close()
+
+
+def test_entries_expire(make_cache):
+    cache = make_cache()
+    cache.set("live", {"a": 1}, 60)
+    cache.set("expired", {"a": 2}, -1)
+    assert cache.get("live") == {"a": 1}
+    assert cache.get("expired") is MISSING
+    assert cache.get("absent") is MISSING
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 2,
+        "evictions": 0,
+        "size": 1,
+    }
+
+
+def test_least_recently_used_entries_are_evicted(make_cache):
+    cache = make_cache(max_size=2)
+    cache.set("a", 1, 60)
+    cache.set("b", 2, 60)
+    cache.get("a")
+    cache.set("c", 3, 60)
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_fetch_reads_through(make_cache):
+    cache = make_cache()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return ["address"]
+
+    assert cache.fetch("key", 60, loader) == ["address"]
+    assert cache.fetch("key", 60, loader) == ["address"]
+    assert len(calls) == 1
+
+
+def test_sqlite_cache_survives_restarts(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = SqliteCache(path)
+    cache.set("key", {"slug": "slug"}, 60)
+    cache.close()
+    cache = SqliteCache(path)
+    try:
+        assert cache.get("key") == {"slug": "slug"}
+    finally:
+        cache.close()
+
+
+def test_collection_metadata_is_cached(make_client, tensor_server):
+    cache = MemoryCache()
+    client = make_client(cache=cache)
+    first = client.get_collection_infos("slug")
+    second = client.get_collection_infos("slug")
+    assert tensor_server.requests == 2
+    assert cache.stats()["hits"] == 1
+    # The static fields come from the cache, the stats from the API.
+    for field in ("id", "slug", "firstListDate", "name"):
+        assert second[field] == first[field]
+    assert "buyNowPrice" in second["statsV2"]
+
+
+def test_whitelist_is_cached(make_client, tensor_server):
+    client = make_client(cache=MemoryCache())
+    whitelist = client.get_collection_whitelist("slug")
+    assert client.get_collection_whitelist("slug") == whitelist
+    assert tensor_server.requests == 1
+    client.get_collection_whitelist("other")
+    assert tensor_server.requests == 2
@@ -0,0 +1,70 @@
+import threading
+import time
+
+from benchmarks.fake_servers import FakeTensorServer
+from tensortradepy.coalesce import SingleFlight
+
+
+def test_concurrent_callers_share_one_load():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"value": 1}
+
+    results = []
+    leader = threading.Thread(
+        target=lambda: results.append(flight.do("key", loader))
+    )
+    leader.start()
+    started.wait(5)
+    followers = [
+        threading.Thread(
+            target=lambda: results.append(flight.do("key", loader))
+        )
+        for _ in range(3)
+    ]
+    for thread in followers:
+        thread.start()
+    while flight.coalesced < 3:
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join()
+    assert len(calls) == 1
+    assert results == [{"value": 1}] * 4
+
+
+def test_ttl_results_are_not_shared_across_credentials(
+    make_client,
+    tensor_server
+):
+    shared = SingleFlight(ttl=60)
+    client = make_client(single_flight=shared)
+    same_key = make_client(single_flight=shared)
+    other_key = make_client("other-key", single_flight=shared)
+
+    client.get_collection_infos("theheist")
+    same_key.get_collection_infos("theheist")
+    assert tensor_server.requests == 1
+    other_key.get_collection_infos("theheist")
+    assert tensor_server.requests == 2
+
+
+def test_ttl_results_are_not_shared_across_endpoints(
+    make_client,
+    tensor_server
+):
+    shared = SingleFlight(ttl=60)
+    with FakeTensorServer() as other_server:
+        client = make_client(single_flight=shared)
+        other = make_client(single_flight=shared, api_url=other_server.url)
+        client.get_collection_infos("theheist")
+        other.get_collection_infos("theheist")
+        assert tensor_server.requests == 1
+        assert other_server.requests == 1
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+
+def test_build_collections_batches_splits_and_deduplicates(make_client):
+    client = make_client(max_batch_size=3)
+    slugs = ["s%d" % index for index in range(7)] + ["s0", "s3"]
+    batches = client.build_collections_batches(slugs)
+    assert [chunk for (_, _, chunk) in batches] == [
+        ["s0", "s1", "s2"],
+        ["s3", "s4", "s5"],
+        ["s6"],
+    ]
+    query, variables, _ = batches[2]
+    assert variables == {"slug0": "s6"}
+    assert "c0: instrumentTV2(slug: $slug0)" in query.query
+    assert "c1:" not in query.query
+
+
+@pytest.mark.parametrize("count, batch_size, requests", [
+    (1, 3, 1),
+    (3, 3, 1),
+    (7, 3, 3),
+    (120, 50, 3),
+])
+def test_one_request_per_batch(
+    make_client,
+    tensor_server,
+    count,
+    batch_size,
+    requests
+):
+    client = make_client(max_batch_size=batch_size)
+    slugs = ["slug%d" % index for index in range(count)]
+    infos = client.get_collections_infos(slugs)
+    assert tensor_server.requests == requests
+    assert list(infos) == slugs
+    # Every alias is mapped back to the slug it was queried with.
+    assert all(infos[slug]["slug"] == slug for slug in slugs)
+
+
+def test_batch_size_argument(make_client, tensor_server):
+    client = make_client()
+    client.get_collections_infos(["a", "b", "c", "d"], batch_size=2)
+    assert tensor_server.requests == 2
+
+
+def test_unknown_collections_are_none(make_client, tensor_server):
+    tensor_server.unknown_slugs.update({"missing1", "missing2"})
+    client = make_client(max_batch_size=2)
+    slugs = ["a", "missing1", "b", "c", "missing2"]
+    infos = client.get_collections_infos(slugs)
+    assert [slug for slug in slugs if infos[slug] is None] == [
+        "missing1",
+        "missing2",
+    ]
+    assert infos["b"]["slug"] == "b"
+    floors = client.get_collection_floors(slugs)
+    assert floors["missing1"] is None
+    assert floors["c"] > 0
+
+
+def test_empty_slugs(make_client, tensor_server):
+    assert make_client().get_collections_infos([]) == {}
+    assert tensor_server.requests == 0
+
+
+def test_async_batches(make_async_client, tensor_server):
+    tensor_server.unknown_slugs.add("missing")
+
+    async def main():
+        async with make_async_client(max_batch_size=2) as client:
+            return await client.get_collections_infos(["a", "missing", "b"])
+
+    infos = asyncio.run(main())
+    assert tensor_server.requests == 2
+    assert infos["missing"] is None
+    assert infos["a"]["slug"] == "a" and infos["b"]["slug"] == "b"
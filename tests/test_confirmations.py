@@ -0,0 +1,63 @@
+import asyncio
+
+from tensortradepy.confirmations import CONFIRMED
+
+
+def record_tracked(client):
+    tracked = []
+    track = client.confirmation_tracker.track
+
+    def record(signature, last_valid_block_height=None, callback=None):
+        tracked.append(last_valid_block_height)
+        return track(signature, last_valid_block_height, callback)
+
+    client.confirmation_tracker.track = record
+    return tracked
+
+
+def test_execute_query_returns_signature(make_client):
+    client = make_client()
+    response = client.list_nft("mint", 1.5)
+    assert "confirmation" not in response
+    assert len(response["signature"]) > 80
+
+
+def test_tracks_the_signed_blockhash_height(make_client, rpc):
+    client = make_client(blockhash_ttl=None, track_confirmations=True)
+    tracked = record_tracked(client)
+    response = client.list_nft("mint", 1.5)
+    # The API height (1_000_000) is not the one of the signed blockhash.
+    assert tracked == [rpc.block_height + 150]
+    assert response["confirmation"].result(timeout=10) == CONFIRMED
+
+
+def test_tracks_the_cached_blockhash_height(make_client, rpc):
+    client = make_client(track_confirmations=True)
+    tracked = record_tracked(client)
+    client.list_nft("mint", 1.5)
+    assert tracked == [client.blockhash_cache.last_valid_block_height]
+
+
+def test_async_execute_query_tracks_confirmations(make_async_client, rpc):
+
+    async def main():
+        async with make_async_client(track_confirmations=True) as client:
+            tracked = record_tracked(client)
+            response = await client.list_nft("mint", 1.5)
+            assert len(response["signature"]) > 80
+            assert tracked == [rpc.block_height + 150]
+            outcome = await asyncio.wait_for(response["confirmation"], 10)
+            assert outcome == CONFIRMED
+
+    asyncio.run(main())
+
+
+def test_async_execute_query_without_tracking(make_async_client):
+
+    async def main():
+        async with make_async_client() as client:
+            response = await client.list_nft("mint", 1.5)
+            assert "confirmation" not in response
+            assert len(response["signature"]) > 80
+
+    asyncio.run(main())
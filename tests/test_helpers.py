@@ -0,0 +1,58 @@
+import json
+
+from tensortradepy.helpers import (
+    build_tensor_query,
+    compile_collections_query,
+    compile_tensor_query,
+    encode_query_body,
+)
+
+
+parameters = [("mint", "String"), ("owner", "String"), ("price", "Decimal")]
+
+
+def compile_list_query(return_format=None):
+    if return_format is None:
+        return compile_tensor_query(
+            "TswapListNftTx",
+            "tswapListNftTx",
+            parameters
+        )
+    return compile_tensor_query(
+        "TswapListNftTx",
+        "tswapListNftTx",
+        parameters,
+        return_format
+    )
+
+
+def test_compiled_body_matches_the_plain_body():
+    query = compile_list_query()
+    variables = {"mint": "m", "owner": "o", "price": "1500000000"}
+    body = json.loads(encode_query_body(query, variables))
+    assert body == {
+        "query": build_tensor_query(
+            "TswapListNftTx",
+            "tswapListNftTx",
+            parameters
+        ),
+        "variables": variables,
+    }
+    assert body == json.loads(encode_query_body(query.query, variables))
+
+
+def test_queries_are_compiled_once():
+    query = compile_list_query()
+    assert compile_tensor_query(
+        "TswapListNftTx",
+        "tswapListNftTx",
+        list(parameters)
+    ) is query
+    assert compile_collections_query(3) is compile_collections_query(3)
+
+
+def test_return_format_is_part_of_the_key():
+    query = compile_list_query()
+    other = compile_list_query({"txs": {"tx": None}, "pool": None})
+    assert other is not query
+    assert "pool" in other.query and "pool" not in query.query
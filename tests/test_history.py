@@ -0,0 +1,79 @@
+import os
+
+import numpy as np
+import pytest
+
+from tensortradepy.exceptions import HistoryCorruptedException
+from tensortradepy.history import (
+    HistoryReader,
+    HistoryRecorder,
+    column_file,
+    partition_day
+)
+
+
+START = 1_709_251_200  # 2024-03-01 00:00 UTC
+
+
+def stats(price):
+    return {"statsV2": {
+        "buyNowPrice": str(price),
+        "sellNowPrice": None,
+        "numListed": 10,
+        "numMints": 100,
+    }}
+
+
+@pytest.fixture
+def store(tmp_path):
+    root = str(tmp_path / "history")
+    recorder = HistoryRecorder(root, sync=False)
+    for index in range(3):
+        recorder.record("theheist", stats(index + 1), START + index)
+    return root, recorder
+
+
+def partition(root, timestamp=START):
+    return os.path.join(root, "theheist", partition_day(timestamp))
+
+
+def test_load_range(store):
+    root, recorder = store
+    recorder.record("theheist", stats(4), START + 86_400)
+    history = HistoryReader(root).load("theheist", START, START + 86_400)
+    assert history["buyNowPrice"].tolist() == [1, 2, 3, 4]
+    assert history["sellNowPrice"].tolist() == [-1] * 4
+    timestamps, floors = HistoryReader(root, mmap=True).floors(
+        "theheist",
+        START + 1,
+        START + 2
+    )
+    assert timestamps.tolist() == [START + 1, START + 2]
+    assert floors.tolist() == [2e-9, 3e-9]
+
+
+def test_interrupted_append_is_ignored_then_overwritten(store):
+    root, recorder = store
+    # A crash after writing only the first columns of a row.
+    path = partition(root)
+    for name in ("timestamp", "buyNowPrice"):
+        with open(os.path.join(path, column_file(name)), "ab") as f:
+            f.write(np.zeros(1, dtype=np.int64).tobytes())
+    reader = HistoryReader(root)
+    history = reader.load("theheist", START, START + 10)
+    assert history["buyNowPrice"].tolist() == [1, 2, 3]
+    recorder.record("theheist", stats(4), START + 3)
+    history = reader.load("theheist", START, START + 10)
+    assert history["buyNowPrice"].tolist() == [1, 2, 3, 4]
+    assert history["timestamp"].tolist() == [START + i for i in range(4)]
+
+
+def test_lost_rows_are_reported(store):
+    root, recorder = store
+    filename = os.path.join(partition(root), column_file("numListed"))
+    with open(filename, "r+b") as f:
+        f.truncate(8)
+    with pytest.raises(HistoryCorruptedException):
+        HistoryReader(root).load("theheist", START, START + 10)
+    with pytest.raises(HistoryCorruptedException):
+        recorder.record("theheist", stats(4), START + 3)
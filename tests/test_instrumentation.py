@@ -0,0 +1,63 @@
+import logging
+
+import pytest
+
+from tensortradepy.instrumentation import (
+    STAGES,
+    Histogram,
+    HistogramCollector,
+    LoggingInstrumentation,
+    build_context,
+)
+
+
+def test_build_context():
+    assert build_context("tswapListNftTx", {"mint": "m", "price": 1}) == {
+        "operation": "tswapListNftTx",
+        "mint": "m",
+    }
+    assert build_context(variables={"slug": "s"}) == {"slug": "s"}
+
+
+def test_histogram_percentiles():
+    histogram = Histogram()
+    for _ in range(99):
+        histogram.add(0.001)
+    histogram.add(0.5, error=ValueError())
+    summary = histogram.summary()
+    assert summary["count"] == 100 and summary["errors"] == 1
+    assert 0.001 <= summary["p50"] < 0.002
+    assert summary["p99"] < 0.002
+    assert summary["max"] == 0.5
+    assert Histogram().percentile(50) is None
+
+
+def test_span_records_errors():
+    collector = HistogramCollector()
+    with pytest.raises(ValueError):
+        with collector.span("sign", {"operation": "buy"}):
+            raise ValueError()
+    assert collector.summary()["sign"]["errors"] == 1
+
+
+def test_transaction_stages_are_recorded(make_client):
+    collector = HistogramCollector(group_by="operation")
+    client = make_client(instrumentation=collector)
+    client.list_nft("mint", 1.5)
+    stages = {stage for (stage, _) in collector.summary()}
+    assert stages == set(STAGES)
+    assert {operation for (_, operation) in collector.summary()} == {
+        "tswapListNftTx",
+    }
+
+
+def test_logging_instrumentation(make_client, caplog):
+    client = make_client(instrumentation=LoggingInstrumentation())
+    with caplog.at_level(logging.DEBUG, logger="tensortradepy"):
+        client.get_collection_infos("slug")
+    assert [record.getMessage().split()[0] for record in caplog.records] == [
+        "query_build",
+        "http_send",
+        "json_decode",
+    ]
+    assert "slug=slug" in caplog.records[0].getMessage()
@@ -0,0 +1,147 @@
+from decimal import Decimal
+from fractions import Fraction
+
+import numpy as np
+import pytest
+from solders.keypair import Keypair
+
+from tensortradepy.pricing import as_lamports, from_lamports, to_lamports
+from tensortradepy.solana import Lamports, lamport_amount, to_solami
+from tensortradepy.tensor import TensorClient
+
+
+@pytest.fixture
+def client():
+    client = TensorClient("key", str(Keypair()), "devnet")
+    yield client
+    client.close()
+
+
+def test_to_solami_rounds_to_the_nearest_lamport():
+    assert to_solami(0.29) == 290_000_000
+    assert to_solami(1.1) == 1_100_000_000
+    assert to_solami(2) == 2_000_000_000
+    assert to_solami(Decimal("1.234567891")) == 1_234_567_891
+    assert to_solami("0.000000001") == 1
+    assert to_solami(np.float64(0.29)) == 290_000_000
+
+
+def test_to_solami_keeps_lamports():
+    assert to_solami(Lamports(5)) == 5
+    assert to_solami(Lamports.from_sol("1.5")) == 1_500_000_000
+
+
+def test_lamports_is_not_an_int():
+    assert not isinstance(Lamports(1), int)
+    with pytest.raises(TypeError):
+        Lamports(1.5)
+
+
+@pytest.mark.parametrize("factor", [
+    0.99,
+    Decimal("0.99"),
+    Fraction(99, 100),
+    np.float64(0.99),
+])
+def test_scaling_keeps_lamports(factor):
+    price = Lamports(10**9)
+    assert price * factor == Lamports(990_000_000)
+    assert factor * price == Lamports(990_000_000)
+
+
+def test_division_keeps_lamports():
+    price = Lamports(10**9 + 1)
+    assert price / 2 == Lamports(500_000_000)
+    assert price // 2 == Lamports(500_000_000)
+    assert Lamports(3) / 2 == Lamports(2)
+    assert price / Lamports(10**9 + 1) == 1.0
+    assert Lamports(7) // Lamports(2) == 3
+
+
+def test_addition_keeps_lamports():
+    price = Lamports(10**9)
+    assert price - Lamports(1_000) == Lamports(999_999_000)
+    assert price + Lamports(1) == Lamports(10**9 + 1)
+    assert -price == Lamports(-10**9)
+    assert sum([price, price]) == Lamports(2 * 10**9)
+
+
+@pytest.mark.parametrize("operation", [
+    lambda price: price + 1,
+    lambda price: 1 + price,
+    lambda price: price - 0.5,
+    lambda price: 1 - price,
+    lambda price: 2 / price,
+    lambda price: 2 // price,
+    lambda price: price * "2",
+    lambda price: price < 1,
+])
+def test_ambiguous_operations_raise(operation):
+    with pytest.raises(TypeError):
+        operation(Lamports(10**9))
+
+
+def test_lamports_equality():
+    assert Lamports(5) == Lamports(5)
+    assert Lamports(5) != Lamports(6)
+    assert Lamports(5) not in [None, "5"]
+    assert len({Lamports(5), Lamports(5)}) == 1
+    assert len({Lamports(5), 5}) == 2
+
+
+@pytest.mark.parametrize("other", [5, 5.0, Decimal(5), np.int64(5)])
+def test_comparing_with_a_number_raises(other):
+    with pytest.raises(TypeError):
+        Lamports(5) == other
+    with pytest.raises(TypeError):
+        other == Lamports(5)
+    with pytest.raises(TypeError):
+        Lamports(5) != other
+
+
+@pytest.mark.parametrize("price", [True, False])
+def test_to_solami_rejects_booleans(price):
+    with pytest.raises(TypeError):
+        to_solami(price)
+
+
+def test_scaled_prices_are_sent_in_lamports(client):
+    price = Lamports.from_sol(1.5) * 0.99
+    _, variables = client.build_buy_nft_query("seller", "mint", price)
+    assert variables["maxPrice"] == "1485000000"
+    _, variables = client.build_buy_nft_query("seller", "mint", 0.29)
+    assert variables["maxPrice"] == "290000000"
+
+
+def test_pool_sol_amounts_are_lamports(client):
+    calls = []
+    client.execute_query = lambda *args: calls.append(args)
+    client.pool_deposit_sols("pool", Lamports(1_500))
+    client.pool_withdraw_sols("pool", 2_000)
+    assert calls[0][1]["action"] == "DEPOSIT"
+    assert calls[0][1]["lamports"] == "1500"
+    assert calls[1][1]["action"] == "WITHDRAW"
+    assert calls[1][1]["lamports"] == "2000"
+    with pytest.raises(TypeError):
+        client.pool_deposit_sols("pool", 1.5)
+
+
+def test_lamport_amount():
+    assert lamport_amount(np.int64(3)) == 3
+    with pytest.raises(TypeError):
+        lamport_amount(True)
+
+
+def test_vectorized_conversions_match_to_solami():
+    rng = np.random.default_rng(0)
+    prices = np.round(rng.uniform(0, 4e6, 10_000), 9)
+    expected = [to_solami(price) for price in prices.tolist()]
+    assert to_lamports(prices).tolist() == expected
+    assert to_lamports([0.29, 1.1]).tolist() == [290_000_000, 1_100_000_000]
+    assert np.allclose(from_lamports(to_lamports(prices)), prices)
+
+
+def test_as_lamports():
+    amounts = as_lamports(to_lamports([1.5, 0.29]) - 1_000)
+    assert amounts == [Lamports(1_499_999_000), Lamports(289_999_000)]
+    assert from_lamports(amounts).tolist() == [1.499999, 0.289999]
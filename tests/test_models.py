@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+from tensortradepy.models import CollectionStats, CollectionStatsBatch
+
+
+def infos(slug, floor, listed=10):
+    return {
+        "id": "id-%s" % slug,
+        "slug": slug,
+        "name": slug.title(),
+        "firstListDate": 1_690_000_000_000,
+        "statsV2": {
+            "currency": None,
+            "buyNowPrice": None if floor is None else str(floor),
+            "buyNowPriceNetFees": None,
+            "sellNowPrice": "500000000",
+            "sellNowPriceNetFees": None,
+            "numListed": listed,
+            "numMints": 100,
+        },
+    }
+
+
+def test_collection_stats_keep_lamports():
+    stats = CollectionStats.from_infos(infos("slug", 1_500_000_000))
+    assert stats.buy_now_price == 1_500_000_000
+    assert stats.floor == 1.5
+    assert stats.sell_now_price_sol == 0.5
+    assert stats.buy_now_price_net_fees_sol is None
+    assert stats.num_listed == 10
+    assert CollectionStats.from_infos(None) is None
+
+
+def test_batch_columns():
+    batch = CollectionStatsBatch.from_infos({
+        "a": infos("a", 1_000_000_000),
+        "b": infos("b", None, 0),
+        "c": None,
+        "d": infos("d", 3_000_000_000),
+    })
+    assert len(batch) == 4 and "c" in batch and "e" not in batch
+    assert batch.buy_now_price.dtype == np.int64
+    np.testing.assert_array_equal(
+        batch.floors,
+        [1.0, np.nan, np.nan, 3.0]
+    )
+    assert batch.slugs_where(batch.floors < 2) == ["a"]
+    assert batch.get("d") == (3_000_000_000, 500_000_000, 10, 100)
+    assert batch.get("c") == (-1, -1, -1, -1)
+    assert batch.get("e") is None
+
+
+def test_client_models(make_client, tensor_server):
+    tensor_server.unknown_slugs.add("missing")
+    client = make_client(max_batch_size=2)
+    stats = client.get_collection_stats("slug")
+    assert stats.slug == "slug" and stats.floor > 0
+    assert client.get_collection_stats("missing") is None
+    batch = client.get_collections_stats(["a", "missing", "b"])
+    assert batch.slugs == ["a", "missing", "b"]
+    assert batch.slugs_where(np.isnan(batch.floors)) == ["missing"]
+
+
+def test_create_pool_info(make_client, keypair):
+    client = make_client()
+    pool = client.create_pool(
+        "slug",
+        1.5,
+        delta=0.1,
+        fee_bps=1,
+        return_info=True
+    )
+    assert pool.slug == "slug"
+    assert pool.owner == str(keypair.pubkey())
+    assert pool.starting_price == 1_500_000_000
+    assert pool.starting_price_sol == 1.5
+    assert pool.delta == 100_000_000
+    assert pool.fee_bps == 100
+    assert len(pool.address) > 30 and len(pool.signature) > 80
+
+
+def test_create_exponential_pool(make_client):
+    client = make_client()
+    pool = client.create_pool(
+        "slug",
+        1.5,
+        curve_type="EXPONENTIAL",
+        delta=100,
+        fee_bps=1,
+        return_info=True
+    )
+    # Exponential deltas are sent in basis points, not converted to lamports.
+    assert pool.curve_type == "EXPONENTIAL"
+    assert pool.delta == 100
+    assert pool.starting_price == 1_500_000_000
+    with pytest.raises(TypeError):
+        client.create_pool("slug", 1.5, curve_type="EXPONENTIAL", delta=0.5)
+    with pytest.raises(Exception, match="curve type"):
+        client.create_pool("slug", 1.5, curve_type="CONSTANT")
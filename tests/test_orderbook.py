@@ -0,0 +1,75 @@
+import random
+
+from tensortradepy.orderbook import Bid, Listing, OrderBook, PriceIndex
+from tensortradepy.solana import from_solami
+
+
+def test_price_index_matches_a_sorted_list():
+    rng = random.Random(0)
+    index = PriceIndex()
+    reference = {}
+    for _ in range(5_000):
+        mint = "mint%d" % rng.randint(1, 200)
+        if mint in reference and rng.random() < 0.5:
+            assert index.remove(mint).mint == mint
+            del reference[mint]
+        else:
+            price = rng.randint(1, 50) / 10
+            index.add(mint, Listing(mint, "seller", price))
+            reference[mint] = price
+        assert len(index) == len(reference)
+    expected = sorted((price, mint) for (mint, price) in reference.items())
+    assert [
+        (entry.price, entry.mint) for entry in index.ascending()
+    ] == expected
+    assert [
+        (entry.price, entry.mint) for entry in index.descending(10)
+    ] == expected[::-1][:10]
+    assert [
+        entry.price for entry in index.ascending(max_price=2.0)
+    ] == [price for (price, _) in expected if price <= 2.0]
+    assert index.remove("unknown") is None
+
+
+def test_incremental_updates():
+    book = OrderBook("theheist")
+    for index, price in enumerate([3.0, 1.0, 2.0, 1.0]):
+        book.add_listing(Listing("mint%d" % index, "seller", price))
+    assert [item.mint for item in book.cheapest(3)] == [
+        "mint1", "mint3", "mint2"
+    ]
+    book.add_listing(Listing("mint1", "seller", 5.0))
+    book.remove_listing("mint3")
+    assert book.floor().mint == "mint2"
+    assert [item.mint for item in book.cheapest(10, max_price=3.0)] == [
+        "mint2", "mint0"
+    ]
+    book.retain_listings({"mint1"})
+    assert [item.mint for item in book.cheapest(10)] == ["mint1"]
+    book.remove_listing("mint1")
+    assert book.floor() is None
+
+
+def test_bids_from_the_highest():
+    book = OrderBook("theheist")
+    book.replace_bids([
+        Bid("a", "owner", 1.0, 1),
+        Bid("b", "owner", 3.0, 2),
+        Bid("c", "owner", 2.0, 1),
+    ])
+    assert book.best_bid().address == "b"
+    assert [bid.address for bid in book.best_bids(5, min_price=2.0)] == [
+        "b", "c"
+    ]
+    book.add_bid(Bid("b", "owner", 3.0, 0))
+    assert book.best_bid().address == "c"
+
+
+def test_load_order_book_from_the_api(make_client, tensor_server):
+    book = make_client().load_order_book("theheist")
+    listings = tensor_server.collection_listings("theheist")
+    assert len(book.listings) == len(listings)
+    assert book.floor().price == from_solami(
+        listings[0]["tx"]["grossAmount"]
+    )
+    assert book.best_bid().price == 0.05
@@ -0,0 +1,43 @@
+import time
+
+import pytest
+
+from tensortradepy.exceptions import TransactionExpiredException
+from tensortradepy.solana import BLOCK_TIME
+
+
+@pytest.fixture
+def seller(keypair):
+    return str(keypair.pubkey())
+
+
+def test_submit_only_sends_the_transaction(make_client, rpc, seller):
+    client = make_client(blockhash_ttl=None)
+    prepared = client.prepare_buy_nft(seller, "mint", 1.0)
+    # The transaction keeps the blockhash of the API response.
+    assert prepared.last_valid_block_height == 1_000_000
+    assert rpc.requests == 0
+    response = client.submit(prepared)
+    assert rpc.requests == 1
+    assert len(response["signature"]) > 80
+
+
+def test_expired_transactions_are_not_sent(make_client, rpc, seller):
+    client = make_client(blockhash_ttl=None)
+    prepared = client.prepare_buy_nft(seller, "mint", 1.0)
+    prepared.prepared_at = time.monotonic() - 200 * BLOCK_TIME
+    assert prepared.is_expired()
+    with pytest.raises(TransactionExpiredException):
+        client.submit(prepared)
+    assert rpc.requests == 0
+
+
+def test_blockhash_is_refreshed_near_expiry(make_client, rpc, seller):
+    client = make_client(blockhash_ttl=None)
+    prepared = client.prepare_buy_nft(seller, "mint", 1.0)
+    raw = prepared.raw
+    client.submit(prepared, refresh_margin=200)
+    assert prepared.raw != raw
+    assert prepared.last_valid_block_height == rpc.block_height + 150
+    # getLatestBlockhash then sendTransaction.
+    assert rpc.requests == 2
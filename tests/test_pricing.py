@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from tensortradepy.pricing import (
+    buy_quotes,
+    fill_cost,
+    fill_proceeds,
+    sell_quotes,
+    sweep,
+)
+
+
+def test_linear_curve():
+    np.testing.assert_allclose(
+        buy_quotes(1.0, 0.1, 4),
+        [1.0, 1.1, 1.2, 1.3]
+    )
+    # Prices never go below zero.
+    np.testing.assert_allclose(
+        sell_quotes(0.25, 0.1, 4),
+        [0.25, 0.15, 0.05, 0.0]
+    )
+
+
+def test_exponential_curve():
+    np.testing.assert_allclose(
+        buy_quotes(1.0, 1000, 3, "EXPONENTIAL"),
+        [1.0, 1.1, 1.21]
+    )
+    np.testing.assert_allclose(
+        sell_quotes(1.21, 1000, 3, "EXPONENTIAL"),
+        [1.21, 1.1, 1.0]
+    )
+
+
+def test_wrong_curve_type():
+    with pytest.raises(ValueError):
+        buy_quotes(1.0, 0.1, 3, "QUADRATIC")
+
+
+def test_sell_quotes_deduct_the_pool_fee():
+    # `create_pool` sends fee_bps * 100 basis points: 1 -> 1%.
+    np.testing.assert_allclose(
+        sell_quotes(1.0, 0.0, 2, fee_bps=1),
+        [0.99, 0.99]
+    )
+
+
+def test_cumulative_fills():
+    np.testing.assert_allclose(fill_cost(1.0, 0.5, 3), [1.0, 2.5, 4.5])
+    np.testing.assert_allclose(
+        fill_proceeds(2.0, 0.5, 3, fee_bps=1),
+        np.array([2.0, 3.5, 4.5]) * 0.99
+    )
+
+
+def test_parameters_are_broadcast():
+    prices = buy_quotes(
+        np.linspace(1, 2, 5)[:, None],
+        np.linspace(0.01, 0.1, 3),
+        steps=4
+    )
+    assert prices.shape == (5, 3, 4)
+    np.testing.assert_allclose(
+        prices[4, 2],
+        buy_quotes(2.0, 0.1, 4)
+    )
+
+
+def test_sweep_matches_the_single_evaluations():
+    result = sweep([1.0, 2.0], [0.1, 0.2, 0.3], [0, 1], 5)
+    for name in ("buy", "sell", "cost", "proceeds"):
+        assert result[name].shape == (2, 3, 2, 5)
+    np.testing.assert_allclose(
+        result["sell"][1, 2, 1],
+        sell_quotes(2.0, 0.3, 5, fee_bps=1)
+    )
+    np.testing.assert_allclose(
+        result["cost"][0, 1, 0],
+        fill_cost(1.0, 0.2, 5)
+    )
@@ -0,0 +1,58 @@
+import threading
+import time
+
+import pytest
+
+from benchmarks.fake_servers import FakeTensorServer
+from tensortradepy.exceptions import RateLimitException
+from tensortradepy.ratelimit import (
+    PRIORITY_STATS,
+    PRIORITY_TRADE,
+    RequestScheduler,
+    parse_retry_after
+)
+
+
+def test_throttled_requests_are_retried(make_client):
+    with FakeTensorServer(throttle=5) as server:
+        scheduler = RequestScheduler(backoff_base=0.05)
+        client = make_client(api_url=server.url, scheduler=scheduler)
+        for index in range(10):
+            assert client.get_collection_infos("slug%d" % index)
+    assert server.throttled > 0
+    assert scheduler.metrics()["retries"] == server.throttled
+
+
+def test_failing_requests_give_up(make_client):
+    with FakeTensorServer(error_rate=1.0) as server:
+        scheduler = RequestScheduler(max_retries=2, backoff_base=0.01)
+        client = make_client(api_url=server.url, scheduler=scheduler)
+        with pytest.raises(RateLimitException):
+            client.get_collection_infos("theheist")
+    assert server.requests == 3
+
+
+def test_trades_are_served_before_stats():
+    scheduler = RequestScheduler(rate=5, burst=1)
+    scheduler.acquire()
+    served = []
+
+    def acquire(priority):
+        scheduler.acquire(priority)
+        served.append(priority)
+
+    stats = threading.Thread(target=acquire, args=(PRIORITY_STATS,))
+    stats.start()
+    time.sleep(0.05)
+    trade = threading.Thread(target=acquire, args=(PRIORITY_TRADE,))
+    trade.start()
+    stats.join()
+    trade.join()
+    assert served == [PRIORITY_TRADE, PRIORITY_STATS]
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
@@ -0,0 +1,66 @@
+import threading
+import time
+
+import pytest
+from solders.hash import Hash
+from solders.message import Message
+from solders.system_program import TransferParams, transfer
+from solders.transaction import Transaction
+
+from benchmarks.fake_servers import FakeSolanaRPC
+from tensortradepy import solana
+from tensortradepy.rpc import RpcPool
+
+
+@pytest.fixture
+def second_rpc():
+    with FakeSolanaRPC() as server:
+        yield server
+
+
+def signed_transaction(keypair):
+    payer = keypair.pubkey()
+    message = Message.new_with_blockhash(
+        [transfer(TransferParams(
+            from_pubkey=payer,
+            to_pubkey=payer,
+            lamports=1
+        ))],
+        payer,
+        Hash.default()
+    )
+    return bytes(Transaction([keypair], message, Hash.default()))
+
+
+def test_calls_fail_over_to_the_next_endpoint(rpc):
+    pool = RpcPool(["http://127.0.0.1:1/", rpc.url], timeout=2)
+    try:
+        assert pool.get_block_height().value == rpc.block_height
+    finally:
+        pool.close()
+
+
+def test_hung_probe_does_not_delay_broadcast(keypair, rpc, second_rpc):
+    pool = RpcPool([rpc.url, second_rpc.url], broadcast=2)
+    release = threading.Event()
+    pool.probe_endpoint = lambda endpoint: release.wait(10)
+    probing = threading.Thread(target=pool.probe)
+    probing.start()
+    try:
+        start = time.perf_counter()
+        response = pool.send_raw_transaction(signed_transaction(keypair))
+        assert time.perf_counter() - start < 5
+        assert response.value is not None
+    finally:
+        release.set()
+        probing.join()
+        pool.close()
+
+
+def test_stock_client_without_pooled_provider(monkeypatch, rpc):
+    assert isinstance(solana.create_client(rpc.url), solana.PooledClient)
+    monkeypatch.setattr(solana, "pooled_provider_supported", False)
+    client = solana.create_client(rpc.url)
+    assert not isinstance(client, solana.PooledClient)
+    assert client.get_block_height().value == rpc.block_height
+    client.close()
@@ -0,0 +1,41 @@
+import pytest
+
+from tensortradepy.serializers import (
+    JsonSerializer,
+    create_serializer,
+    serializers,
+)
+
+
+@pytest.fixture(params=list(serializers))
+def serializer(request):
+    try:
+        return create_serializer(request.param)
+    except ImportError:
+        pytest.skip("%s is not installed" % request.param)
+
+
+def test_round_trip(serializer):
+    value = {"slug": "slug", "data": list(range(256)), "price": None}
+    data = serializer.dumps(value)
+    assert isinstance(data, bytes)
+    assert serializer.loads(data) == value
+    assert JsonSerializer().loads(data) == value
+
+
+def test_decode_error(serializer):
+    with pytest.raises(serializer.decode_error):
+        serializer.loads(b"<html>Forbidden</html>")
+
+
+def test_unknown_serializer():
+    with pytest.raises(ValueError):
+        create_serializer("yaml")
+
+
+def test_client_accepts_a_serializer_name(make_client, serializer):
+    client = make_client(serializer=serializer.name)
+    assert client.serializer.name == serializer.name
+    assert client.get_collection_infos("slug")["slug"] == "slug"
+    assert len(client.list_nft("mint", 1.5)["signature"]) > 80
+
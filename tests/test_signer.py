@@ -0,0 +1,116 @@
+import asyncio
+import base64
+
+import pytest
+from solders.hash import Hash
+from solders.keypair import Keypair
+from solders.message import Message
+from solders.system_program import TransferParams, transfer
+from solders.transaction import Transaction
+
+from tensortradepy.signer import LocalSigner, ProcessPoolSigner
+from tensortradepy.solana import (
+    deserialize_transaction,
+    sign_transaction,
+    transaction_bytes,
+)
+
+
+def unsigned_transaction(payer):
+    instruction = transfer(TransferParams(
+        from_pubkey=payer,
+        to_pubkey=payer,
+        lamports=1
+    ))
+    message = Message.new_with_blockhash([instruction], payer, Hash.default())
+    return bytes(Transaction.new_unsigned(message))
+
+
+@pytest.fixture
+def unsigned(keypair):
+    return unsigned_transaction(keypair.pubkey())
+
+
+@pytest.fixture(scope="module")
+def pool_keypair():
+    return Keypair()
+
+
+@pytest.fixture(scope="module")
+def process_signer(pool_keypair):
+    # Spawning a worker is slow: the pool is shared by the module.
+    with ProcessPoolSigner([pool_keypair], processes=1) as signer:
+        yield signer
+
+
+def test_transaction_buffer_formats(unsigned):
+    assert transaction_bytes(unsigned) == unsigned
+    assert transaction_bytes(base64.b64encode(unsigned).decode()) == unsigned
+    # The JSON serialized Buffer of the API.
+    assert transaction_bytes(list(unsigned)) == unsigned
+
+
+def test_sign_keeps_the_blockhash(keypair, unsigned):
+    transaction = deserialize_transaction(list(unsigned))
+    signed = Transaction.from_bytes(sign_transaction(keypair, transaction))
+    signed.verify()
+    assert signed.message.recent_blockhash == Hash.default()
+    assert signed.signatures[0] == keypair.sign_message(
+        bytes(signed.message)
+    )
+
+
+def test_sign_with_a_new_blockhash(keypair, unsigned):
+    blockhash = Hash.new_unique()
+    transaction = deserialize_transaction(unsigned)
+    signed = Transaction.from_bytes(
+        sign_transaction(keypair, transaction, blockhash)
+    )
+    signed.verify()
+    assert signed.message.recent_blockhash == blockhash
+
+
+def test_local_signer(keypair, unsigned):
+    signer = LocalSigner()
+    blockhash = Hash.new_unique()
+    signed = signer.sign_many(keypair, [unsigned, list(unsigned)], blockhash)
+    assert signed[0] == signed[1]
+    assert signed[0] == signer.sign(keypair, unsigned, blockhash)
+
+
+def test_process_pool_signer_matches_the_local_signer(
+    pool_keypair,
+    process_signer
+):
+    unsigned = unsigned_transaction(pool_keypair.pubkey())
+    blockhash = Hash.new_unique()
+    local = LocalSigner()
+    assert process_signer.sign(pool_keypair, unsigned) == local.sign(
+        pool_keypair,
+        unsigned
+    )
+    assert process_signer.sign_many(
+        pool_keypair,
+        [unsigned, base64.b64encode(unsigned).decode()],
+        blockhash
+    ) == [local.sign(pool_keypair, unsigned, blockhash)] * 2
+    signed = asyncio.run(process_signer.async_sign(pool_keypair, unsigned))
+    assert signed == local.sign(pool_keypair, unsigned)
+
+
+def test_process_pool_signer_only_holds_its_keypairs(
+    keypair,
+    unsigned,
+    process_signer
+):
+    with pytest.raises(ValueError):
+        process_signer.sign(keypair, unsigned)
+    with pytest.raises(ValueError):
+        ProcessPoolSigner([])
+
+
+def test_client_signs_in_the_workers(keypair, make_client):
+    with ProcessPoolSigner([keypair], processes=1) as signer:
+        client = make_client(signer=signer)
+        response = client.list_nft("mint", 1.5)
+    assert len(response["signature"]) > 80
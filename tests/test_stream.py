@@ -0,0 +1,72 @@
+import itertools
+
+from tensortradepy.stream import CollectionWatcher
+
+
+def collection(floor, listed=10):
+    return {
+        "slug": "slug",
+        "statsV2": {
+            "buyNowPrice": str(floor),
+            "sellNowPrice": str(floor - 1),
+            "numListed": listed,
+            "numMints": 100,
+        },
+    }
+
+
+def changes(events):
+    return [
+        (event.slug, event.field, event.previous, event.current)
+        for event in events
+    ]
+
+
+def test_first_snapshot_emits_every_field():
+    watcher = CollectionWatcher(["a"])
+    assert changes(watcher.update({"a": collection(50)})) == [
+        ("a", "floor", None, "50"),
+        ("a", "sellNowPrice", None, "49"),
+        ("a", "numListed", None, 10),
+        ("a", "numMints", None, 100),
+    ]
+    assert CollectionWatcher(["a"], emit_initial=False).update({
+        "a": collection(50),
+    }) == []
+
+
+def test_only_changed_fields_are_emitted():
+    watcher = CollectionWatcher(["a", "b"], emit_initial=False)
+    watcher.update({"a": collection(50), "b": collection(70)})
+    events = watcher.update({"a": collection(50, 11), "b": collection(70)})
+    assert changes(events) == [("a", "numListed", 10, 11)]
+
+
+def test_unknown_collections_are_skipped():
+    watcher = CollectionWatcher(["a", "missing"])
+    events = watcher.update({"a": collection(50), "missing": None})
+    assert {event.slug for event in events} == {"a"}
+
+
+def test_interval_backs_off_while_nothing_changes():
+    watcher = CollectionWatcher(["a"], min_interval=1.0, max_interval=3.0)
+    watcher.update({"a": collection(50)})
+    assert watcher.interval == 1.0
+    intervals = []
+    for _ in range(4):
+        watcher.update({"a": collection(50)})
+        intervals.append(watcher.interval)
+    assert intervals == [1.5, 2.25, 3.0, 3.0]
+    watcher.update({"a": collection(40)})
+    assert watcher.interval == 1.0
+
+
+def test_watch_collections_polls_in_batches(make_client, tensor_server):
+    client = make_client(max_batch_size=2)
+    stream = client.watch_collections(["a", "b", "c"], interval=0.01)
+    events = list(itertools.islice(stream, 12))
+    # The fake server answers random stats: the first poll gives four
+    # events per collection.
+    assert {event.slug for event in events} == {"a", "b", "c"}
+    assert all(event.previous is None for event in events)
+    assert tensor_server.requests == 2
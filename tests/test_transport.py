@@ -0,0 +1,46 @@
+import asyncio
+import threading
+
+from benchmarks.fake_servers import FakeTensorServer
+from tensortradepy.transport import TransportConfig
+
+
+def background_threads():
+    return {
+        thread.name for thread in threading.enumerate()
+        if thread.name in ("blockhash-cache", "confirmation-tracker")
+    }
+
+
+def test_close_stops_background_threads(make_client):
+    client = make_client(track_confirmations=True)
+    response = client.list_nft("mint", 1.5)
+    response["confirmation"].result(timeout=10)
+    assert background_threads() == {"blockhash-cache", "confirmation-tracker"}
+    client.close()
+    assert background_threads() == set()
+
+
+def test_async_close_stops_the_confirmation_task(make_async_client):
+
+    async def main():
+        async with make_async_client(track_confirmations=True) as client:
+            await client.list_nft("mint", 1.5)
+            task = client.confirmation_tracker.task
+            assert not task.done()
+        await asyncio.sleep(0)
+        assert task.cancelled()
+
+    asyncio.run(main())
+
+
+def test_prewarm_opens_connections(make_client):
+    # The latency keeps the pre-warming requests in flight together.
+    with FakeTensorServer(latency=0.2) as server:
+        client = make_client(
+            api_url=server.url,
+            transport=TransportConfig(prewarm=3)
+        )
+        assert server.connections == 3
+        client.get_collection_infos("theheist")
+        assert server.connections == 3
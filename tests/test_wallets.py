@@ -0,0 +1,27 @@
+from solders.keypair import Keypair
+
+from tensortradepy.wallets import WalletPool
+
+
+def test_map_spreads_buys_over_the_wallets(make_client):
+    keypairs = [Keypair(), Keypair()]
+    with WalletPool(make_client(), keypairs) as pool:
+        futures = pool.map(
+            "buy_nft",
+            [("seller", "mint%d" % index, 1.5) for index in range(4)]
+        )
+        responses = [future.result(timeout=10) for future in futures]
+    assert all(response["signature"] for response in responses)
+    assert pool.pending == dict.fromkeys(pool.addresses, 0)
+
+
+def test_submit_routes_to_the_owner(make_client):
+    keypairs = [Keypair(), Keypair()]
+    with WalletPool(make_client(), keypairs) as pool:
+        owner = pool.addresses[1]
+        calls = []
+        pool.client(owner).execute_query = (
+            lambda query, variables, *args: calls.append(variables)
+        )
+        pool.submit(owner, "list_nft", "mint", 2.0).result(timeout=10)
+    assert calls[0]["owner"] == owner